@@ -33,6 +33,9 @@ See PyPoE/LICENSE
 import os
 import hashlib
 
+# 3rd-party
+from tqdm import tqdm
+
 # self
 from PyPoE.poe.path import PoEPath
 from PyPoE.poe.file.ggpk import GGPKFile
@@ -107,12 +110,28 @@ def get_content_ggpk(path=None):
         path = get_content_ggpk_path()
 
     ggpk = GGPKFile()
-    ggpk.read(path)
-    ggpk.directory_build()
+    with tqdm(desc='Reading records', unit='B', unit_scale=True,
+              unit_divisor=1024, leave=False) as bar:
+        ggpk.read(path, progress=_tqdm_progress(bar))
+    with tqdm(desc='Building directory', unit=' nodes', leave=False) as bar:
+        ggpk.directory_build(progress=_tqdm_progress(bar))
 
     return ggpk
 
 
+def _tqdm_progress(bar):
+    """
+    Returns a progress callback for :class:`GGPKFile` that updates the given
+    tqdm bar.
+    """
+    def progress(done, total):
+        if bar.total != total:
+            bar.total = total
+        bar.update(done - bar.n)
+
+    return progress
+
+
 def check_hash():
     """
     Checks the stored hash against the current hash and returns the result
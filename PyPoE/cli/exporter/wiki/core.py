@@ -33,11 +33,11 @@ See PyPoE/LICENSE
 import os
 
 # self
-from PyPoE.poe.file.ggpk import GGPKFile
 from PyPoE.cli.core import console, Msg
 from PyPoE.cli.handler import BaseHandler
 from PyPoE.cli.exporter import config
-from PyPoE.cli.exporter.util import get_content_ggpk_hash, get_content_ggpk_path
+from PyPoE.cli.exporter.util import get_content_ggpk, get_content_ggpk_hash, \
+    get_content_ggpk_path
 from PyPoE.cli.exporter.wiki.parsers import WIKI_HANDLERS
 
 # =============================================================================
@@ -86,11 +86,7 @@ class WikiHandler(BaseHandler):
         content_ggpk = get_content_ggpk_path()
 
         console('Reading "%s"...' % content_ggpk)
-        ggpk = GGPKFile()
-        ggpk.read(content_ggpk)
-
-        console('Building directory...')
-        ggpk.directory_build()
+        ggpk = get_content_ggpk(content_ggpk)
 
         console('Extracting data files to "%s"...' % temp_dir)
         ggpk['Data'].extract_to(temp_dir)
@@ -31,8 +31,14 @@ See PyPoE/LICENSE
 
 # Python
 import os
-from collections import Iterable
+import json
+import hashlib
+import time
+from collections import Iterable, OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from threading import Lock
+from urllib.parse import urlsplit
 
 # 3rd Party
 try:
@@ -46,20 +52,94 @@ from PyPoE.cli.core import console, Msg
 from PyPoE.cli.handler import BaseHandler
 from PyPoE.cli.exporter import config
 from PyPoE.cli.exporter.util import check_hash
+from PyPoE.poe.file.dat import DatRecord
+from PyPoE.poe.file.ggpk import GGPKFile
 
 # =============================================================================
 # Globals
 # =============================================================================
 
-__all__ = ['ExporterHandler', 'ExporterResult', 'WikiHandler',
-           'add_format_argument']
+__all__ = ['ExporterHandler', 'ExporterResult', 'FingerprintStore',
+           'WikiHandler', 'WikiPage', 'add_format_argument',
+           'add_jobs_argument']
 
 # =============================================================================
 # Classes
 # =============================================================================
 
 
+class WikiPage(object):
+    """
+    Wiki page with its existence and current content prefetched.
+
+    Stands in for :class:`mwclient.page.Page` when passed to the conditions
+    and text functions of a result row.
+
+    Parameters
+    ----------
+    name : str
+        Normalized page title
+    exists : bool
+        Whether the page exists
+    content : str
+        Current wikitext of the page
+    timestamp : str or None
+        Timestamp of the current revision
+    """
+    __slots__ = ['name', 'exists', 'content', 'timestamp']
+
+    def __init__(self, name, exists=False, content='', timestamp=None):
+        self.name = name
+        self.exists = exists
+        self.content = content
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return '%s(name=%r, exists=%r)' % (
+            self.__class__.__name__, self.name, self.exists
+        )
+
+    def text(self, *args, **kwargs):
+        """
+        Returns
+        -------
+        str
+            The prefetched wikitext of the page
+        """
+        return self.content
+
+
+class _RateLimiter(object):
+    """
+    Ensures at least delay seconds pass between calls to wait across threads.
+    """
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = Lock()
+        self._next = 0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                time.sleep(self._next - now)
+                now = self._next
+            self._next = now + self.delay
+
+
 class WikiHandler(object):
+    """
+    Pushes the rows of an :class:`ExporterResult` to the wiki.
+
+    Existence and current content of all candidate pages are fetched in
+    batched API queries first, the conditions and texts are evaluated and
+    compared locally and only the changed pages are submitted through a rate
+    limited save queue.
+    """
+
+    # Maximum number of attempts to save a page
+    MAX_ATTEMPTS = 5
+
     def add_arguments(self, parser):
         parser.add_argument(
             '-w', '--wiki',
@@ -85,6 +165,15 @@ class WikiHandler(object):
             default='',
         )
 
+        parser.add_argument(
+            '-w-url', '--wiki-url',
+            dest='wiki_url',
+            help='URL of the wiki to edit',
+            action='store',
+            type=str,
+            default='https://pathofexile.gamepedia.com/',
+        )
+
         parser.add_argument(
             '-w-mt', '--wiki-max-threads',
             dest='wiki_threads',
@@ -94,6 +183,24 @@ class WikiHandler(object):
             default=1,
         )
 
+        parser.add_argument(
+            '-w-bs', '--wiki-batch-size',
+            dest='wiki_batch_size',
+            help='Number of pages to fetch per API query',
+            action='store',
+            type=int,
+            default=50,
+        )
+
+        parser.add_argument(
+            '-w-sd', '--wiki-save-delay',
+            dest='wiki_save_delay',
+            help='Minimum delay in seconds between saving two pages',
+            action='store',
+            type=float,
+            default=0.5,
+        )
+
         parser.add_argument(
             '-w-dr', '--wiki-dry-run',
             dest='dry_run',
@@ -108,32 +215,106 @@ class WikiHandler(object):
             action='store_true',
         )
 
-    def _error_catcher(self, *args, **kwargs):
-        fail = 1
-        while fail > 0:
-            try:
-                self.handle_page(*args, **kwargs)
-                fail = 0
-            except mwclient.APIError as e:
-                console(
-                    'APIError occurred. Retrying - total attempts: %s' % fail,
-                    msg=Msg.error
-                )
-                fail += 1
+    def fetch_pages(self, titles):
+        """
+        Fetches the existence and current content of the given pages in
+        batched queries.
+
+        Parameters
+        ----------
+        titles : Iterable[str]
+            Page titles to fetch
+
+        Returns
+        -------
+        dict[str, WikiPage]
+            Dictionary of the given titles to their pages
+        """
+        titles = list(OrderedDict.fromkeys(titles))
+        batch_size = max(1, self.cmdargs.wiki_batch_size)
+        result = {}
+        for i in range(0, len(titles), batch_size):
+            batch = titles[i:i+batch_size]
+            console('Fetching pages %s-%s of %s...' % (
+                i+1, i+len(batch), len(titles)
+            ))
+            pages = self._fetch_batch(batch)
+            for title in batch:
+                result[title] = pages[title]
+
+        return result
+
+    def _fetch_batch(self, titles):
+        params = {
+            'prop': 'revisions',
+            'rvprop': 'content|timestamp',
+            'rvslots': 'main',
+            'titles': '|'.join(titles),
+        }
+        names = {title: title for title in titles}
+        pages = {}
+        while True:
+            response = self.site.api('query', **params)
+            query = response.get('query', {})
+            for item in query.get('normalized', ()):
+                for title, name in names.items():
+                    if name == item['from']:
+                        names[title] = item['to']
 
-    def handle_page(self, *a, row):
+            for data in query.get('pages', {}).values():
+                name = data['title']
+                page = pages.get(name)
+                if page is None:
+                    page = WikiPage(
+                        name=name,
+                        exists='missing' not in data and
+                               'invalid' not in data,
+                    )
+                    pages[name] = page
+                for revision in data.get('revisions', ()):
+                    page.timestamp = revision.get('timestamp')
+                    if 'slots' in revision:
+                        revision = revision['slots']['main']
+                    page.content = revision.get('*', '')
+
+            if 'continue' not in response:
+                break
+            params.update(response['continue'])
+
+        return {
+            title: pages.get(name) or WikiPage(name=name)
+            for title, name in names.items()
+        }
+
+    def handle_page(self, *a, row, pages):
+        """
+        Evaluates the conditions and text of a row against the prefetched
+        pages.
+
+        Parameters
+        ----------
+        row : dict
+            Row of an :class:`ExporterResult`
+        pages : dict[str, WikiPage]
+            Prefetched pages as returned by :meth:`fetch_pages`
+
+        Returns
+        -------
+        tuple[WikiPage, str or None] or None
+            The page to save and its new text, the page and None if the page
+            is already up to date, or None if no page was found for the row
+        """
         if isinstance(row['wiki_page'], str):
-            pages = [
+            candidates = [
                 {'page': row['wiki_page'], 'condition': None},
             ]
         else:
-            pages = row['wiki_page']
+            candidates = row['wiki_page']
         console('Scanning for wiki page candidates "%s"' %
-                ', '.join([p['page'] for p in pages]))
+                ', '.join([p['page'] for p in candidates]))
         page_found = False
-        new = False
-        for pdata in pages:
-            page = self.site.pages[pdata['page']]
+        for pdata in candidates:
+            page = pages[pdata['page']]
             if page.exists:
                 condition = pdata.get('condition')
                 success = True
@@ -175,47 +356,236 @@ class WikiHandler(object):
                 console('Page "%s" does not exist. It will be created.' %
                         pdata['page'])
                 page_found = True
-                new = True
                 break
 
-        if page_found:
-            text = row['text']
-            if callable(text):
-                kwargs = {}
-                if not new:
-                    kwargs['page'] = page
-                text = text(**kwargs)
-
-            if text == page.text():
-                console('No update required. Skipping.')
-                return
-
-            if self.cmdargs.dry_run:
-                console(text)
-            else:
-                response = page.save(
-                    text=text,
-                    summary='PyPoE/ExporterBot/%s: %s' %
-                            (__version__, row['wiki_message'])
-                )
-                if response['result'] == 'Success':
-                    console('Page was edited successfully (time: %s)' %
-                            response.get('newtimestamp'))
-                else:
-                    #TODO: what happens if it fails?
-                    console('Something went wrong, status code:', msg=Msg.error)
-                    console(response, msg=Msg.error)
-        else:
+        if not page_found:
             console(
                 'No wiki page candidates found, skipping this row.',
                 msg=Msg.error,
             )
+            return
+
+        text = row['text']
+        if callable(text):
+            kwargs = {}
+            if page.exists:
+                kwargs['page'] = page
+            text = text(**kwargs)
+
+        if page.exists and text == page.text():
+            console('No update required. Skipping.')
+            return page, None
+
+        return page, text
+
+    def save_page(self, page, text, summary, new_page=None):
+        """
+        Saves the page, retrying on API errors.
+
+        Parameters
+        ----------
+        page : WikiPage
+            Page to save
+        text : str
+            New text of the page
+        summary : str
+            Edit summary
+        new_page : WikiPage or None
+            Page holding the new text; on success its timestamp is set to the
+            saved revision so further edits of the page use it as base
+
+        Returns
+        -------
+        bool
+            Whether the page was saved successfully
+        """
+        kwargs = {
+            'title': page.name,
+            'text': text,
+            'summary': summary,
+            'bot': '1',
+        }
+        if page.exists:
+            kwargs['nocreate'] = '1'
+            if page.timestamp is not None:
+                kwargs['basetimestamp'] = page.timestamp
+        else:
+            kwargs['createonly'] = '1'
+
+        for attempt in range(1, self.MAX_ATTEMPTS+1):
+            self._rate_limiter.wait()
+            try:
+                response = self.site.api(
+                    'edit', token=self._get_token(), **kwargs
+                )
+            except mwclient.APIError as e:
+                if e.code == 'editconflict':
+                    console('Edit conflict on page "%s". Skipping.' %
+                            page.name, msg=Msg.error)
+                    return False
+                if e.code == 'badtoken':
+                    self._token = None
+                console(
+                    'APIError occurred. Retrying - total attempts: %s' %
+                    attempt, msg=Msg.error
+                )
+                continue
+
+            response = response.get('edit', response)
+            if response.get('result') == 'Success':
+                console('Page "%s" was edited successfully (time: %s)' % (
+                    page.name, response.get('newtimestamp')))
+                if new_page is not None and 'newtimestamp' in response:
+                    new_page.timestamp = response['newtimestamp']
+                return True
+            else:
+                console('Something went wrong, status code:', msg=Msg.error)
+                console(response, msg=Msg.error)
+                return False
+
+        console('Giving up on page "%s".' % page.name, msg=Msg.error)
+        return False
+
+    def _save_after(self, previous, *args, **kwargs):
+        # Saves of the same page are chained so they happen in order
+        if previous is not None:
+            previous.result()
+        return self.save_page(*args, **kwargs)
+
+    def _get_token(self):
+        with self._token_lock:
+            if self._token is None:
+                self._token = self.site.get_token('csrf')
+            return self._token
+
+    def process(self, result):
+        """
+        Fetches the candidate pages of the rows, compares them with the new
+        texts and saves the changed pages.
+
+        The rows are consumed in batches of the configured batch size, so
+        result may be a generator that produces the rows while the
+        changed pages of earlier batches are being saved.
+
+        Parameters
+        ----------
+        result : Iterable[dict]
+            Rows to push to the wiki
+
+        Returns
+        -------
+        list[str]
+            Names of the saved (or in dry run, the changed) pages. Names of
+            the pages that failed to save are stored in the failed attribute
+            and the rows whose page was saved or already up to date in the
+            completed attribute.
+        """
+        self._rate_limiter = _RateLimiter(self.cmdargs.wiki_save_delay)
+        self._token = None
+        self._token_lock = Lock()
+        self.failed = []
+        self.completed = []
+
+        saved = []
+        # Pages with unfinished edits; later rows targeting the same page
+        # compare against the new text
+        pending = {}
+        # Last submitted save of each page; saves of the same page wait for
+        # the previous one
+        chains = {}
+        futures = deque()
+        executor = None
+        rows = 0
+        edits = 0
+
+        def finish(block):
+            while futures and (block or futures[0][1].done()):
+                page, future, row = futures.popleft()
+                if future.result():
+                    saved.append(page.name)
+                    self.completed.append(row)
+                else:
+                    self.failed.append(page.name)
+                if pending.get(page.name) is page:
+                    del pending[page.name]
+                if chains.get(page.name) is future:
+                    del chains[page.name]
+
+        try:
+            for batch in _batched(result, max(1, self.cmdargs.wiki_batch_size)):
+                rows += len(batch)
+                titles = []
+                for row in batch:
+                    if isinstance(row['wiki_page'], str):
+                        titles.append(row['wiki_page'])
+                    else:
+                        titles.extend(p['page'] for p in row['wiki_page'])
+                pages = self.fetch_pages(titles)
+                finish(block=False)
+                for title, page in pages.items():
+                    pages[title] = pending.get(page.name, page)
+
+                for row in batch:
+                    edit = self.handle_page(row=row, pages=pages)
+                    if edit is None:
+                        continue
+                    page, text = edit
+                    if text is None:
+                        self.completed.append(row)
+                        continue
+                    edits += 1
+                    new_page = WikiPage(
+                        name=page.name,
+                        exists=True,
+                        content=text,
+                        timestamp=page.timestamp,
+                    )
+                    for title, other in pages.items():
+                        if other is page:
+                            pages[title] = new_page
+
+                    if self.cmdargs.dry_run:
+                        console(text)
+                        saved.append(page.name)
+                        continue
+
+                    summary = 'PyPoE/ExporterBot/%s: %s' % (
+                        __version__, row['wiki_message']
+                    )
+                    if self.cmdargs.wiki_threads > 1:
+                        if executor is None:
+                            console('Starting thread pool...')
+                            executor = ThreadPoolExecutor(
+                                max_workers=self.cmdargs.wiki_threads
+                            )
+                        previous = chains.get(page.name)
+                        future = executor.submit(
+                            self._save_after, previous, page, text, summary,
+                            new_page,
+                        )
+                        chains[page.name] = future
+                        pending[page.name] = new_page
+                        futures.append((new_page, future, row))
+                    elif self.save_page(page, text, summary, new_page):
+                        saved.append(page.name)
+                        self.completed.append(row)
+                    else:
+                        self.failed.append(page.name)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            finish(block=True)
+
+        console('%s of %s rows required an update.' % (edits, rows))
+
+        return saved
 
     def handle(self, *a, mwclient, result, cmdargs, parser):
-        # First row is handled separately to prompt the user for his password
+        url = urlsplit(cmdargs.wiki_url)
         self.site = mwclient.Site(
-            ('https', 'pathofexile.gamepedia.com'),
-            path='/'
+            url.netloc,
+            path=url.path or '/',
+            scheme=url.scheme or 'https',
         )
 
         self.site.login(
@@ -229,25 +599,13 @@ class WikiHandler(object):
         self.cmdargs = cmdargs
         self.parser = parser
 
-
-        if cmdargs.wiki_threads > 1:
-            console('Starting thread pool...')
-            tp = ThreadPoolExecutor(max_workers=cmdargs.wiki_threads)
-
-            for row in result:
-                tp.submit(
-                    self._error_catcher,
-                    row=row,
-                )
-
-            tp.shutdown(wait=True)
-        else:
-            console('Editing pages...')
-            for row in result:
-                self._error_catcher(row=row)
+        self.process(result)
 
 
 class ExporterHandler(BaseHandler):
+    # Number of entries between progress messages
+    PROGRESS_INTERVAL = 100
+
     def __init__(self, *args, **kwargs):
         super(ExporterHandler, self).__init__(*args, **kwargs)
 
@@ -273,21 +631,34 @@ class ExporterHandler(BaseHandler):
             if handler:
                 return handler(parser, pargs, out_dir=out_dir)
             else:
-                result = func(parser, pargs, *args, **kwargs)
-
-                for item in result:
-                    if callable(item['text']):
-                        text = item['text']()
-                    else:
-                        text = item['text']
-                    if pargs.print:
-                        console(text)
-
+                store = None
+                if pargs.incremental:
+                    targets = []
                     if pargs.write:
-                        out_path = os.path.join(out_dir, item['out_file'])
-                        console('Writing data to "%s"...' % out_path)
-                        with open(out_path, 'w') as f:
-                            f.write(text)
+                        targets.append('write')
+                    if pargs.wiki:
+                        targets.append('wiki')
+                    salt = '%s|%s' % (
+                        __version__, getattr(pargs, 'format', '')
+                    )
+                    # Game files the parser reads directly
+                    for file_name in parser._fingerprint_files:
+                        salt += '|%s=%s' % (
+                            file_name,
+                            FingerprintStore.source_digest(temp_dir, file_name)
+                        )
+                    store = FingerprintStore(
+                        os.path.join(
+                            temp_dir, 'fingerprints',
+                            '%s.%s.json' % (cls.__name__, func.__name__),
+                        ),
+                        targets=targets,
+                        salt=salt,
+                    )
+                # Used by BaseParser._iter_rows to skip unchanged rows
+                pargs.fingerprint_store = store
+
+                result = func(parser, pargs, *args, **kwargs)
 
                 if pargs.wiki:
                     if mwclient is None:
@@ -304,12 +675,90 @@ class ExporterHandler(BaseHandler):
                                 msg=Msg.error)
                         return 0
 
-                    console('Running wikibot...')
-                    console('-'*80)
-                    wiki_handler.handle(mwclient=mwclient, result=result, cmdargs=pargs,
-                                        parser=parser)
-                    console('-'*80)
-                    console('Completed wikibot execution.')
+                # Entries handed to the wiki handler per source row
+                wiki_rows = OrderedDict()
+                # The entries of a row are consecutive, so the row is only
+                # recorded as written once the entries of the next row start
+                written = []
+
+                def flush_written():
+                    store.update(written[-1:], 'write')
+                    written.clear()
+
+                def entries():
+                    try:
+                        total = len(result)
+                    except TypeError:
+                        total = None
+
+                    for i, item in enumerate(result, start=1):
+                        write = pargs.write
+                        wiki = pargs.wiki
+                        if store is not None:
+                            write = write and store.is_changed(item, 'write')
+                            wiki = wiki and store.is_changed(item, 'wiki')
+
+                        if pargs.print or write:
+                            if callable(item['text']):
+                                text = item['text']()
+                            else:
+                                text = item['text']
+                            if pargs.print:
+                                console(text)
+
+                            if write:
+                                out_path = os.path.join(
+                                    out_dir, item['out_file']
+                                )
+                                console('Writing data to "%s"...' % out_path)
+                                if store is not None and written and \
+                                        store.get_key(written[-1]) != \
+                                        store.get_key(item):
+                                    flush_written()
+                                with open(out_path, 'w') as f:
+                                    f.write(text)
+                                if store is not None:
+                                    written.append(item)
+
+                        if i % self.PROGRESS_INTERVAL == 0:
+                            console('Processed %s%s entries.' % (
+                                i, '' if total is None else ' of %s' % total
+                            ))
+
+                        if wiki:
+                            if store is not None:
+                                wiki_rows.setdefault(
+                                    store.get_key(item), []
+                                ).append(item)
+                            yield item
+
+                completed = False
+                try:
+                    if pargs.wiki:
+                        console('Running wikibot...')
+                        console('-'*80)
+                        wiki_handler.handle(mwclient=mwclient,
+                                            result=entries(), cmdargs=pargs,
+                                            parser=parser)
+                        console('-'*80)
+                        console('Completed wikibot execution.')
+                    else:
+                        for item in entries():
+                            pass
+                    completed = True
+                finally:
+                    if store is not None:
+                        if completed and written:
+                            flush_written()
+                        if completed and pargs.wiki and not pargs.dry_run:
+                            # Only rows whose pages were all saved or found
+                            # up to date are recorded
+                            done = {id(item) for item in wiki_handler.completed}
+                            store.update([
+                                items[0] for items in wiki_rows.values()
+                                if all(id(item) in done for item in items)
+                            ], 'wiki')
+                        store.save()
 
                 console('Done.')
 
@@ -347,31 +796,539 @@ class ExporterHandler(BaseHandler):
             help='Write to file',
             action='store_true',
         )
+        parser.add_argument(
+            '-inc', '--incremental',
+            help='Only render, write or push rows whose source data changed '
+                 'since the last run of this command',
+            action='store_true',
+        )
 
 
 class ExporterResult(list):
     def add_result(self, text=None, out_file=None, wiki_page=None,
-                   wiki_message='', **extra):
+                   wiki_message='', fingerprint=None, fingerprint_key=None,
+                   **extra):
         data = {
             'text': text,
             'out_file': out_file,
             'wiki_page': wiki_page,
             'wiki_message': wiki_message,
+            'fingerprint': fingerprint,
+            'fingerprint_key': fingerprint_key,
         }
         data.update(extra)
 
         self.append(data)
 
 
+class _RecordingColumn(object):
+    """
+    Stands in for the index of a column of a .dat file and records the keys
+    looked up.
+    """
+    def __init__(self, values, file_name, column, reads):
+        self._values = values
+        self._file_name = file_name
+        self._column = column
+        self._reads = reads
+
+    def _record(self, key):
+        if isinstance(key, DatRecord):
+            key = {'file': key.parent.file_name, 'row': key.rowid}
+        elif key is not None and not isinstance(key, (str, int, float)):
+            # Can't be looked up again by the next run
+            self._reads.add(('unknown', ))
+            return
+        self._reads.add((
+            'index', self._file_name, self._column,
+            json.dumps(key, sort_keys=True),
+        ))
+
+    def __getitem__(self, key):
+        self._record(key)
+        return self._values[key]
+
+    def __contains__(self, key):
+        self._record(key)
+        return key in self._values
+
+    def get(self, key, default=None):
+        self._record(key)
+        return self._values.get(key, default)
+
+    def __iter__(self):
+        self._reads.add(('dat', self._file_name))
+        return iter(self._values)
+
+    def __len__(self):
+        self._reads.add(('dat', self._file_name))
+        return len(self._values)
+
+    def __getattr__(self, item):
+        self._reads.add(('dat', self._file_name))
+        return getattr(self._values, item)
+
+
+class _RecordingIndex(object):
+    """
+    Stands in for the index of a .dat file; see :class:`_RecordingColumn`.
+    """
+    def __init__(self, index, file_name, reads):
+        self._index = index
+        self._file_name = file_name
+        self._reads = reads
+
+    def __getitem__(self, column):
+        return _RecordingColumn(
+            self._index[column], self._file_name, column, self._reads
+        )
+
+    def __contains__(self, column):
+        return column in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __getattr__(self, item):
+        self._reads.add(('dat', self._file_name))
+        return getattr(self._index, item)
+
+
+class _RecordingReader(object):
+    """
+    Stands in for a .dat file reader; lookups through the index are recorded
+    by key, any other access to the data as a read of the whole file.
+    """
+    # Don't depend on the data of the file
+    _NO_DATA = ('build_index', 'columns_unique', 'specification')
+
+    def __init__(self, reader, file_name, reads):
+        self._reader = reader
+        self._file_name = file_name
+        self._reads = reads
+
+    @property
+    def index(self):
+        return _RecordingIndex(
+            self._reader.index, self._file_name, self._reads
+        )
+
+    def __getitem__(self, item):
+        self._reads.add(('dat', self._file_name))
+        return self._reader[item]
+
+    def __iter__(self):
+        self._reads.add(('dat', self._file_name))
+        return iter(self._reader)
+
+    def __len__(self):
+        self._reads.add(('dat', self._file_name))
+        return len(self._reader)
+
+    def __getattr__(self, item):
+        if item not in self._NO_DATA:
+            self._reads.add(('dat', self._file_name))
+        return getattr(self._reader, item)
+
+
+class _RecordingCache(object):
+    """
+    Stands in for a file cache of a parser (i.e. rr, tc or ot) while a row is
+    rendered and records the files read through it.
+    """
+    def __init__(self, cache, kind, reads):
+        self._cache = cache
+        self._kind = kind
+        self._reads = reads
+
+    def __getitem__(self, item):
+        if self._kind == 'dat':
+            if not item.startswith('Data/'):
+                item = 'Data/' + item
+            return _RecordingReader(self._cache[item], item, self._reads)
+        elif self._kind == 'translation':
+            if not item.startswith('Metadata/StatDescriptions/'):
+                item = 'Metadata/StatDescriptions/' + item
+        self._reads.add((self._kind, item))
+        return self._cache[item]
+
+    def get_file(self, file_name, *args, **kwargs):
+        self._reads.add((self._kind, file_name))
+        return self._cache.get_file(file_name, *args, **kwargs)
+
+    def __getattr__(self, item):
+        return getattr(self._cache, item)
+
+
+class FingerprintStore(object):
+    """
+    Persistent store of the fingerprints of the source rows of an exporter.
+
+    The fingerprint of a row is computed from its values including the rows
+    it references (i.e. its resolved relations) and from the other game data
+    read while rendering it. The latter are recorded when the row is
+    rendered by wrapping the rr, tc and ot file caches of the parser:
+
+    * index lookups of .dat files by column and key, with the looked up rows
+      as their value
+    * any other access to a .dat file as a read of the whole file
+    * translation files including the files they include
+    * .ot files including the files they extend
+
+    The recorded inputs are stored along with the fingerprint and looked up
+    again on the next run, before the row is rendered. Rows whose
+    fingerprint matches the stored one for every target are not rendered at
+    all by :meth:`BaseParser._iter_rows`; the entries of the other rows
+    carry the fingerprint of their row so the targets can be updated once
+    they have been handled. Game files the parser reads directly must be
+    part of the salt.
+
+    Fingerprints are tracked separately for every output target (e.g.
+    'write' or 'wiki'), so a row that was written to a file will still be
+    pushed to the wiki. Comparisons are always made against the
+    fingerprints stored by the last run.
+
+    Parameters
+    ----------
+    path : str
+        Path of the json file to store the fingerprints in
+    targets : Iterable[str]
+        Output targets of this run; rows are only skipped if they are
+        unchanged for all of them
+    salt : str
+        Additional value to include in the fingerprints, i.e. options that
+        affect the output
+    """
+    def __init__(self, path, targets=(), salt=''):
+        self.path = path
+        self.targets = tuple(targets)
+        self.salt = salt
+        try:
+            with open(path, 'r') as f:
+                self._previous = json.load(f)
+        except FileNotFoundError:
+            self._previous = {}
+        self.fingerprints = {
+            target: dict(stored) for target, stored in self._previous.items()
+        }
+        # Digests of the referenced rows, shared between the rows of a run
+        self._digests = {}
+        # Digests of the inputs read while rendering
+        self._input_digests = {}
+
+    @staticmethod
+    def row_key(row):
+        """
+        Returns
+        -------
+        str or None
+            The key identifying the source row across runs or None if the row
+            is not a :class:`DatRecord`
+        """
+        if not isinstance(row, DatRecord):
+            return None
+        return '%s:%s' % (row.parent.file_name, row.rowid)
+
+    @staticmethod
+    def get_key(item):
+        """
+        Returns
+        -------
+        str or None
+            The key of the source row of the entry
+        """
+        return item.get('fingerprint_key')
+
+    def _value_repr(self, value, stack, cuts):
+        if isinstance(value, DatRecord):
+            digest, record_cuts = self._record_digest(value, stack)
+            cuts.update(record_cuts)
+            return digest
+        elif isinstance(value, (list, tuple)):
+            return '[%s]' % ','.join(
+                self._value_repr(v, stack, cuts) for v in value
+            )
+        return repr(value)
+
+    def _record_digest(self, record, stack):
+        key = self.row_key(record)
+        digest = self._digests.get(key)
+        if digest is not None:
+            return digest, ()
+        # References back to a row that is being serialized are stored as
+        # its key; its values are part of the outer serialization
+        if key in stack:
+            return key, {key}
+
+        stack.add(key)
+        cuts = set()
+        data = '\0'.join(
+            [key] + [self._value_repr(v, stack, cuts) for v in record]
+        )
+        stack.discard(key)
+        cuts.discard(key)
+
+        digest = hashlib.sha1(data.encode('utf-8')).hexdigest()
+        # Digests that depend on the rows above them can't be reused
+        if not cuts:
+            self._digests[key] = digest
+        return digest, cuts
+
+    def fingerprint_row(self, row):
+        """
+        Computes the fingerprint of a source row.
+
+        Parameters
+        ----------
+        row : DatRecord
+            Row to fingerprint
+
+        Returns
+        -------
+        str or None
+            The fingerprint or None if the row can't be fingerprinted
+        """
+        if not isinstance(row, DatRecord):
+            return None
+
+        digest = self._record_digest(row, set())[0]
+        return hashlib.sha1(
+            ('%s\0%s' % (self.salt, digest)).encode('utf-8')
+        ).hexdigest()
+
+    @staticmethod
+    def source_digest(path_or_ggpk, file_name):
+        """
+        Returns the digest of the contents of a game file.
+
+        Parameters
+        ----------
+        path_or_ggpk : str or GGPKFile
+            The root path the files are stored in or a
+            :class:`PyPoE.poe.file.ggpk.GGPKFile` instance
+        file_name : str
+            file name/path relative to the root
+
+        Returns
+        -------
+        str
+            The digest
+        """
+        if isinstance(path_or_ggpk, GGPKFile):
+            return '%x' % path_or_ggpk[file_name].record.hash
+        with open(os.path.join(path_or_ggpk, file_name), 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    def _read_input(self, parser, read):
+        kind = read[0]
+        if kind == 'dat':
+            return self.source_digest(parser.rr.path_or_ggpk, read[1])
+        elif kind == 'index':
+            reader = parser.rr[read[1]]
+            if read[2] not in reader.index:
+                reader.build_index(read[2])
+            key = json.loads(read[3])
+            if isinstance(key, dict):
+                key = parser.rr[key['file']][key['row']]
+            value = reader.index[read[2]].get(key)
+            # Missed lookups of non-unique columns add empty lists
+            if value == []:
+                value = None
+            return self._value_repr(value, set(), set())
+        elif kind == 'translation':
+            return repr(list(parser.tc.get_source_hashes(read[1]).items()))
+        elif kind == 'ot':
+            digests = []
+            file_name = read[1]
+            while file_name is not None:
+                digests.append(self.source_digest(
+                    parser.ot.path_or_ggpk, file_name
+                ))
+                extends = parser.ot[file_name].extends
+                file_name = None if extends is None else extends + '.ot'
+            return ','.join(digests)
+        return None
+
+    def _input_digest(self, parser, read):
+        if read not in self._input_digests:
+            try:
+                digest = self._read_input(parser, read)
+            except Exception:
+                # e.g. the file or column is gone; render the row again
+                digest = None
+            self._input_digests[read] = digest
+        return self._input_digests[read]
+
+    def _combine(self, fingerprint, reads, parser):
+        """
+        Returns the fingerprint of a row including the digests of the inputs
+        read while rendering it, or None if any of them can't be read.
+        """
+        if not reads:
+            return fingerprint
+
+        data = [fingerprint]
+        for read in reads:
+            digest = self._input_digest(parser, read)
+            if digest is None:
+                return None
+            data.append('%s=%s' % ('\0'.join(read), digest))
+        return hashlib.sha1('\n'.join(data).encode('utf-8')).hexdigest()
+
+    def _is_unchanged(self, key, fingerprint, target, parser):
+        stored = self._previous.get(target, {}).get(key)
+        if not stored:
+            return False
+        reads = [tuple(read) for read in stored[1]]
+        return self._combine(fingerprint, reads, parser) == stored[0]
+
+    def filter_rows(self, rows, func, parser=None):
+        """
+        Fingerprints the rows and drops the ones that are unchanged for all
+        targets.
+
+        Parameters
+        ----------
+        rows : list
+            Source rows
+        func : callable
+            Function rendering a single row as func(row, result)
+        parser : BaseParser or None
+            Parser rendering the rows; if given, the data read through its
+            rr, tc and ot file caches while rendering a row is part of the
+            fingerprint of the row
+
+        Returns
+        -------
+        tuple[list, callable]
+            The changed rows and a rendering function that sets the
+            fingerprint of the row on the entries rendered from it
+        """
+        fingerprints = {}
+        changed = []
+        for row in rows:
+            key = self.row_key(row)
+            fingerprint = self.fingerprint_row(row)
+            if fingerprint is not None:
+                if self.targets and all(
+                        self._is_unchanged(key, fingerprint, target, parser)
+                        for target in self.targets):
+                    continue
+                fingerprints[key] = fingerprint
+            changed.append(row)
+
+        console('%s of %s rows changed since the last run.' % (
+            len(changed), len(rows)
+        ))
+
+        caches = []
+        if parser is not None:
+            for attr, kind in (
+                    ('rr', 'dat'), ('tc', 'translation'), ('ot', 'ot')):
+                if getattr(parser, attr, None) is not None:
+                    caches.append((attr, kind))
+
+        def render(row, result):
+            start = len(result)
+            reads = set()
+            originals = [getattr(parser, attr) for attr, kind in caches]
+            for attr, kind in caches:
+                setattr(parser, attr, _RecordingCache(
+                    getattr(parser, attr), kind, reads
+                ))
+            try:
+                func(row, result)
+            finally:
+                for (attr, kind), cache in zip(caches, originals):
+                    setattr(parser, attr, cache)
+
+            key = self.row_key(row)
+            fingerprint = fingerprints.get(key)
+            reads = sorted(reads)
+            if fingerprint is not None:
+                fingerprint = self._combine(fingerprint, reads, parser)
+            for item in result[start:]:
+                item['fingerprint_key'] = key
+                item['fingerprint'] = fingerprint
+                item['fingerprint_reads'] = reads
+
+        return changed, render
+
+    def is_changed(self, item, target):
+        """
+        Parameters
+        ----------
+        item : dict
+            Entry of an :class:`ExporterResult`
+        target : str
+            Output target
+
+        Returns
+        -------
+        bool
+            Whether the fingerprint of the entry differs from the one stored
+            by the last run
+        """
+        fingerprint = item.get('fingerprint')
+        if fingerprint is None:
+            return True
+        stored = self._previous.get(target, {}).get(self.get_key(item))
+        return not stored or stored[0] != fingerprint
+
+    def update(self, result, target):
+        """
+        Stores the fingerprints of the given entries for the target.
+
+        Parameters
+        ----------
+        result : Iterable[dict]
+            Entries that were successfully written to the target
+        target : str
+            Output target
+        """
+        stored = self.fingerprints.setdefault(target, {})
+        for item in result:
+            if item.get('fingerprint') is not None:
+                stored[self.get_key(item)] = [
+                    item['fingerprint'], item.get('fingerprint_reads', []),
+                ]
+
+    def save(self):
+        """
+        Writes the fingerprints to the store file.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self.fingerprints, f, sort_keys=True)
+
+
 # =============================================================================
 # Functions
 # =============================================================================
 
 
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
 def add_format_argument(parser):
     parser.add_argument(
         '--format',
         help='Output format',
         choices=['template', 'module'],
         default='template',
-    )
\ No newline at end of file
+    )
+
+
+def add_jobs_argument(parser):
+    parser.add_argument(
+        '-j', '--jobs',
+        help='Number of processes to render the rows with',
+        type=int,
+        default=1,
+    )
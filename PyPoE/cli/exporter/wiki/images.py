@@ -0,0 +1,283 @@
+"""
+Wiki image export
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | PyPoE/cli/exporter/wiki/images.py                                |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Pipeline for extracting .dds images from the content.ggpk and converting them
+to png for the wiki exporters.
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import os
+import json
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+
+# self
+from PyPoE.cli.core import console, Msg
+from PyPoE.poe.file.ggpk import extract_dds
+
+# =============================================================================
+# Globals
+# =============================================================================
+
+__all__ = ['ImageExporter']
+
+# References to other .dds files are short, anything larger is image data
+_MAX_REFERENCE_LENGTH = 1024
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class ImageExporter(object):
+    """
+    Extracts .dds files from a content.ggpk into a directory and optionally
+    converts them to png.
+
+    The brotli decompression is done by a pool of processes and the conversion
+    by a bounded number of ImageMagick subprocesses. Each source file is only
+    extracted and converted once even if requested under several names, the
+    further names are copies. Images whose source hash matches the hash stored
+    from the last run and that still exist are skipped.
+
+    Parameters
+    ----------
+    ggpk : GGPKFile
+        GGPKFile instance with the directory build, read from a file path
+    out_dir : str
+        Directory to write the images to
+    convert : bool
+        Whether to convert the images to png using the "magick" command
+    jobs : int or None
+        Number of decompression processes and conversion subprocesses. If
+        None, the number of CPUs is used.
+
+    Attributes
+    ----------
+    extracted : int
+        Number of images that were extracted (and converted) successfully
+    failed : int
+        Number of images that failed to extract or convert
+    skipped : int
+        Number of images that were skipped as unchanged
+
+    Raises
+    ------
+    ValueError
+        if the GGPKFile was not read from a file path
+    """
+
+    HASH_FILE = '.image_hashes.json'
+
+    def __init__(self, ggpk, out_dir, convert=False, jobs=None):
+        # The worker processes read the image data from the file themselves
+        if not isinstance(ggpk._file_path_or_raw, str):
+            raise ValueError(
+                'The GGPKFile must be read from a file path to export images'
+            )
+        self.ggpk = ggpk
+        self.out_dir = out_dir
+        self.convert = convert
+        self.jobs = jobs or os.cpu_count() or 1
+
+        self._hash_path = os.path.join(out_dir, self.HASH_FILE)
+        try:
+            with open(self._hash_path, 'r') as f:
+                self._hashes = json.load(f)
+        except FileNotFoundError:
+            self._hashes = {}
+
+        self._lock = Lock()
+        # data offset -> [source hash, output names, future or None]
+        self._sources = {}
+        self._names = set()
+        self._extract_pool = None
+        self._convert_pool = None
+        self.extracted = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def _get_source(self, path):
+        """
+        Returns the record holding the image data of the .dds at path, after
+        following references, and its hash.
+        """
+        for i in range(10):
+            record = self.ggpk[path].record
+            if record.data_length > _MAX_REFERENCE_LENGTH:
+                break
+            data = record.extract().read()
+            if data[:1] != b'*':
+                break
+            path = data[1:].decode()
+        else:
+            raise ValueError('Too many references for "%s"' % path)
+
+        return record, '%064x' % record.hash
+
+    def _is_current(self, name, source_hash):
+        return self._hashes.get(name) == source_hash and \
+            os.path.exists(self._out_path(name))
+
+    def _out_path(self, name):
+        return os.path.join(
+            self.out_dir, name + ('.png' if self.convert else '.dds')
+        )
+
+    def add(self, dds_path, name):
+        """
+        Queues the extraction of the .dds file.
+
+        Parameters
+        ----------
+        dds_path : str
+            Path of the .dds file in the content.ggpk
+        name : str
+            Name of the output image without extension
+        """
+        if name in self._names:
+            return
+        self._names.add(name)
+
+        record, source_hash = self._get_source(dds_path)
+        source = self._sources.get(record.data_start)
+        if source is not None:
+            with self._lock:
+                source[1].append(name)
+                future = source[2]
+            # Already extracted, only a copy is needed
+            if future is None and not self._is_current(name, source[0]):
+                self._copy(source[0], source[1][0], [name])
+            return
+
+        if self._is_current(name, source_hash):
+            self.skipped += 1
+            self._sources[record.data_start] = [source_hash, [name], None]
+            return
+
+        if self._extract_pool is None:
+            self._extract_pool = ProcessPoolExecutor(max_workers=self.jobs)
+            self._convert_pool = ThreadPoolExecutor(max_workers=self.jobs)
+
+        source = [source_hash, [name], None]
+        self._sources[record.data_start] = source
+        future = self._extract_pool.submit(
+            _extract_image,
+            self.ggpk._file_path_or_raw,
+            record.data_start,
+            record.data_length,
+            os.path.join(self.out_dir, name + '.dds'),
+        )
+        source[2] = future
+        future.add_done_callback(
+            lambda f, source=source: self._extracted(f, source)
+        )
+
+    def _extracted(self, future, source):
+        try:
+            dds_path = future.result()
+        except Exception as e:
+            console('Failed to extract "%s": %s' % (source[1][0], e),
+                    msg=Msg.error)
+            with self._lock:
+                self.failed += 1
+            return
+
+        console('Wrote "%s"' % dds_path)
+        if self.convert:
+            self._convert_pool.submit(self._convert, dds_path, source)
+        else:
+            self._done(source)
+
+    def _convert(self, dds_path, source):
+        png_path = dds_path[:-4] + '.png'
+        try:
+            subprocess.run(
+                ['magick', 'convert', dds_path, png_path],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            console('Failed to convert "%s" to png: %s' % (dds_path, e),
+                    msg=Msg.error)
+            with self._lock:
+                self.failed += 1
+            return
+        os.remove(dds_path)
+        console('Converted "%s" to png' % dds_path)
+        self._done(source)
+
+    def _done(self, source):
+        with self._lock:
+            names = list(source[1])
+            source[2] = None
+            self.extracted += 1
+        self._copy(source[0], names[0], names[1:])
+
+    def _copy(self, source_hash, name, copies):
+        out_path = self._out_path(name)
+        for copy in copies:
+            shutil.copyfile(out_path, self._out_path(copy))
+        with self._lock:
+            for item in [name] + copies:
+                self._hashes[item] = source_hash
+
+    def close(self):
+        """
+        Waits for all queued images and stores the source hashes.
+        """
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown(wait=True)
+            # Conversions are only queued by finished extractions
+            self._convert_pool.shutdown(wait=True)
+            self._extract_pool = None
+            self._convert_pool = None
+
+        with open(self._hash_path, 'w') as f:
+            json.dump(self._hashes, f, sort_keys=True)
+
+        console('Images: %s extracted, %s failed, %s unchanged.' % (
+            self.extracted, self.failed, self.skipped
+        ))
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _extract_image(ggpk_path, data_start, data_length, out_path):
+    with open(ggpk_path, 'rb') as f:
+        f.seek(data_start)
+        data = f.read(data_length)
+
+    with open(out_path, 'wb') as f:
+        f.write(extract_dds(data))
+
+    return out_path
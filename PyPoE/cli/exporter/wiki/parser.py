@@ -53,14 +53,20 @@ Functions
 # =============================================================================
 
 # Python
+import io
+import os
 import re
+import pickle
 import warnings
+import multiprocessing
 from collections import OrderedDict
-from functools import partial
+from functools import partial, lru_cache
+from operator import itemgetter
 
 # self
 from PyPoE.cli.core import console, Msg
 from PyPoE.cli.exporter import config
+from PyPoE.cli.exporter.wiki.handler import ExporterResult
 from PyPoE.poe.constants import MOD_DOMAIN, WORDLISTS
 from PyPoE.poe.text import parse_description_tags
 from PyPoE.poe.file.dat import RelationalReader, set_default_spec
@@ -640,22 +646,24 @@ _inter_wiki_map = (
     ('Charge(?:|s)', {'link': 'Charge'}),
 )
 
-'''_inter_wiki_re = re.compile(
-    r'(?: |^)(?P<text>%s))' % '|'.join([item[0] for item in _inter_wiki_map]),
-    re.UNICODE | re.IGNORECASE
-)'''
-_inter_wiki_re = []
+# The map is applied in passes of _MAX_RE entries each; links created by an
+# earlier pass take precedence over overlapping phrases of later passes.
 _MAX_RE = 97
-for i in range(0, (len(_inter_wiki_map)//_MAX_RE)+1):
-    id = i*_MAX_RE
-    _inter_wiki_re.append(re.compile(
-        r'(?![^\[]*\]\])'
-        r'(?: |^)'
-        r'(?P<text>%s)'
-        r'(?= |$)' %
-        '|'.join(['(%s)' % item[0] for item in _inter_wiki_map[id:id+_MAX_RE]]),
-        re.UNICODE | re.IGNORECASE ,
-    ))
+
+# Matches if the position is inside of an existing wiki link
+_inter_wiki_in_link_re = re.compile(r'[^\[]*\]\]', re.UNICODE)
+
+# Built on first use by _get_inter_wiki_passes
+_inter_wiki_passes = None
+
+_INTER_WIKI_CACHE_SIZE = 2**16
+
+# Set by BaseParser._iter_rows before forking the worker processes, so they
+# share the loaded readers copy-on-write
+_render_state = None
+
+# Number of row slices per worker process
+_RENDER_SLICES_PER_JOB = 4
 
 # =============================================================================
 # Classes
@@ -682,6 +690,9 @@ class BaseParser(object):
 
     _files = []
     _translations = []
+    # Game files read directly while rendering, i.e. not through rr, tc or
+    # ot; their hashes are part of all fingerprints in incremental mode
+    _fingerprint_files = []
 
     def __init__(self, base_path):
         # Make sure to load the appropriate version of the specification
@@ -702,8 +713,13 @@ class BaseParser(object):
             read_options=opt,
             raise_error_on_missing_relation=False,
         )
-        install_data_dependant_quantifiers(self.rr)
-        self.tc = TranslationFileCache(path_or_ggpk=base_path)
+        # Through the current rr, so the data read by the quantifiers is
+        # recorded for the fingerprint of the row being rendered
+        install_data_dependant_quantifiers(_ParserRelationalReader(self))
+        self.tc = TranslationFileCache(
+            path_or_ggpk=base_path,
+            disk_cache_dir=os.path.join(base_path, 'translation_cache'),
+        )
         for file_name in self._translations:
             self.tc[file_name]
 
@@ -738,6 +754,68 @@ class BaseParser(object):
 
         return rows
 
+    def _iter_rows(self, rows, func, parsed_args):
+        """
+        Renders the rows and yields the resulting entries as soon as they are
+        ready.
+
+        func is called as func(row, result) for every row and is expected to
+        add the entries for the row to result. If parsed_args.jobs is greater
+        than one, slices of the rows are rendered by forked worker processes
+        which share the already loaded data with this process; the entries
+        are yielded in the order of the rows.
+
+        If parsed_args.fingerprint_store is set (i.e. in incremental mode),
+        rows that are unchanged since the last run are not rendered; see
+        :class:`FingerprintStore`.
+
+        Parameters
+        ----------
+        rows : list
+            Rows to render
+        func : callable
+            Function rendering a single row
+        parsed_args : argparse.Namespace
+            Parsed arguments; the entries may reference it
+
+        Yields
+        ------
+        dict
+            The rendered entries
+        """
+        store = getattr(parsed_args, 'fingerprint_store', None)
+        if store is not None:
+            rows, func = store.filter_rows(rows, func, self)
+
+        jobs = min(getattr(parsed_args, 'jobs', 1) or 1, len(rows))
+        if jobs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            console('Forking is not supported on this platform. Rendering '
+                    'rows in a single process.', msg=Msg.warning)
+            jobs = 1
+
+        if jobs <= 1:
+            for row in rows:
+                result = ExporterResult()
+                func(row, result)
+                yield from result
+            return
+
+        global _render_state
+        slices = min(jobs * _RENDER_SLICES_PER_JOB, len(rows))
+        bounds = [len(rows) * i // slices for i in range(slices + 1)]
+
+        console('Rendering %s rows with %s processes...' % (len(rows), jobs))
+        _render_state = (func, rows, parsed_args)
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(processes=jobs) as pool:
+                for data in pool.imap(_render_slice, zip(bounds, bounds[1:])):
+                    yield from _RenderUnpickler(
+                        io.BytesIO(data), parsed_args
+                    ).load()
+        finally:
+            _render_state = None
+
     def _format_wiki_title(self, title):
         return title.replace('_', '~').replace('~~~', '_~~_~~_')
 
@@ -988,11 +1066,61 @@ class WikiCondition(object):
             ordered_dict=self.data,
         )
 
+
+class _RenderPickler(pickle.Pickler):
+    """
+    Pickles the parsed arguments as reference, since they contain the
+    unpicklable command functions.
+    """
+    def __init__(self, file, parsed_args):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._parsed_args = parsed_args
+
+    def persistent_id(self, obj):
+        if obj is self._parsed_args:
+            return 'parsed_args'
+        return None
+
+
+class _ParserRelationalReader(object):
+    """
+    Looks up the files through the relational reader the parser currently
+    uses; see :meth:`FingerprintStore.filter_rows`.
+    """
+    def __init__(self, parser):
+        self._parser = parser
+
+    def __getitem__(self, item):
+        return self._parser.rr[item]
+
+
+class _RenderUnpickler(pickle.Unpickler):
+    def __init__(self, file, parsed_args):
+        super().__init__(file)
+        self._parsed_args = parsed_args
+
+    def persistent_load(self, pid):
+        if pid == 'parsed_args':
+            return self._parsed_args
+        raise pickle.UnpicklingError('Unknown persistent id %r' % pid)
+
+
 # =============================================================================
 # Functions
 # =============================================================================
 
 
+def _render_slice(bounds):
+    func, rows, parsed_args = _render_state
+    result = ExporterResult()
+    for row in rows[bounds[0]:bounds[1]]:
+        func(row, result)
+
+    data = io.BytesIO()
+    _RenderPickler(data, parsed_args).dump(list(result))
+    return data.getvalue()
+
+
 def format_result_rows(parsed_args, ordered_dict, template_name,
                        indent=DEFAULT_INDENT):
     """
@@ -1030,11 +1158,122 @@ def format_result_rows(parsed_args, ordered_dict, template_name,
     return ''.join(out)
 
 
+def _expand_pattern(pattern):
+    """
+    Expands the simple regular expressions used in the inter wiki map into
+    the set of strings they can match.
+
+    Only literals, escapes, (non-capturing) groups, alternations and
+    character classes repeated with + are supported. Character classes are
+    expanded to a NUL placeholder.
+
+    Parameters
+    ----------
+    pattern : str
+        regular expression to expand
+
+    Returns
+    -------
+    set[str] or None
+        set of expanded strings or None if the pattern is not supported
+    """
+    def parse(pos):
+        options = set()
+        current = {''}
+        while pos < len(pattern):
+            c = pattern[pos]
+            if c == '|':
+                options.update(current)
+                current = {''}
+                pos += 1
+            elif c == ')':
+                break
+            elif pattern.startswith('(?:', pos):
+                group, pos = parse(pos + 3)
+                if group is None or pos >= len(pattern):
+                    return None, pos
+                current = {a + b for a in current for b in group}
+                pos += 1
+            elif c == '[':
+                end = pattern.find(']', pos)
+                if end == -1 or not pattern.startswith('+', end + 1):
+                    return None, pos
+                current = {a + '\0' for a in current}
+                pos = end + 2
+            elif c == '\\' and pos + 1 < len(pattern):
+                current = {a + pattern[pos+1] for a in current}
+                pos += 2
+            elif c in '()[]{}.*+?^$':
+                return None, pos
+            else:
+                current = {a + c for a in current}
+                pos += 1
+        options.update(current)
+        return options, pos
+
+    options, pos = parse(0)
+    if pos != len(pattern):
+        return None
+    return options
+
+
+def _get_inter_wiki_passes():
+    """
+    Returns the lookup tables used by :func:`make_inter_wiki_links`.
+
+    Each pass contains a mapping of the (lower case) first word of the
+    phrases to the entries that may match, so only the entries that can
+    possibly match a word need to be tried. Entries with patterns that can't
+    be expanded are tried at every position.
+
+    Returns
+    -------
+    list[tuple[dict[str, list], list]]
+        list of passes containing the first word mapping and the list of
+        entries that need to be tried for any word
+    """
+    global _inter_wiki_passes
+    if _inter_wiki_passes is not None:
+        return _inter_wiki_passes
+
+    passes = []
+    for i in range(0, (len(_inter_wiki_map)//_MAX_RE)+1):
+        words = {}
+        any_word = []
+        for j, (pattern, data) in enumerate(
+                _inter_wiki_map[i*_MAX_RE:(i+1)*_MAX_RE]):
+            entry = (
+                j,
+                re.compile(
+                    r'(?:%s)(?= |$)' % pattern, re.UNICODE | re.IGNORECASE
+                ),
+                data,
+            )
+            expanded = _expand_pattern(pattern)
+            if expanded is None:
+                any_word.append(entry)
+                continue
+            first_words = {text.split(' ', 1)[0].lower() for text in expanded}
+            if any('\0' in word for word in first_words):
+                any_word.append(entry)
+                continue
+            for word in first_words:
+                words.setdefault(word, []).append(entry)
+        passes.append((words, any_word))
+
+    _inter_wiki_passes = passes
+    return passes
+
+
+@lru_cache(maxsize=_INTER_WIKI_CACHE_SIZE)
 def make_inter_wiki_links(string):
     """
     Formats the given string according to the predefined inter wiki formatting
     rules and returns it.
 
+    Phrases must be delimited by spaces or the start/end of the string and are
+    not linked within existing links. Results are cached.
+
     Parameters
     ----------
     string : str
@@ -1045,26 +1284,59 @@ def make_inter_wiki_links(string):
     str
         String formatted with inter wiki links
     """
+    for words, any_word in _get_inter_wiki_passes():
+        # Candidate positions as (delimiter position, phrase position) in the
+        # order a regular expression search would try them
+        if string.startswith(' '):
+            positions = [(0, 1), (0, 0)]
+        else:
+            positions = [(0, 0)]
+        index = string.find(' ', 1)
+        while index != -1:
+            positions.append((index, index+1))
+            index = string.find(' ', index+1)
 
-    for i, regex in enumerate(_inter_wiki_re):
         out = []
         last_index = 0
-        for match in regex.finditer(string):
-            text = match.group('text')
-            # Offset by 1 to account for text group
-            index = match.groups().index(text, 1)-1
-            data = _inter_wiki_map[i*_MAX_RE+index][1]
-
-            out.append(string[last_index:match.start('text')])
-            if text == data['link']:
-                out.append('[[%s]]' % data['link'])
-            else:
-                out.append('[[%s|%s]]' % (data['link'], text))
+        for delimiter, start in positions:
+            if delimiter < last_index:
+                continue
+
+            end = string.find(' ', start)
+            if end == -1:
+                end = len(string)
+                # $ in the patterns also matches before a trailing new line
+                if string.endswith('\n'):
+                    end -= 1
+            word = string[start:end].lower()
+            entries = words.get(word)
+            if any_word:
+                entries = sorted((entries or []) + any_word, key=itemgetter(0))
+            elif entries is None:
+                continue
+
+            for _, regex, data in entries:
+                match = regex.match(string, start)
+                if match is None:
+                    continue
+
+                # Don't create links within existing links
+                if _inter_wiki_in_link_re.match(string, delimiter):
+                    break
+
+                text = match.group()
+                out.append(string[last_index:start])
+                if text == data['link']:
+                    out.append('[[%s]]' % data['link'])
+                else:
+                    out.append('[[%s|%s]]' % (data['link'], text))
 
-            last_index = match.end('text')
+                last_index = match.end()
+                break
 
-        out.append(string[last_index:])
-        string = ''.join(out)
+        if out:
+            out.append(string[last_index:])
+            string = ''.join(out)
 
     return string
 
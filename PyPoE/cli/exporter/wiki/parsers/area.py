@@ -38,7 +38,7 @@ Interal API
 
 # Python
 import re
-from functools import partialmethod
+from functools import partial, partialmethod
 from collections import OrderedDict
 
 # 3rd-party
@@ -47,7 +47,7 @@ from collections import OrderedDict
 from PyPoE.cli.core import console, Msg
 from PyPoE.cli.exporter.wiki import parser
 from PyPoE.cli.exporter.wiki.handler import ExporterHandler, ExporterResult, \
-    add_format_argument
+    add_format_argument, add_jobs_argument
 
 # =============================================================================
 # Globals
@@ -92,6 +92,7 @@ class AreaCommandHandler(ExporterHandler):
             func=AreaParser.by_id,
         )
         add_format_argument(a_id)
+        add_jobs_argument(a_id)
         a_id.add_argument(
             'area_id',
             help='Id of the area, can be specified multiple times.',
@@ -109,6 +110,7 @@ class AreaCommandHandler(ExporterHandler):
             func=AreaParser.by_name,
         )
         add_format_argument(a_name)
+        add_jobs_argument(a_name)
         a_name.add_argument(
             'area_name',
             help='Visible name of the area (localized), can be specified multiple times.',
@@ -126,6 +128,7 @@ class AreaCommandHandler(ExporterHandler):
             func=AreaParser.by_rowid,
         )
         add_format_argument(a_rid)
+        add_jobs_argument(a_rid)
         a_rid.add_argument(
             'start',
             help='Starting index',
@@ -151,6 +154,7 @@ class AreaCommandHandler(ExporterHandler):
             func=AreaParser.by_filter,
         )
         add_format_argument(a_filter)
+        add_jobs_argument(a_filter)
 
         a_filter.add_argument(
             '-ft-id', '--filter-id', '--filter-metadata-id',
@@ -371,92 +375,94 @@ class AreaParser(parser.BaseParser):
 
         console('Found %s areas. Processing...' % len(areas))
 
-        for area in areas:
-            data = OrderedDict()
-
-            for row_key, copy_data in self._COPY_KEYS.items():
-                value = area[row_key]
-
-                condition = copy_data.get('condition')
-                if condition is not None and not condition(area):
-                    continue
+        return self._iter_rows(
+            areas, partial(self._export_area, parsed_args=parsed_args),
+            parsed_args,
+        )
 
-                # Skip default values to reduce size of template
-                if value == copy_data.get('default'):
+    def _export_area(self, area, result, parsed_args):
+        data = OrderedDict()
+
+        for row_key, copy_data in self._COPY_KEYS.items():
+            value = area[row_key]
+
+            condition = copy_data.get('condition')
+            if condition is not None and not condition(area):
+                continue
+
+            # Skip default values to reduce size of template
+            if value == copy_data.get('default'):
+                continue
+            '''default = copy_data.get('default')
+            if default is not None and value == default:
+                    continue'''
+
+            fmt = copy_data.get('format')
+            if fmt:
+                value = fmt(value)
+            data[copy_data['template']] = value
+
+        for i, (tag, value) in enumerate(zip(area['SpawnWeight_TagsKeys'],
+                                             area['SpawnWeight_Values']),
+                                         start=1):
+            data['spawn_weight%s_tag' % i] = tag['Id']
+            data['spawn_weight%s_value' % i] = value
+
+        map_pin = self.rr['MapPins.dat'].index['WorldAreasKeys'].get(area)
+        if map_pin:
+            data['flavour_text'] = map_pin[0]['FlavourText']
+
+        atlas_node = self.rr['AtlasNode.dat'].index['WorldAreasKey'].get(
+            area)
+        if atlas_node:
+            data['flavour_text'] = atlas_node[0]['FlavourText']
+
+        #
+        # Add main-page if possible
+        #
+
+        # TODO: Harbinger maps are not handled correctly atm
+
+        # Double legacy maps, pre 2.0
+        map_version = None
+        if data.get('tags') and 'map' in data['tags']:
+            for row in self.rr['MapSeries.dat']:
+                if not area['Id'].startswith(row['Id']):
                     continue
-                '''default = copy_data.get('default')
-                if default is not None and value == default:
-                        continue'''
-
-                fmt = copy_data.get('format')
-                if fmt:
-                    value = fmt(value)
-                data[copy_data['template']] = value
-
-            for i, (tag, value) in enumerate(zip(area['SpawnWeight_TagsKeys'],
-                                                 area['SpawnWeight_Values']),
-                                             start=1):
-                data['spawn_weight%s_tag' % i] = tag['Id']
-                data['spawn_weight%s_value' % i] = value
-
-            map_pin = self.rr['MapPins.dat'].index['WorldAreasKeys'].get(area)
-            if map_pin:
-                data['flavour_text'] = map_pin[0]['FlavourText']
-
-            atlas_node = self.rr['AtlasNode.dat'].index['WorldAreasKey'].get(
-                area)
-            if atlas_node:
-                data['flavour_text'] = atlas_node[0]['FlavourText']
-
-            #
-            # Add main-page if possible
-            #
-
-            # TODO: Harbinger maps are not handled correctly atm
-
-            # Double legacy maps, pre 2.0
-            map_version = None
-            if data.get('tags') and 'map' in data['tags']:
-                for row in self.rr['MapSeries.dat']:
-                    if not area['Id'].startswith(row['Id']):
-                        continue
-                    map_version = row['Name']
-
-
-            if map_version:
-                if 'Unique' in area['Id'] or 'BreachBoss' in area['Id'] or \
-                        area['Id'].endswith('ShapersRealm'):
-                    data['main_page'] = '%s (%s)' % (area['Name'], map_version)
-                elif 'Harbinger' in area['Id']:
-                    data['main_page'] = '%s (%s Tier) (%s)' % (
-                        area['Name'],
-                        re.sub('^.*Harbinger', '', area['Id']),
-                        map_version,
-                    )
-                else:
-                    data['main_page'] = '%s Map (%s)' % (
-                        area['Name'], map_version
-                    )
-
-            cond = WikiCondition(
-                data=data,
-                cmdargs=parsed_args,
-            )
-
-            r.add_result(
-                text=cond,
-                out_file='area_%s.txt' % data['id'],
-                wiki_page=[
-                    {
-                        'page': 'Area:' + self._format_wiki_title(data['id']),
-                        'condition': cond,
-                    },
-                ],
-                wiki_message='Area updater',
-            )
-
+                map_version = row['Name']
+
+
+        if map_version:
+            if 'Unique' in area['Id'] or 'BreachBoss' in area['Id'] or \
+                    area['Id'].endswith('ShapersRealm'):
+                data['main_page'] = '%s (%s)' % (area['Name'], map_version)
+            elif 'Harbinger' in area['Id']:
+                data['main_page'] = '%s (%s Tier) (%s)' % (
+                    area['Name'],
+                    re.sub('^.*Harbinger', '', area['Id']),
+                    map_version,
+                )
+            else:
+                data['main_page'] = '%s Map (%s)' % (
+                    area['Name'], map_version
+                )
+
+        cond = WikiCondition(
+            data=data,
+            cmdargs=parsed_args,
+        )
 
-        return r
+        result.add_result(
+            text=cond,
+            out_file='area_%s.txt' % data['id'],
+            wiki_page=[
+                {
+                    'page': 'Area:' + self._format_wiki_title(data['id']),
+                    'condition': cond,
+                },
+            ],
+            wiki_message='Area updater',
+        )
 
 # =============================================================================
 # Functions
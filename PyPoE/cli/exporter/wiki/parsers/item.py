@@ -34,18 +34,18 @@ import re
 import warnings
 import os
 from collections import defaultdict, OrderedDict
+from functools import partial
 
 # Self
 from PyPoE.poe.constants import RARITY
-from PyPoE.poe.file.ot import OTFile
-from PyPoE.poe.file.ggpk import GGPKFile, extract_dds
 from PyPoE.poe.file.stat_filters import StatFilterFile
 from PyPoE.poe.sim.formula import gem_stat_requirement, GemTypes
 from PyPoE.cli.core import console, Msg
-from PyPoE.cli.exporter.util import get_content_ggpk_path
+from PyPoE.cli.exporter.util import get_content_ggpk
 from PyPoE.cli.exporter.wiki.handler import ExporterHandler, ExporterResult, \
-    add_format_argument
+    add_format_argument, add_jobs_argument
 from PyPoE.cli.exporter.wiki import parser
+from PyPoE.cli.exporter.wiki.images import ImageExporter
 
 # =============================================================================
 # Functions
@@ -236,6 +236,8 @@ class ItemsHandler(ExporterHandler):
         add_format_argument(parser)
 
     def _shared_item_arguments(self, parser):
+        add_jobs_argument(parser)
+
         parser.add_argument(
             '-ft-c', '--filter-class',
             help='Filter by item class(es). Case sensitive.',
@@ -259,6 +261,14 @@ class ItemsHandler(ExporterHandler):
             dest='convert_images',
         )
 
+        parser.add_argument(
+            '-im-j', '--image-jobs',
+            help='Number of processes to extract and convert images with. '
+                 'Defaults to the number of CPUs.',
+            type=int,
+            dest='image_jobs',
+        )
+
 
 class ItemsParser(parser.BaseParser):
     _regex_format = re.compile(
@@ -281,6 +291,11 @@ class ItemsParser(parser.BaseParser):
         'active_skill_gem_stat_descriptions.txt',
     ]
 
+    # Read by skill_stat_filter
+    _fingerprint_files = [
+        'Metadata/StatDescriptions/skillpopup_stat_filters.txt',
+    ]
+
     _IGNORE_DROP_LEVEL_CLASSES = (
         'Hideout Doodads',
         'Microtransactions',
@@ -355,7 +370,9 @@ class ItemsParser(parser.BaseParser):
 
         self._skill_stat_filters = None
         self._img_path = None
-        self._ggpk = None
+        self._image_exporter = None
+        self._row_images = []
+        self.ggpk = None
         self._parsed_args = None
 
     @property
@@ -380,24 +397,21 @@ class ItemsParser(parser.BaseParser):
     def _format_lines(self, lines):
         return '<br>'.join(lines).replace('\n', '<br>')
 
-    def _write_image(self, data, out_path):
-        with open(out_path, 'wb') as f:
-            f.write(extract_dds(
-                data,
-                path_or_ggpk=self.ggpk,
-            ))
-
-            console('Wrote "%s"' % out_path)
-
-        if not self._parsed_args.convert_images:
-            return
-
-        os.system('magick convert "%s" "%s"' % (
-            out_path, out_path.replace('.dds', '.png'),
-        ))
-        os.remove(out_path)
+    def _queue_image(self, dds_path, name):
+        """
+        Queues the image to be extracted once the entry of the current row is
+        handed out; see :meth:`_iter_images`.
+        """
+        self._row_images.append((dds_path, name))
 
-        console('Converted "%s" to png' % out_path)
+    def _iter_images(self, entries):
+        try:
+            for entry in entries:
+                for dds_path, name in entry.get('images', ()):
+                    self._image_exporter.add(dds_path, name)
+                yield entry
+        finally:
+            self._image_exporter.close()
 
     _skill_column_map = (
         ('ManaCost', {
@@ -496,12 +510,9 @@ class ItemsParser(parser.BaseParser):
                 tf = self.tc['skill_stat_descriptions.txt']
 
             if self._parsed_args.store_images and ae['Icon_DDSFile']:
-                self._write_image(
-                    data=self.ggpk[ae['Icon_DDSFile']].record.extract().read(),
-                    out_path=os.path.join(
-                        self._img_path,
-                        '%s skill icon.dds' % base_item_type['Name']
-                    ),
+                self._queue_image(
+                    ae['Icon_DDSFile'],
+                    '%s skill icon' % base_item_type['Name'],
                 )
         else:
             tf = self.tc['gem_stat_descriptions.txt']
@@ -1630,160 +1641,168 @@ class ItemsParser(parser.BaseParser):
                     'Images are flagged for extraction. Loading content.ggpk '
                     '...'
                 )
-                self.ggpk = GGPKFile()
-                self.ggpk.read(get_content_ggpk_path())
-                self.ggpk.directory_build()
+                self.ggpk = get_content_ggpk()
                 console('content.ggpk has been loaded.')
 
                 self._img_path = os.path.join(self.base_path, 'img')
                 if not os.path.exists(self._img_path):
                     os.makedirs(self._img_path)
 
-        r = ExporterResult()
-        self.rr['BaseItemTypes.dat'].build_index('Name')
-
-        for base_item_type in items:
-            name = base_item_type['Name']
-            cls = base_item_type['ItemClassesKey']['Name']
-
-            infobox = OrderedDict()
+                self._image_exporter = ImageExporter(
+                    ggpk=self.ggpk,
+                    out_dir=self._img_path,
+                    convert=parsed_args.convert_images,
+                    jobs=parsed_args.image_jobs,
+                )
 
-            infobox['rarity'] = 'Normal'
+        self.rr['BaseItemTypes.dat'].build_index('Name')
 
-            # BaseItemTypes.dat
-            infobox['name'] = name
-            infobox['class'] = cls
-            infobox['size_x'] = base_item_type['Width']
-            infobox['size_y'] = base_item_type['Height']
-            if base_item_type['FlavourTextKey']:
-                infobox['flavour_text'] = \
-                    parser.parse_and_handle_description_tags(
-                        rr=self.rr,
-                        text=base_item_type['FlavourTextKey']['Text'],
-                    )
+        entries = self._iter_rows(
+            items, partial(self._export_item, parsed_args=parsed_args),
+            parsed_args,
+        )
+        if self._image_exporter is not None:
+            entries = self._iter_images(entries)
+        return entries
 
-            if cls not in self._IGNORE_DROP_LEVEL_CLASSES and \
-                    name not in self._IGNORE_DROP_LEVEL_ITEMS:
-                infobox['drop_level'] = base_item_type['DropLevel']
+    def _export_item(self, base_item_type, result, parsed_args):
+        self._row_images = []
+        name = base_item_type['Name']
+        cls = base_item_type['ItemClassesKey']['Name']
+
+        infobox = OrderedDict()
+
+        infobox['rarity'] = 'Normal'
+
+        # BaseItemTypes.dat
+        infobox['name'] = name
+        infobox['class'] = cls
+        infobox['size_x'] = base_item_type['Width']
+        infobox['size_y'] = base_item_type['Height']
+        if base_item_type['FlavourTextKey']:
+            infobox['flavour_text'] = \
+                parser.parse_and_handle_description_tags(
+                    rr=self.rr,
+                    text=base_item_type['FlavourTextKey']['Text'],
+                )
 
-            base_ot = OTFile(parent_or_base_dir_or_ggpk=self.base_path)
-            base_ot.read(
-                self.base_path + '/' + base_item_type['InheritsFrom'] + '.ot')
-            try:
-                ot = self.ot[base_item_type['Id'] + '.ot']
-            except FileNotFoundError:
-                pass
-            else:
-                base_ot.merge(ot)
-            finally:
-                ot = base_ot
+        if cls not in self._IGNORE_DROP_LEVEL_CLASSES and \
+                name not in self._IGNORE_DROP_LEVEL_ITEMS:
+            infobox['drop_level'] = base_item_type['DropLevel']
 
-            if 'enable_rarity' in ot['Mods']:
-                infobox['drop_rarities'] = ', '.join([
-                    n[0].upper() + n[1:] for n in ot['Mods']['enable_rarity']
-                ])
+        # The inheritance chains are shared between many items, so use the
+        # cached chain and only copy it
+        base_ot = self.ot[base_item_type['InheritsFrom'] + '.ot'].copy()
+        try:
+            ot = self.ot[base_item_type['Id'] + '.ot']
+        except FileNotFoundError:
+            pass
+        else:
+            base_ot.merge(ot)
+        finally:
+            ot = base_ot
 
-            tags = [t['Id'] for t in base_item_type['TagsKeys']]
-            infobox['tags'] = ', '.join(tags + list(ot['Base']['tag']))
-
-            infobox['metadata_id'] = base_item_type['Id']
-
-            description = ot['Stack'].get('function_text')
-            if description:
-                 infobox['description'] = self.rr['ClientStrings.dat'].index[
-                     'Id'][description]['Text']
-
-            help_text = ot['Base'].get('description_text')
-            if help_text:
-                infobox['help_text'] = self.rr['ClientStrings.dat'].index['Id'][
-                    help_text]['Text']
-
-            for i, mod in enumerate(base_item_type['Implicit_ModsKeys']):
-                infobox['implicit%s' % (i+1)] = mod['Id']
-
-            for rarity in RARITY:
-                for i, (item, cost) in enumerate(
-                        base_item_type[rarity.name_upper + 'Purchase'],
-                        start=1):
-                    prefix = 'purchase_cost_%s%s' % (rarity.name_lower, i)
-                    infobox[prefix + '_name'] = item['Name']
-                    infobox[prefix + '_amount'] = cost
-
-            funcs = self._cls_map.get(cls)
-            if funcs:
-                fail = False
-                for f in funcs:
-                    if not f(self, infobox, base_item_type):
-                        fail = True
-                        console(
-                            'Required extra info for item "%s" with class "%s"'
-                            ' not found. Skipping.' % (name, cls),
-                            msg=Msg.error)
-                        break
-                if fail:
-                    continue
+        if 'enable_rarity' in ot['Mods']:
+            infobox['drop_rarities'] = ', '.join([
+                n[0].upper() + n[1:] for n in ot['Mods']['enable_rarity']
+            ])
 
-            # handle items with duplicate name entries
-            # Maps must be handled in any case due to unique naming style of
-            # pages
-            if cls == 'Maps' or len(self.rr['BaseItemTypes.dat'].index['Name'][name]) > 1:
-                resolver = self._conflict_resolver_map.get(cls)
-
-                if resolver:
-                    name = resolver(self, infobox, base_item_type)
-                    if name is None:
-                        console(
-                            'Unresolved ambiguous item "%s" with name "%s". '
-                            'Skipping' %
-                            (base_item_type['Id'], infobox['name']),
-                            msg=Msg.error
-                        )
-                        continue
-                else:
-                    console('No name conflict handler defined for item class '
-                            '"%s"' % cls, msg=Msg.error)
-                    continue
+        tags = [t['Id'] for t in base_item_type['TagsKeys']]
+        infobox['tags'] = ', '.join(tags + list(ot['Base']['tag']))
+
+        infobox['metadata_id'] = base_item_type['Id']
+
+        description = ot['Stack'].get('function_text')
+        if description:
+             infobox['description'] = self.rr['ClientStrings.dat'].index[
+                 'Id'][description]['Text']
+
+        help_text = ot['Base'].get('description_text')
+        if help_text:
+            infobox['help_text'] = self.rr['ClientStrings.dat'].index['Id'][
+                help_text]['Text']
+
+        for i, mod in enumerate(base_item_type['Implicit_ModsKeys']):
+            infobox['implicit%s' % (i+1)] = mod['Id']
+
+        for rarity in RARITY:
+            for i, (item, cost) in enumerate(
+                    base_item_type[rarity.name_upper + 'Purchase'],
+                    start=1):
+                prefix = 'purchase_cost_%s%s' % (rarity.name_lower, i)
+                infobox[prefix + '_name'] = item['Name']
+                infobox[prefix + '_amount'] = cost
+
+        funcs = self._cls_map.get(cls)
+        if funcs:
+            fail = False
+            for f in funcs:
+                if not f(self, infobox, base_item_type):
+                    fail = True
+                    console(
+                        'Required extra info for item "%s" with class "%s"'
+                        ' not found. Skipping.' % (name, cls),
+                        msg=Msg.error)
+                    break
+            if fail:
+                return
 
-            # putting this last since it's usually manually added
-            if base_item_type['Name'] in self._DROP_DISABLED_ITEMS or \
-                    base_item_type['Id'] in self._DROP_DISABLED_ITEMS_BY_ID:
-                infobox['drop_enabled'] = False
+        # handle items with duplicate name entries
+        # Maps must be handled in any case due to unique naming style of
+        # pages
+        if cls == 'Maps' or len(self.rr['BaseItemTypes.dat'].index['Name'][name]) > 1:
+            resolver = self._conflict_resolver_map.get(cls)
+
+            if resolver:
+                name = resolver(self, infobox, base_item_type)
+                if name is None:
+                    console(
+                        'Unresolved ambiguous item "%s" with name "%s". '
+                        'Skipping' %
+                        (base_item_type['Id'], infobox['name']),
+                        msg=Msg.error
+                    )
+                    return
+            else:
+                console('No name conflict handler defined for item class '
+                        '"%s"' % cls, msg=Msg.error)
+                return
 
-            cond = WikiCondition(
-                data=infobox,
-                cmdargs=parsed_args,
-            )
+        # putting this last since it's usually manually added
+        if base_item_type['Name'] in self._DROP_DISABLED_ITEMS or \
+                base_item_type['Id'] in self._DROP_DISABLED_ITEMS_BY_ID:
+            infobox['drop_enabled'] = False
 
-            r.add_result(
-                text=cond,
-                out_file='item_%s.txt' % name,
-                wiki_page=[
-                    {
-                        'page': name,
-                        'condition': cond,
-                    }
-                ],
-                wiki_message='Item exporter',
-            )
+        cond = WikiCondition(
+            data=infobox,
+            cmdargs=parsed_args,
+        )
 
-            if parsed_args.store_images and self.ggpk:
-                if not base_item_type['ItemVisualIdentityKey']['DDSFile']:
-                    warnings.warn(
-                        'Missing 2d art inventory icon for item "%s"' %
-                        base_item_type['Name']
-                    )
-                    continue
+        result.add_result(
+            text=cond,
+            out_file='item_%s.txt' % name,
+            wiki_page=[
+                {
+                    'page': name,
+                    'condition': cond,
+                }
+            ],
+            wiki_message='Item exporter',
+            images=self._row_images,
+        )
 
-                self._write_image(
-                    data=self.ggpk[base_item_type['ItemVisualIdentityKey'][
-                        'DDSFile']].record.extract().read(),
-                    out_path=os.path.join(self._img_path, (
-                        infobox.get('inventory_icon') or name) +
-                        ' inventory icon.dds'
-                    ),
+        if parsed_args.store_images and self.ggpk:
+            if not base_item_type['ItemVisualIdentityKey']['DDSFile']:
+                warnings.warn(
+                    'Missing 2d art inventory icon for item "%s"' %
+                    base_item_type['Name']
                 )
+                return
 
-        return r
+            self._queue_image(
+                base_item_type['ItemVisualIdentityKey']['DDSFile'],
+                (infobox.get('inventory_icon') or name) + ' inventory icon',
+            )
 
     _conflict_resolver_prophecy_map = {
         'MapExtraHaku': ' (Haku)',
@@ -38,12 +38,13 @@ FIX the jewel generator (corrupted)
 import re
 import warnings
 from collections import OrderedDict, defaultdict
+from functools import partial
 
 # Self
 from PyPoE.poe.constants import MOD_DOMAIN, MOD_GENERATION_TYPE, MOD_STATS_RANGE
 from PyPoE.cli.core import console, Msg
 from PyPoE.cli.exporter.wiki.handler import ExporterHandler, ExporterResult, \
-    add_format_argument
+    add_format_argument, add_jobs_argument
 from PyPoE.cli.exporter.wiki.parser import BaseParser, format_result_rows
 from PyPoE.shared.decorators import deprecated
 
@@ -125,6 +126,7 @@ class ModsHandler(ExporterHandler):
         )
 
         add_format_argument(parser)
+        add_jobs_argument(parser)
 
         self.add_default_parsers(
             parser=parser,
@@ -149,6 +151,7 @@ class ModsHandler(ExporterHandler):
         )
 
         add_format_argument(parser)
+        add_jobs_argument(parser)
 
         self.add_default_parsers(
             parser=parser,
@@ -172,6 +175,7 @@ class ModsHandler(ExporterHandler):
         )
 
         add_format_argument(parser)
+        add_jobs_argument(parser)
 
         self.add_default_parsers(
             parser=parser,
@@ -292,92 +296,94 @@ class ModParser(BaseParser):
             )
             return r
 
-        for mod in mods:
-            data = OrderedDict()
-
-            for k in (
-                ('Id', 'id'),
-                ('Name', 'name'),
-                ('CorrectGroup', 'mod_group'),
-                ('Domain', 'domain'),
-                ('GenerationType', 'generation_type'),
-                ('Level', 'required_level'),
-
-            ):
-                data[k[1]] = mod[k[0]]
-
-            if mod['BuffDefinitionsKey']:
-                data['granted_buff_id'] = mod['BuffDefinitionsKey']['Id']
-                data['granted_buff_value'] = mod['BuffValue']
-            # todo ID for GEPL
-            if mod['GrantedEffectsPerLevelKey']:
-                data['granted_skill'] = mod['GrantedEffectsPerLevelKey']['GrantedEffectsKey']['Id']
-            data['mod_type'] = mod['ModTypeKey']['Name']
-
-            stats = []
-            values = []
-            for i in MOD_STATS_RANGE:
-                k = mod['StatsKey%s' % i]
-                if k is None:
-                    continue
-
-                stat = k['Id']
-                value = mod['Stat%sMin' % i], mod['Stat%sMax' % i]
-
-                if value[0] == 0 and value[1] == 0:
-                    continue
-
-                stats.append(stat)
-                values.append(value)
-
-            data['stat_text'] = '<br>'.join(self._get_stats(stats, values, mod))
+        return self._iter_rows(
+            mods, partial(self._mod_row, parsed_args=parsed_args), parsed_args,
+        )
 
-            for i, (sid, (vmin, vmax)) in enumerate(zip(stats, values), start=1):
-                data['stat%s_id' % i] = sid
-                data['stat%s_min' % i] = vmin
-                data['stat%s_max' % i] = vmax
+    def _mod_row(self, mod, result, parsed_args):
+        data = OrderedDict()
+
+        for k in (
+            ('Id', 'id'),
+            ('Name', 'name'),
+            ('CorrectGroup', 'mod_group'),
+            ('Domain', 'domain'),
+            ('GenerationType', 'generation_type'),
+            ('Level', 'required_level'),
+
+        ):
+            data[k[1]] = mod[k[0]]
+
+        if mod['BuffDefinitionsKey']:
+            data['granted_buff_id'] = mod['BuffDefinitionsKey']['Id']
+            data['granted_buff_value'] = mod['BuffValue']
+        # todo ID for GEPL
+        if mod['GrantedEffectsPerLevelKey']:
+            data['granted_skill'] = mod['GrantedEffectsPerLevelKey']['GrantedEffectsKey']['Id']
+        data['mod_type'] = mod['ModTypeKey']['Name']
+
+        stats = []
+        values = []
+        for i in MOD_STATS_RANGE:
+            k = mod['StatsKey%s' % i]
+            if k is None:
+                continue
 
-            for i, tag in enumerate(mod['SpawnWeight_TagsKeys']):
-                j = i + 1
-                data['spawn_weight%s_tag' % j] = tag['Id']
-                data['spawn_weight%s_value' % j] = mod['SpawnWeight_Values'][i]
+            stat = k['Id']
+            value = mod['Stat%sMin' % i], mod['Stat%sMax' % i]
 
-            for i, tag in enumerate(mod['GenerationWeight_TagsKeys']):
-                j = i + 1
-                data['generation_weight%s_tag' % j] = tag['Id']
-                data['generation_weight%s_value' % j] = \
-                    mod['GenerationWeight_Values'][i]
-
-            if mod['TagsKeys']:
-                data['tags'] = ', '.join([t['Id'] for t in mod['TagsKeys']])
-
-            if mod['ModTypeKey']:
-                sell_price = defaultdict(int)
-                for msp in mod['ModTypeKey']['ModSellPricesKeys']:
-                    for bt in msp['BaseItemTypesKeys']:
-                        sell_price[bt['Name']] += 1
-
-                # Make sure this is always the same order
-                sell_price = sorted(sell_price.items(), key=lambda x:x[0])
-
-                for i, (item_name, amount) in enumerate(sell_price, start=1):
-                    data['sell_price%s_name' % i] = item_name
-                    data['sell_price%s_amount' % i] = amount
-
-            # 3+ tildes not allowed
-            page_name = 'Modifier:' + self._format_wiki_title(mod['Id'])
-            cond = WikiCondition(data, parsed_args)
-
-            r.add_result(
-                text=cond,
-                out_file='mod_%s.txt' % data['id'],
-                wiki_page=[
-                    {'page': page_name, 'condition': cond},
-                ],
-                wiki_message='Mod updater',
-            )
+            if value[0] == 0 and value[1] == 0:
+                continue
 
-        return r
+            stats.append(stat)
+            values.append(value)
+
+        data['stat_text'] = '<br>'.join(self._get_stats(stats, values, mod))
+
+        for i, (sid, (vmin, vmax)) in enumerate(zip(stats, values), start=1):
+            data['stat%s_id' % i] = sid
+            data['stat%s_min' % i] = vmin
+            data['stat%s_max' % i] = vmax
+
+        for i, tag in enumerate(mod['SpawnWeight_TagsKeys']):
+            j = i + 1
+            data['spawn_weight%s_tag' % j] = tag['Id']
+            data['spawn_weight%s_value' % j] = mod['SpawnWeight_Values'][i]
+
+        for i, tag in enumerate(mod['GenerationWeight_TagsKeys']):
+            j = i + 1
+            data['generation_weight%s_tag' % j] = tag['Id']
+            data['generation_weight%s_value' % j] = \
+                mod['GenerationWeight_Values'][i]
+
+        if mod['TagsKeys']:
+            data['tags'] = ', '.join([t['Id'] for t in mod['TagsKeys']])
+
+        if mod['ModTypeKey']:
+            sell_price = defaultdict(int)
+            for msp in mod['ModTypeKey']['ModSellPricesKeys']:
+                for bt in msp['BaseItemTypesKeys']:
+                    sell_price[bt['Name']] += 1
+
+            # Make sure this is always the same order
+            sell_price = sorted(sell_price.items(), key=lambda x:x[0])
+
+            for i, (item_name, amount) in enumerate(sell_price, start=1):
+                data['sell_price%s_name' % i] = item_name
+                data['sell_price%s_amount' % i] = amount
+
+        # 3+ tildes not allowed
+        page_name = 'Modifier:' + self._format_wiki_title(mod['Id'])
+        cond = WikiCondition(data, parsed_args)
+
+        result.add_result(
+            text=cond,
+            out_file='mod_%s.txt' % data['id'],
+            wiki_page=[
+                {'page': page_name, 'condition': cond},
+            ],
+            wiki_message='Mod updater',
+        )
 
     @deprecated(message='Will be done in-wiki in the future - non functional')
     def tempest(self, parsed_args):
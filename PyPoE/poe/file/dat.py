@@ -65,6 +65,8 @@ Internal API
     :exclude-members: append, clear, copy, count, extend, index, insert, pop, remove, reverse, sort
 
 .. autoclass:: DatValue
+
+.. autoclass:: LazyTableData
 """
 
 # =============================================================================
@@ -75,7 +77,9 @@ Internal API
 import struct
 import warnings
 from io import BytesIO
-from collections import OrderedDict, Iterable, defaultdict
+from threading import RLock
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
 
 # 3rd-party
 
@@ -448,6 +452,109 @@ class DatRecord(list):
         return self.parent.table_columns.keys()
 
 
+class LazyTableData(object):
+    """
+    Sequence of the rows of a :class:`DatReader` read with ``lazy=True``.
+
+    Rows are parsed when first accessed, together with the other rows in the
+    same window of :attr:`WINDOW_SIZE` rows. Access is thread-safe.
+
+    While rows are parsed lazily, :attr:`DatReader.data_parsed` stays empty;
+    :meth:`load_all` parses the remaining rows and fills it in row order.
+    """
+
+    WINDOW_SIZE = 256
+
+    def __init__(self, reader):
+        """
+        Parameters
+        ----------
+        reader :  DatReader
+            The DatReader instance the rows belong to
+        """
+        self._reader = reader
+        self._rows = [None] * reader.table_rows
+        self._parsed = [None] * reader.table_rows
+        self._lock = RLock()
+        self.loaded = 0
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self._rows)))]
+
+        row = self._rows[item]
+        if row is None:
+            row = self._load(item % len(self._rows))
+        return row
+
+    def __iter__(self):
+        for rowid in range(len(self._rows)):
+            yield self[rowid]
+
+    def _load(self, rowid):
+        with self._lock:
+            if self._rows[rowid] is None:
+                start = rowid - rowid % self.WINDOW_SIZE
+                end = min(start + self.WINDOW_SIZE, len(self._rows))
+                reader = self._reader
+                data_parsed = reader.data_parsed
+                try:
+                    for i in range(start, end):
+                        if self._rows[i] is not None:
+                            continue
+                        # Collect the parsed data values per row so they can
+                        # be put in row order later
+                        reader.data_parsed = []
+                        self._rows[i] = reader._process_row(i)
+                        self._parsed[i] = reader.data_parsed
+                        self.loaded += 1
+                finally:
+                    reader.data_parsed = data_parsed
+
+            return self._rows[rowid]
+
+    @property
+    def is_loaded(self):
+        """
+        Whether all rows have been parsed.
+
+        Returns
+        -------
+        bool
+        """
+        return self.loaded == len(self._rows)
+
+    def load_all(self, cancelled=None):
+        """
+        Parses all remaining rows and fills :attr:`DatReader.data_parsed`.
+
+        Parameters
+        ----------
+        cancelled : callable or None
+            Checked before each window; stops loading if it returns True
+
+        Returns
+        -------
+        bool
+            Whether all rows have been loaded
+        """
+        for start in range(0, len(self._rows), self.WINDOW_SIZE):
+            if cancelled is not None and cancelled():
+                return False
+            self[start]
+
+        with self._lock:
+            if not self._reader.data_parsed:
+                self._reader.data_parsed = [
+                    value for parsed in self._parsed for value in parsed
+                ]
+
+        return True
+
+
 class DatReader(ReprMixin):
     """
     Attributes
@@ -464,8 +571,10 @@ class DatReader(ReprMixin):
         File name
     file_length :  int
         File length in bytes
-    table_data : list[DatRecord[object]]
+    table_data : list[DatRecord[object]] or LazyTableData
         List of rows containing DatRecord entries.
+    lazy : bool
+        Whether the rows are parsed on first access
     table_length :  int
         Length of table in bytes
     table_record_length :  int
@@ -503,7 +612,7 @@ class DatReader(ReprMixin):
     }
 
     def __init__(self, file_name, *args, use_dat_value=True, specification=None,
-                 auto_build_index=False):
+                 auto_build_index=False, lazy=False):
         """
         Parameters
         ----------
@@ -511,6 +620,9 @@ class DatReader(ReprMixin):
             Name of the dat file
         use_dat_value : bool
             Whether to use :class:`DatValue` instances or values
+        lazy : bool
+            Whether to parse the rows on first access. If True, table_data is
+            a :class:`LazyTableData` instance.
         specification : Specification
             Specification to use
         auto_build_index : bool
@@ -537,6 +649,7 @@ class DatReader(ReprMixin):
 
         #
         self.use_dat_value = use_dat_value
+        self.lazy = lazy
 
         # Process specification
         if specification is None:
@@ -813,13 +926,15 @@ class DatReader(ReprMixin):
                 }
             )
 
-        self.table_data = []
-
         # Prepare data section
         self.data_parsed = list()
 
-        for i in range(0, self.table_rows):
-            self.table_data.append(self._process_row(i))
+        if self.lazy:
+            self.table_data = LazyTableData(self)
+        else:
+            self.table_data = []
+            for i in range(0, self.table_rows):
+                self.table_data.append(self._process_row(i))
 
         if self.auto_build_index:
             self.build_index()
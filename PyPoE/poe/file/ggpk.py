@@ -38,6 +38,8 @@ Public API
 
 .. autofunction:: extract_dds
 
+.. autoclass:: DDSResolver
+
 Internal API
 -------------------------------------------------------------------------------
 
@@ -61,6 +63,8 @@ Records
 Miscellaneous
 ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
 
+.. autoclass:: GGPKVerificationResult
+
 .. autoclass:: BaseRecord
 
 .. autoclass:: MixinRecord
@@ -77,6 +81,12 @@ import io
 import struct
 import os
 import re
+import hashlib
+import mmap
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import RLock
 
 # 3rd Party
 try:
@@ -96,12 +106,42 @@ from PyPoE.poe.file.shared import AbstractFileReadOnly, ParserError
 
 __all__ = ['GGPKFile']
 
+# Buffer of the GGPK file used by the verification worker processes
+_verify_buffer = None
+
+# References to other .dds files are short, anything larger is image data
+_DDS_MAX_REFERENCE_LENGTH = 1024
+
+# Maximum number of references followed when resolving a .dds file
+_DDS_MAX_REFERENCES = 16
+
 
 # =============================================================================
 # Functions
 # =============================================================================
 
 
+def _verify_init(path):
+    global _verify_buffer
+    with open(path, 'rb') as f:
+        _verify_buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _verify_files(tasks, buffer=None):
+    """
+    Returns the indexes of the tasks whose data does not match the digest.
+    """
+    if buffer is None:
+        buffer = _verify_buffer
+
+    failed = []
+    with memoryview(buffer) as view:
+        for index, start, length, digest in tasks:
+            if hashlib.sha256(view[start:start+length]).digest() != digest:
+                failed.append(index)
+    return failed
+
+
 def extract_dds(data, path_or_ggpk=None):
     """
     Attempts to extract a .dds from the given data bytes.
@@ -164,7 +204,8 @@ def extract_dds(data, path_or_ggpk=None):
                 '.dds file is a reference, but path_or_ggpk is not specified.'
             )
         elif isinstance(path_or_ggpk, GGPKFile):
-            data = path_or_ggpk.directory[path].record.extract().read()
+            # Uses the cached reference chains and textures
+            return path_or_ggpk.get_dds(path)
         elif isinstance(path_or_ggpk, str):
             with open(os.path.join(path_or_ggpk, path), 'rb') as f:
                 data = f.read()
@@ -177,13 +218,17 @@ def extract_dds(data, path_or_ggpk=None):
             path_or_ggpk=path_or_ggpk,
         )
     else:
-        size = int.from_bytes(data[:4], 'little')
-        dec = brotli.decompress(data[4:])
-        if len(dec) != size:
-            raise ParserError(
-                'Decompressed size does not match size in the header'
-            )
-        return dec
+        return _decompress_dds(data)
+
+
+def _decompress_dds(data):
+    size = int.from_bytes(data[:4], 'little')
+    dec = brotli.decompress(data[4:])
+    if len(dec) != size:
+        raise ParserError(
+            'Decompressed size does not match size in the header'
+        )
+    return dec
 
 # =============================================================================
 # Classes
@@ -771,6 +816,305 @@ class DirectoryNode(object):
             self.record.extract_to(target_directory)
         
 
+class DDSResolver(object):
+    """
+    Resolves and decompresses .dds files of a :class:`GGPKFile`.
+
+    The record a path resolves to after following all references is memoized
+    and the decompressed textures are kept in a least recently used cache
+    bounded by their total size, so repeatedly requested textures (i.e. art
+    shared between many items) are only decompressed once.
+
+    Instances are safe to use from multiple threads.
+
+    Parameters
+    ----------
+    ggpk : GGPKFile
+        GGPKFile instance with the directory build
+    max_size : int
+        Maximum total size in bytes of the cached textures
+    """
+    def __init__(self, ggpk, max_size=2**28):
+        self.ggpk = ggpk
+        self.max_size = max_size
+        self._lock = RLock()
+        # path -> FileRecord holding the image data
+        self._records = {}
+        # record offset -> decompressed data
+        self._cache = OrderedDict()
+        self._size = 0
+
+    def _read(self, record):
+        # A shared buffer can't be read from multiple threads at once
+        if isinstance(self.ggpk._file_path_or_raw, io.BytesIO):
+            with self._lock:
+                return record.extract().read()
+        return record.extract().read()
+
+    def resolve(self, path):
+        """
+        Returns the record holding the image data of the .dds file at the
+        path after following all references.
+
+        Parameters
+        ----------
+        path : str
+            Path of the .dds file
+
+        Returns
+        -------
+        FileRecord
+            The record holding the image data
+
+        Raises
+        ------
+        FileNotFoundError
+            if the path or a referenced path does not exist
+        ParserError
+            if the references are circular or too deeply nested
+        """
+        with self._lock:
+            record = self._records.get(path)
+        if record is not None:
+            return record
+
+        chain = []
+        current = path
+        while True:
+            with self._lock:
+                record = self._records.get(current)
+            if record is not None:
+                break
+
+            chain.append(current)
+            if len(chain) > _DDS_MAX_REFERENCES:
+                raise ParserError(
+                    'Too many references resolving "%s"' % path
+                )
+
+            record = self.ggpk[current].record
+            if record.data_length > _DDS_MAX_REFERENCE_LENGTH:
+                break
+            data = self._read(record)
+            if data[:1] != b'*':
+                break
+            current = data[1:].decode()
+
+        with self._lock:
+            for item in chain:
+                self._records[item] = record
+        return record
+
+    def get(self, path):
+        """
+        Returns the decompressed .dds file at the path.
+
+        Parameters
+        ----------
+        path : str
+            Path of the .dds file
+
+        Returns
+        -------
+        bytes
+            the uncompressed, dereferenced .dds file data
+
+        Raises
+        ------
+        NotImplementedError
+            If the brotli library is not installed
+        FileNotFoundError
+            if the path or a referenced path does not exist
+        ParserError
+            if the references can't be resolved or the decompressed size does
+            not match the size in the header
+        """
+        record = self.resolve(path)
+        with self._lock:
+            data = self._cache.get(record.offset)
+            if data is not None:
+                self._cache.move_to_end(record.offset)
+                return data
+
+        data = self._read(record)
+        if data[:4] != b'DDS ':
+            if brotli is None:
+                raise NotImplementedError(
+                    'brotli library must be installed for this function.\n'
+                    'Visit https://github.com/google/brotli for python '
+                    'packages.'
+                )
+            data = _decompress_dds(data)
+
+        with self._lock:
+            if record.offset not in self._cache and \
+                    len(data) <= self.max_size:
+                self._cache[record.offset] = data
+                self._size += len(data)
+                while self._size > self.max_size:
+                    offset, old = self._cache.popitem(last=False)
+                    self._size -= len(old)
+        return data
+
+    def get_many(self, paths, workers=None):
+        """
+        Resolves and decompresses the .dds files at the given paths
+        concurrently.
+
+        Parameters
+        ----------
+        paths : Iterable[str]
+            Paths of the .dds files
+        workers : int or None
+            Maximum number of threads to use. If None, the default of
+            :class:`concurrent.futures.ThreadPoolExecutor` is used.
+
+        Returns
+        -------
+        dict[str, bytes or Exception]
+            Dictionary of the paths to the decompressed data or to the
+            exception raised when resolving or decompressing them
+        """
+        paths = list(OrderedDict.fromkeys(paths))
+        # Resolve first so paths sharing a texture only decompress it once
+        records = OrderedDict()
+        result = OrderedDict()
+        for path in paths:
+            try:
+                record = self.resolve(path)
+            except (FileNotFoundError, ParserError) as e:
+                result[path] = e
+            else:
+                records.setdefault(record.offset, []).append(path)
+
+        def get(path):
+            try:
+                return self.get(path)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (group, executor.submit(get, group[0]))
+                for group in records.values()
+            ]
+            for group, future in futures:
+                data = future.result()
+                for path in group:
+                    result[path] = data
+
+        return OrderedDict((path, result[path]) for path in paths)
+
+    def clear(self):
+        """
+        Clears the resolved references and cached textures.
+        """
+        with self._lock:
+            self._records.clear()
+            self._cache.clear()
+            self._size = 0
+
+
+class _ProgressReporter(object):
+    """
+    Throttles the calls to a progress callback.
+
+    The callback is only considered every ``step`` units of progress and
+    further limited to at most one call every ``interval`` seconds. The final
+    call made by :meth:`finish` is never skipped.
+    """
+
+    def __init__(self, callback, total, step, interval):
+        self.callback = callback
+        self.total = total
+        self.step = max(int(step), 1)
+        self.interval = interval
+        self._last_time = time.perf_counter()
+        self._next = self.step
+
+    def __call__(self, done):
+        """
+        Reports the progress if due and returns the next progress value at
+        which this should be called again.
+        """
+        self._next = done + self.step
+        if self.interval:
+            now = time.perf_counter()
+            if now - self._last_time < self.interval:
+                return self._next
+            self._last_time = now
+        self.callback(done, self.total)
+        return self._next
+
+    @property
+    def next(self):
+        return self._next
+
+    def finish(self, done):
+        self.callback(done, self.total)
+
+
+class GGPKVerificationResult(object):
+    """
+    Result of :meth:`GGPKFile.verify`.
+
+    Attributes
+    ----------
+    files : int
+        Number of verified files
+    directories : int
+        Number of verified directories
+    size : int
+        Number of verified bytes
+    duration : float
+        Duration of the verification in seconds
+    corrupted_files : list[str]
+        Paths of the files whose data doesn't match their hash
+    corrupted_directories : list[str]
+        Paths of the directories whose hash doesn't match the hashes of their
+        entries
+    """
+    def __init__(self):
+        self.files = 0
+        self.directories = 0
+        self.size = 0
+        self.duration = 0.0
+        self.corrupted_files = []
+        self.corrupted_directories = []
+
+    def __repr__(self):
+        return '%s(files=%s, directories=%s, size=%s, duration=%.2f, ' \
+               'corrupted_files=%s, corrupted_directories=%s)' % (
+            self.__class__.__name__, self.files, self.directories, self.size,
+            self.duration, len(self.corrupted_files),
+            len(self.corrupted_directories),
+        )
+
+    @property
+    def is_valid(self):
+        """
+        Whether no corruption was found
+
+        Returns
+        -------
+        bool
+        """
+        return not self.corrupted_files and not self.corrupted_directories
+
+    @property
+    def throughput(self):
+        """
+        Verified bytes per second
+
+        Returns
+        -------
+        float
+        """
+        if not self.duration:
+            return 0.0
+        return self.size / self.duration
+
+
 class GGPKFile(AbstractFileReadOnly, metaclass=InheritedDocStringsMeta):
     """
     Representation of a .ggpk file.
@@ -789,6 +1133,7 @@ class GGPKFile(AbstractFileReadOnly, metaclass=InheritedDocStringsMeta):
         AbstractFileReadOnly.__init__(self, *args, **kwargs)
         self.directory = None
         self.records = {}
+        self._dds_resolver = None
 
     def __getitem__(self, item):
         """
@@ -951,7 +1296,8 @@ class GGPKFile(AbstractFileReadOnly, metaclass=InheritedDocStringsMeta):
 
         return new_files, deleted_files, changed_files
 
-    def directory_build(self, parent=None):
+    def directory_build(self, parent=None, progress=None, progress_step=2**14,
+                        progress_interval=0):
         """
         Rebuilds the directory or the specified :class:`DirectoryNode`
         If the root directory is rebuild it will be stored in the directory
@@ -961,6 +1307,16 @@ class GGPKFile(AbstractFileReadOnly, metaclass=InheritedDocStringsMeta):
         ----------
         parent : :class:`DirectoryNode` or None
             parent :class:`DirectoryNode`. If None generate the root directory
+        progress : callable or None
+            Called as ``progress(done, total)`` with the number of nodes built
+            so far. The total is the number of file and directory records when
+            building the root directory and None otherwise. Records that are
+            not referenced by any directory are not built, so the final call
+            reports the number of built nodes as total.
+        progress_step : int
+            Minimum number of nodes between two progress calls
+        progress_interval : float
+            Minimum number of seconds between two progress calls
 
 
         Returns
@@ -996,10 +1352,26 @@ class GGPKFile(AbstractFileReadOnly, metaclass=InheritedDocStringsMeta):
         else:
             root = parent
 
+        if progress is None:
+            reporter = None
+            next_report = float('inf')
+        else:
+            total = None
+            if parent is None:
+                total = sum(
+                    1 for record in self.records.values()
+                    if isinstance(record, (DirectoryRecord, FileRecord))
+                ) - 1
+            reporter = _ProgressReporter(
+                progress, total, progress_step, progress_interval
+            )
+            next_report = reporter.next
+
         l = []
         for entry in root.record.entries:
             l.append((entry.offset, entry.hash, root))
 
+        done = 0
         try:
             while True:
                 offset, hash, parent = l.pop()
@@ -1010,12 +1382,143 @@ class GGPKFile(AbstractFileReadOnly, metaclass=InheritedDocStringsMeta):
                 if isinstance(record, DirectoryRecord):
                     for entry in record.entries:
                         l.append((entry.offset, entry.hash, node))
+
+                done += 1
+                if done >= next_report:
+                    next_report = reporter(done)
         except IndexError:
             pass
 
+        if reporter is not None:
+            if reporter.total is not None:
+                reporter.total = done
+            reporter.finish(done)
+
         return root
         
-    def _read(self, buffer, *args, **kwargs):
+    def verify(self, node=None, processes=None, chunk_size=2**26,
+               verify_directories=True):
+        """
+        Verifies the SHA256 hashes of the files and directories in the
+        GGPK file.
+
+        The hash of a file is calculated over its data. The hash of a
+        directory is calculated over the concatenated hashes of its entries in
+        the order they are stored.
+
+        If the GGPK file was read from a file path, the file data is hashed
+        by a pool of processes, each working on a memory map of the file.
+
+        Parameters
+        ----------
+        node : DirectoryNode or str or None
+            :class:`DirectoryNode` or path of the node to verify, including
+            its sub-directories. If None, the entire file is verified.
+        processes : int or None
+            Number of processes to use. If None, the number of CPUs is used.
+            If 1 or if the GGPK file was not read from a file path, the data
+            is hashed in the current process.
+        chunk_size : int
+            Approximate number of bytes each process hashes per task
+        verify_directories : bool
+            Whether to verify the directory hashes
+
+        Returns
+        -------
+        GGPKVerificationResult
+            The verification result
+
+        Raises
+        ------
+        ValueError
+            if directory is not build
+        FileNotFoundError
+            if the node was not found
+        """
+        if self.directory is None:
+            raise ValueError('Directory not build')
+
+        if node is None:
+            node = self.directory
+        elif isinstance(node, str):
+            node = self[node]
+
+        result = GGPKVerificationResult()
+        start_time = time.perf_counter()
+
+        file_nodes = []
+        directory_nodes = []
+
+        def add_node(node, depth):
+            if isinstance(node.record, FileRecord):
+                file_nodes.append(node)
+            elif isinstance(node.record, DirectoryRecord):
+                directory_nodes.append(node)
+
+        node.walk(add_node)
+        # Read the data in the order it is stored in the file
+        file_nodes.sort(key=lambda node: node.record.data_start)
+
+        chunks = [[]]
+        chunk_length = 0
+        for i, file_node in enumerate(file_nodes):
+            record = file_node.record
+            chunks[-1].append((
+                i,
+                record.data_start,
+                record.data_length,
+                record.hash.to_bytes(32, 'big'),
+            ))
+            chunk_length += record.data_length
+            result.size += record.data_length
+            if chunk_length >= chunk_size:
+                chunks.append([])
+                chunk_length = 0
+
+        failed = []
+        path_or_raw = self._file_path_or_raw
+        if isinstance(path_or_raw, str) and processes != 1:
+            with ProcessPoolExecutor(
+                    max_workers=processes,
+                    initializer=_verify_init,
+                    initargs=(path_or_raw, )) as executor:
+                for chunk_failed in executor.map(_verify_files, chunks):
+                    failed.extend(chunk_failed)
+        elif isinstance(path_or_raw, str):
+            with open(path_or_raw, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for chunk in chunks:
+                        failed.extend(_verify_files(chunk, mm))
+        else:
+            if isinstance(path_or_raw, io.BytesIO):
+                path_or_raw = path_or_raw.getbuffer()
+            for chunk in chunks:
+                failed.extend(_verify_files(chunk, path_or_raw))
+
+        result.files = len(file_nodes)
+        result.corrupted_files = sorted(
+            file_nodes[i].get_path() for i in failed
+        )
+
+        if verify_directories:
+            for directory_node in directory_nodes:
+                record = directory_node.record
+                digest = hashlib.sha256(b''.join([
+                    self.records[entry.offset].hash.to_bytes(32, 'big')
+                    for entry in record.entries
+                ])).digest()
+                if digest != record.hash.to_bytes(32, 'big'):
+                    result.corrupted_directories.append(
+                        directory_node.get_path()
+                    )
+            result.directories = len(directory_nodes)
+            result.corrupted_directories.sort()
+
+        result.duration = time.perf_counter() - start_time
+        return result
+
+    def _read(self, buffer, progress=None, progress_step=2**24,
+              progress_interval=0):
         """
         Reads the records from the file into object.records.
         """
@@ -1026,6 +1529,15 @@ class GGPKFile(AbstractFileReadOnly, metaclass=InheritedDocStringsMeta):
         # Reset Pointer
         buffer.seek(0, os.SEEK_SET)
 
+        if progress is None:
+            reporter = None
+            next_report = float('inf')
+        else:
+            reporter = _ProgressReporter(
+                progress, size, progress_step, progress_interval
+            )
+            next_report = reporter.next
+
         while offset < size:
             self._read_record(
                 records=records,
@@ -1033,17 +1545,72 @@ class GGPKFile(AbstractFileReadOnly, metaclass=InheritedDocStringsMeta):
                 offset=offset,
             )
             offset = buffer.tell()
+            if offset >= next_report:
+                next_report = reporter(offset)
         self.records = records
 
-    @doc(prepend=AbstractFileReadOnly.read)
-    def read(self, file_path_or_raw, *args, **kwargs):
-        super(GGPKFile, self).read(file_path_or_raw, *args, **kwargs)
+        if reporter is not None:
+            reporter.finish(size)
+
+    def read(self, file_path_or_raw, progress=None, progress_step=2**24,
+             progress_interval=0):
+        """
+        Reads the records of the .ggpk file. This will reset any existing
+        records; :meth:`directory_build` has to be called afterwards.
+
+        Parameters
+        ----------
+        file_path_or_raw : BytesIO | bytes | str
+            file path, bytes or buffer to read from
+        progress : callable or None
+            Called as ``progress(done, total)`` with the number of bytes read
+            so far and the size of the file. The last call is always made
+            with done equal to total.
+        progress_step : int
+            Minimum number of bytes between two progress calls
+        progress_interval : float
+            Minimum number of seconds between two progress calls
+
+
+        Raises
+        ------
+        TypeError
+            if file_path_or_raw has an invalid type
+        """
+        super(GGPKFile, self).read(
+            file_path_or_raw,
+            progress=progress,
+            progress_step=progress_step,
+            progress_interval=progress_interval,
+        )
         self._file_path_or_raw = file_path_or_raw
+        self._dds_resolver = None
 
     @doc(doc=extract_dds)
     def extract_dds(self, data, path_or_ggpk=None):
         return extract_dds(data, path_or_ggpk=path_or_ggpk or self)
 
+    @property
+    def dds_resolver(self):
+        """
+        Resolver used by :meth:`get_dds` and :meth:`get_dds_many`
+
+        Returns
+        -------
+        DDSResolver
+        """
+        if self._dds_resolver is None:
+            self._dds_resolver = DDSResolver(self)
+        return self._dds_resolver
+
+    @doc(doc=DDSResolver.get)
+    def get_dds(self, path):
+        return self.dds_resolver.get(path)
+
+    @doc(doc=DDSResolver.get_many)
+    def get_dds_many(self, paths, workers=None):
+        return self.dds_resolver.get_many(paths, workers=workers)
+
 
 if __name__ == '__main__':
     import cProfile
@@ -33,6 +33,8 @@ API for common and every day use.
 .. autoclass:: PSGFile
     :inherited-members:
 
+.. autoclass:: PassiveSkillGraph
+
 Internal API
 -------------------------------------------------------------------------------
 
@@ -49,20 +51,21 @@ API for internal use, but still may be useful to work with more directly.
 
 # Python
 import struct
-from collections import OrderedDict
+from array import array
+from collections import OrderedDict, deque
 
 # 3rd-party
 
 # self
 from PyPoE.shared.mixins import ReprMixin
 from PyPoE.poe.file.shared import AbstractFileReadOnly
-from PyPoE.poe.file.dat import DatFile, RelationalReader
+from PyPoE.poe.file.dat import DatFile, DatRecord, RelationalReader
 
 # =============================================================================
 # Globals
 # =============================================================================
 
-__all__ = ['PSGFile']
+__all__ = ['PSGFile', 'PassiveSkillGraph']
 
 PSG_COL = 'PassiveSkillGraphId'
 
@@ -332,6 +335,355 @@ class PSGFile(AbstractFileReadOnly):
     def passive_skills_dat_file(self):
         return self._passive_skills
 
+    def get_graph(self):
+        """
+        Creates a :class:`PassiveSkillGraph` for the read file.
+
+        Returns
+        -------
+        PassiveSkillGraph
+        """
+        return PassiveSkillGraph(self)
+
+
+class PassiveSkillGraph(object):
+    """
+    Compact, undirected adjacency representation of a :class:`PSGFile` for
+    path finding queries.
+
+    Nodes are identified by their passive skill graph id (the
+    PassiveSkillGraphId column of PassiveSkills.dat); methods also accept the
+    respective :class:`PyPoE.poe.file.dat.DatRecord` instances. Internally the
+    nodes are numbered in the order they appear in the file and the edges
+    are stored in compressed sparse row (CSR) form.
+
+    Root passives (class starting nodes) can be reached, but paths can not
+    pass through them unless they are the source of a query. The distances
+    from each root passive are calculated once and cached.
+
+    Attributes
+    ----------
+    node_ids : list[int]
+        Passive skill graph ids of the nodes, by internal index
+    indptr : array.array
+        Offsets of the neighbours of each node into indices
+    indices : array.array
+        Internal indexes of the neighbours of all nodes
+    root_passives : list[int]
+        Passive skill graph ids of the root passives
+    """
+    def __init__(self, psg_file):
+        """
+        Parameters
+        ----------
+        psg_file : PSGFile
+            The read :class:`PSGFile` to create the graph from
+        """
+        self.node_ids = []
+        self._index = {}
+        connections = []
+        for group in psg_file.groups:
+            for node in group.nodes:
+                node_id = self._get_id(node.passive_skill)
+                self._index[node_id] = len(self.node_ids)
+                self.node_ids.append(node_id)
+                connections.append(node.connections)
+
+        neighbours = [set() for i in range(len(self.node_ids))]
+        for i, node_connections in enumerate(connections):
+            for connection in node_connections:
+                j = self._index.get(self._get_id(connection))
+                if j is None or j == i:
+                    continue
+                neighbours[i].add(j)
+                neighbours[j].add(i)
+
+        self.indptr = array('I', [0])
+        self.indices = array('I')
+        for node_neighbours in neighbours:
+            self.indices.extend(sorted(node_neighbours))
+            self.indptr.append(len(self.indices))
+
+        self.root_passives = [
+            self._get_id(node) for node in psg_file.root_passives
+        ]
+        self._roots = frozenset(
+            self._index[node_id] for node_id in self.root_passives
+            if node_id in self._index
+        )
+        self._root_cache = {}
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __contains__(self, node):
+        return self._get_id(node) in self._index
+
+    def _get_id(self, node):
+        if isinstance(node, DatRecord):
+            return node[PSG_COL]
+        return node
+
+    def _get_index(self, node):
+        try:
+            return self._index[self._get_id(node)]
+        except KeyError:
+            raise KeyError('Node "%s" is not in the graph' % node)
+
+    def _bfs(self, sources):
+        distances = array('l', [-1]) * len(self.node_ids)
+        predecessors = array('l', [-1]) * len(self.node_ids)
+        queue = deque()
+        for source in sources:
+            distances[source] = 0
+            queue.append(source)
+
+        indptr = self.indptr
+        indices = self.indices
+        roots = self._roots
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            for neighbour in indices[indptr[current]:indptr[current+1]]:
+                if distances[neighbour] != -1:
+                    continue
+                distances[neighbour] = distance
+                predecessors[neighbour] = current
+                if neighbour not in roots:
+                    queue.append(neighbour)
+
+        return distances, predecessors
+
+    def _search(self, source):
+        if source in self._roots:
+            try:
+                return self._root_cache[source]
+            except KeyError:
+                result = self._bfs((source, ))
+                self._root_cache[source] = result
+                return result
+        return self._bfs((source, ))
+
+    def _path(self, predecessors, distances, target):
+        if distances[target] == -1:
+            return None
+        path = []
+        while target != -1:
+            path.append(self.node_ids[target])
+            target = predecessors[target]
+        path.reverse()
+        return path
+
+    def neighbours(self, node):
+        """
+        Returns the nodes connected to the given node.
+
+        Parameters
+        ----------
+        node : int or DatRecord
+            The node
+
+        Returns
+        -------
+        list[int]
+            passive skill graph ids of the connected nodes
+
+        Raises
+        ------
+        KeyError
+            if the node is not in the graph
+        """
+        i = self._get_index(node)
+        return [
+            self.node_ids[j]
+            for j in self.indices[self.indptr[i]:self.indptr[i+1]]
+        ]
+
+    def distance(self, source, target):
+        """
+        Returns the number of edges on the shortest path between the nodes.
+
+        Parameters
+        ----------
+        source : int or DatRecord
+            The node to start from
+        target : int or DatRecord
+            The node to reach
+
+        Returns
+        -------
+        int or None
+            The distance or None if the target can't be reached
+
+        Raises
+        ------
+        KeyError
+            if a node is not in the graph
+        """
+        return self.distances(source, (target, ))[0]
+
+    def distances(self, source, targets):
+        """
+        Returns the distances from the source to each of the targets.
+
+        Parameters
+        ----------
+        source : int or DatRecord
+            The node to start from
+        targets : Iterable[int or DatRecord]
+            The nodes to reach
+
+        Returns
+        -------
+        list[int or None]
+            The distance to each target or None if it can't be reached
+
+        Raises
+        ------
+        KeyError
+            if a node is not in the graph
+        """
+        distances, predecessors = self._search(self._get_index(source))
+        result = []
+        for target in targets:
+            distance = distances[self._get_index(target)]
+            result.append(None if distance == -1 else distance)
+        return result
+
+    def shortest_path(self, source, target):
+        """
+        Returns a shortest path between the nodes.
+
+        Parameters
+        ----------
+        source : int or DatRecord
+            The node to start from
+        target : int or DatRecord
+            The node to reach
+
+        Returns
+        -------
+        list[int] or None
+            The passive skill graph ids on the path including the source and
+            the target, or None if the target can't be reached
+
+        Raises
+        ------
+        KeyError
+            if a node is not in the graph
+        """
+        return self.shortest_paths(source, (target, ))[0]
+
+    def shortest_paths(self, source, targets):
+        """
+        Returns a shortest path from the source to each of the targets.
+
+        Parameters
+        ----------
+        source : int or DatRecord
+            The node to start from
+        targets : Iterable[int or DatRecord]
+            The nodes to reach
+
+        Returns
+        -------
+        list[list[int] or None]
+            The path to each target as returned by :meth:`shortest_path`
+
+        Raises
+        ------
+        KeyError
+            if a node is not in the graph
+        """
+        distances, predecessors = self._search(self._get_index(source))
+        return [
+            self._path(predecessors, distances, self._get_index(target))
+            for target in targets
+        ]
+
+    def reachable(self, sources, max_distance=None):
+        """
+        Returns the nodes that can be reached from any of the sources.
+
+        Parameters
+        ----------
+        sources : Iterable[int or DatRecord]
+            The nodes to start from
+        max_distance : int or None
+            If specified, only nodes within this distance are returned
+
+        Returns
+        -------
+        set[int]
+            passive skill graph ids of the reachable nodes, including the
+            sources
+
+        Raises
+        ------
+        KeyError
+            if a node is not in the graph
+        """
+        distances, predecessors = self._bfs(
+            [self._get_index(source) for source in sources]
+        )
+        return {
+            self.node_ids[i] for i, distance in enumerate(distances)
+            if distance != -1 and (
+                max_distance is None or distance <= max_distance
+            )
+        }
+
+    def points_to_allocate(self, allocated, targets):
+        """
+        Returns the nodes that need to be allocated to connect the targets to
+        the allocated nodes.
+
+        For a single target this is exact. For multiple targets the targets
+        are connected greedily, closest first, which may use more points than
+        the optimal solution.
+
+        Parameters
+        ----------
+        allocated : Iterable[int or DatRecord]
+            Allocated nodes, usually including the class root passive
+        targets : Iterable[int or DatRecord]
+            The nodes to allocate
+
+        Returns
+        -------
+        list[int] or None
+            passive skill graph ids of the nodes to allocate, in the order
+            they can be allocated, or None if a target can't be reached
+
+        Raises
+        ------
+        KeyError
+            if a node is not in the graph
+        """
+        tree = {self._get_index(node) for node in allocated}
+        remaining = {self._get_index(node) for node in targets} - tree
+        result = []
+        while remaining:
+            distances, predecessors = self._bfs(tree)
+            target = min(remaining, key=lambda i: (
+                distances[i] == -1, distances[i],
+            ))
+            if distances[target] == -1:
+                return None
+
+            path = []
+            while target not in tree:
+                path.append(target)
+                target = predecessors[target]
+            path.reverse()
+
+            for i in path:
+                tree.add(i)
+                result.append(self.node_ids[i])
+            remaining.difference_update(path)
+
+        return result
+
 
 # =============================================================================
 # Functions
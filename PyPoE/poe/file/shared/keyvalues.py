@@ -179,9 +179,9 @@ class AbstractKeyValueSection(dict):
             elif k in self.APPEND_KEYS:
                 if isinstance(v, list):
                     if k in self:
-                        v += self[k]
+                        v = v + self[k]
                     else:
-                        pass
+                        v = list(v)
                 else:
                     if k in self:
                         self[k].append(v)
@@ -193,6 +193,33 @@ class AbstractKeyValueSection(dict):
 
             self[k] = v
 
+    def copy(self, parent=None):
+        """
+        Returns a copy of this section.
+
+        List and hash values are copied as well, so the copy can be modified
+        or merged into without affecting this section.
+
+        Parameters
+        ----------
+        parent : AbstractKeyValueFile or None
+            parent of the copy; if None the parent of this section is used
+
+        Returns
+        -------
+        AbstractKeyValueSection
+            copy of this section
+        """
+        section = self.__class__(
+            parent=self.parent if parent is None else parent,
+            name=self.name,
+        )
+        dict.update(section, (
+            (k, v.copy() if isinstance(v, (list, OrderedDict)) else v)
+            for k, v in self.items()
+        ))
+        return section
+
 
 class AbstractKeyValueFile(AbstractFile, defaultdict):
     """
@@ -208,6 +235,8 @@ class AbstractKeyValueFile(AbstractFile, defaultdict):
 
     _parent_file : AbstractKeyValueFile
 
+    _parent_cache : AbstractKeyValueFileCache
+
     version : None or int
         File format version of the file
     extends : None or str
@@ -258,9 +287,12 @@ class AbstractKeyValueFile(AbstractFile, defaultdict):
         self._parent_dir = None
         self._parent_file = None
         self._parent_ggpk = None
+        self._parent_cache = None
 
         if isinstance(parent_or_base_dir_or_ggpk, AbstractKeyValueFile):
             self._parent_file = parent_or_base_dir_or_ggpk
+        elif isinstance(parent_or_base_dir_or_ggpk, AbstractKeyValueFileCache):
+            self._parent_cache = parent_or_base_dir_or_ggpk
         elif isinstance(parent_or_base_dir_or_ggpk, GGPKFile):
             self._parent_ggpk = parent_or_base_dir_or_ggpk
         elif isinstance(parent_or_base_dir_or_ggpk, str):
@@ -273,7 +305,8 @@ class AbstractKeyValueFile(AbstractFile, defaultdict):
     #
     @property
     def parent_or_base_dir_or_ggpk(self):
-        return self._parent_file or self._parent_dir or self._parent_ggpk
+        return self._parent_file or self._parent_cache or self._parent_dir or \
+            self._parent_ggpk
 
     #
     # Special
@@ -352,6 +385,11 @@ class AbstractKeyValueFile(AbstractFile, defaultdict):
                         'name "%s"' % (self._parent_file.name, extend),
                         ParserWarning,
                     )
+            elif self._parent_cache:
+                # The cache holds the fully merged file already
+                self.merge(
+                    self._parent_cache.get_file(extend + self.EXTENSION)
+                )
             elif self._parent_dir:
                 obj = self.__class__(
                     parent_or_base_dir_or_ggpk=self._parent_dir
@@ -435,17 +473,47 @@ class AbstractKeyValueFile(AbstractFile, defaultdict):
             if k in self:
                 self[k].merge(v)
             else:
-                self[k] = v
+                self[k] = v.copy(parent=self)
+
+    def copy(self):
+        """
+        Returns a copy of this file.
+
+        The sections are copied as well, so the copy can be modified or merged
+        into without affecting this file. This is considerably cheaper than
+        reading the file (and the files it extends) again.
+
+        Returns
+        -------
+        AbstractKeyValueFile
+            copy of this file
+        """
+        f = self.__class__(
+            parent_or_base_dir_or_ggpk=self.parent_or_base_dir_or_ggpk,
+            version=self.version,
+            extends=self.extends,
+        )
+        for k, v in self.items():
+            f[k] = v.copy(parent=f)
+
+        return f
 
 
 class AbstractKeyValueFileCache(AbstractFileCache):
+    """
+    Files read through the cache resolve the files they extend through the
+    cache as well, so shared parent files are only read and merged once.
+
+    The cached files are shared; use :meth:`AbstractKeyValueFile.copy` before
+    modifying or merging into them.
+    """
     FILE_TYPE = AbstractKeyValueFile
 
     @doc(doc=AbstractFileCache._get_file_instance_args)
     def _get_file_instance_args(self, file_name):
         options = super(AbstractKeyValueFileCache, self
                         )._get_file_instance_args(file_name)
-        options['parent_or_base_dir_or_ggpk'] = self._ggpk or self._path
+        options['parent_or_base_dir_or_ggpk'] = self
 
         return options
 # =============================================================================
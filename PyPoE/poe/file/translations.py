@@ -112,6 +112,8 @@ Warning Classes
 import io
 import re
 import os
+import pickle
+import hashlib
 import warnings
 from enum import IntEnum
 from string import ascii_letters
@@ -170,6 +172,9 @@ regex_tokens = re.compile(
 
 _custom_translation_file = None
 
+# Bump whenever the pickled layout of the translation classes changes
+_DISK_CACHE_VERSION = 1
+
 # =============================================================================
 # Warnings
 # =============================================================================
@@ -1290,6 +1295,7 @@ class TranslationFile(AbstractFileReadOnly):
 
     def _read(self, buffer, *args, **kwargs):
         self.translations = []
+        removed = set()
         data = buffer.read().decode('utf-16')
 
         # starts with bom?
@@ -1373,7 +1379,9 @@ class TranslationFile(AbstractFileReadOnly):
 
                 self.translations.append(translation)
                 for translation_id in translation.ids:
-                    self._add_translation_hashed(translation_id, translation)
+                    self._add_translation_hashed(
+                        translation_id, translation, removed
+                    )
 
             elif match.group('no_description'):
                 pass
@@ -1393,6 +1401,8 @@ class TranslationFile(AbstractFileReadOnly):
             # Done, search next
             match = match_next
 
+        self._remove_translations(removed)
+
     def __eq__(self, other):
         if not isinstance(other, TranslationFile):
             return False
@@ -1403,32 +1413,67 @@ class TranslationFile(AbstractFileReadOnly):
 
         return True
 
-    def _add_translation_hashed(self, translation_id, translation):
-        if translation_id in self.translations_hash:
-            for old_translation in self.translations_hash[translation_id]:
-                # Identical, ignore
-                if translation == old_translation:
-                    return
-
-                # Identical ids, but more recent - update
-                if translation.ids == old_translation.ids:
-                    self.translations_hash[translation_id] = [translation, ]
-                    # Attempt to remove the old one if it exists
-                    try:
-                        self.translations.remove(old_translation)
-                    except ValueError as e:
-                        pass
+    def _add_translation_hashed(self, translation_id, translation, removed,
+                                duplicates=None):
+        """
+        Adds the translation to the hash table under the given id.
 
-                    return
+        Translations that are superseded by a more recent translation with
+        identical ids are not removed from :attr:`translations` right away,
+        but are collected in removed to be dropped by
+        :meth:`_remove_translations` in a single pass.
 
-                '''print('Diff for id: %s' % translation_id)
-                translation.diff(other)
-                print('')'''
+        Parameters
+        ----------
+        translation_id : str
+            id to add the translation under
+        translation : Translation
+            the translation to add
+        removed : set[int]
+            set to add the object ids of superseded translations to
+        duplicates : list[str] or None
+            If a list is given, duplicate ids are appended to it instead of
+            emitting a :class:`DuplicateIdentifierWarning` for each
+        """
+        old_translations = self.translations_hash.get(translation_id)
+        if old_translations is None:
+            self.translations_hash[translation_id] = [translation, ]
+            return
+
+        for old_translation in old_translations:
+            # Identical, ignore
+            if translation == old_translation:
+                return
+
+            # Identical ids, but more recent - update
+            if translation.ids == old_translation.ids:
+                self.translations_hash[translation_id] = [translation, ]
+                removed.add(id(old_translation))
+                return
 
-                warnings.warn('Duplicate id "%s"' % translation_id, DuplicateIdentifierWarning)
-                self.translations_hash[translation_id].append(translation)
+        if duplicates is None:
+            warnings.warn(
+                'Duplicate id "%s"' % translation_id,
+                DuplicateIdentifierWarning,
+            )
         else:
-            self.translations_hash[translation_id] = [translation, ]
+            duplicates.append(translation_id)
+        old_translations.append(translation)
+
+    def _remove_translations(self, removed):
+        """
+        Removes the translations with the given object ids from
+        :attr:`translations` in place.
+
+        Parameters
+        ----------
+        removed : set[int]
+            object ids of the translations to remove
+        """
+        if removed:
+            self.translations[:] = [
+                tr for tr in self.translations if id(tr) not in removed
+            ]
 
     def copy(self):
         """
@@ -1447,14 +1492,20 @@ class TranslationFile(AbstractFileReadOnly):
 
         return t
 
-    def merge(self, other):
+    def merge(self, other, summary_warning=False):
         """
         Merges the current translation file with another translation file.
 
+        Translations in other with the same ids as existing translations
+        replace them.
+
         Parameters
         ----------
         other : :class:`TranslationFile`
             other :class:`TranslationFile` object to merge with
+        summary_warning : bool
+            If True, emit a single :class:`DuplicateIdentifierWarning` listing
+            all duplicate ids instead of one warning per duplicate id
 
 
         Returns
@@ -1464,12 +1515,24 @@ class TranslationFile(AbstractFileReadOnly):
 
         if not isinstance(other, TranslationFile):
             TypeError('Wrong type: %s' % type(other))
+        removed = set()
+        duplicates = [] if summary_warning else None
         self.translations += other.translations
-        for trans_id in other.translations_hash:
-            for trans in other.translations_hash[trans_id]:
-                self._add_translation_hashed(trans_id, trans)
+        for trans_id, trans_list in other.translations_hash.items():
+            for trans in trans_list:
+                self._add_translation_hashed(
+                    trans_id, trans, removed, duplicates
+                )
 
-        #self.translations_hash.update(other.translations_hash)
+        self._remove_translations(removed)
+
+        if duplicates:
+            warnings.warn(
+                '%s duplicate ids: %s' % (
+                    len(duplicates), ', '.join(duplicates)
+                ),
+                DuplicateIdentifierWarning,
+            )
 
     def get_translation(self, tags, values, lang='English', full_result=False, use_placeholder=False, only_values=False):
         """
@@ -1668,7 +1731,8 @@ class TranslationFileCache(AbstractFileCache):
     FILE_TYPE = TranslationFile
 
     @doc(prepend=AbstractFileCache.__init__)
-    def __init__(self, *args, merge_with_custom_file=None, **kwargs):
+    def __init__(self, *args, merge_with_custom_file=None, disk_cache_dir=None,
+                 **kwargs):
         """
         Parameters
         ----------
@@ -1677,6 +1741,11 @@ class TranslationFileCache(AbstractFileCache):
             translation file. If set to True, it will load the default
             translation file located in PyPoE's data directory. Alternatively a
             TranslationFile instance can be passed which then will be used.
+        disk_cache_dir : None or str
+            If specified, parsed (and merged) files will be stored in this
+            directory and reloaded from there on subsequent runs, as long as
+            the hashes of the source file, any files it includes and the
+            custom translation file are unchanged.
         """
         if merge_with_custom_file is None or merge_with_custom_file is False:
             self._custom_file = None
@@ -1690,6 +1759,12 @@ class TranslationFileCache(AbstractFileCache):
                 {'type': type(merge_with_custom_file)}
             )
 
+        self._disk_cache_dir = disk_cache_dir
+        self._custom_hash = None
+        self._source_hashes = {}
+        self._dependencies = {}
+        self._dependency_stack = []
+
         # Call order matters here
         super(TranslationFileCache, self).__init__(*args, **kwargs)
 
@@ -1746,17 +1821,204 @@ class TranslationFileCache(AbstractFileCache):
         TranslationFile
             the specified TranslationFile
         """
-        if file_name not in self.files:
-            tf = self._create_instance(file_name=file_name)
+        if file_name in self.files:
+            tf = self.files[file_name]
+        elif self._disk_cache_dir is None:
+            tf = self._create_instance_tracked(file_name)
 
             if self._custom_file:
-                tf.merge(self._custom_file)
+                tf.merge(self._custom_file, summary_warning=True)
 
             self.files[file_name] = tf
+        else:
+            tf = self._get_file_disk_cached(file_name)
+
+        # Files including this file depend on it and everything it includes
+        if self._dependency_stack:
+            self._dependency_stack[-1].update(self._dependencies[file_name])
+
+        return tf
+
+    def get_source_hashes(self, file_name):
+        """
+        Returns the hashes of the sources of the specified file, i.e. of the
+        file itself and of any files it includes.
+
+        Parameters
+        ----------
+        file_name :  str
+            file name/path relative to the root path of exile directory
+
+        Returns
+        -------
+        OrderedDict[str, object]
+            the source file names and the hash digests of their contents
+        """
+        self.get_file(file_name)
+        return OrderedDict(self._dependencies[file_name])
+
+    def _create_instance_tracked(self, file_name):
+        """
+        Creates the instance for the specified file and records the hashes of
+        the file and the files it includes as its dependencies.
+
+        Parameters
+        ----------
+        file_name :  str
+            file name/path relative to the root path of exile directory
+
+        Returns
+        -------
+        TranslationFile
+            the created TranslationFile
+        """
+        dependencies = OrderedDict((
+            (file_name, self._get_source_hash(file_name)),
+        ))
+        self._dependency_stack.append(dependencies)
+        try:
+            tf = self._create_instance(file_name=file_name)
+        finally:
+            self._dependency_stack.pop()
+
+        self._dependencies[file_name] = dependencies
+
+        return tf
+
+    def _get_source_hash(self, file_name):
+        """
+        Returns the hash of the raw source of the specified file.
+
+        Parameters
+        ----------
+        file_name :  str
+            file name/path relative to the root path of exile directory
+
+        Returns
+        -------
+        bytes
+            hash digest of the file contents
+        """
+        if file_name not in self._source_hashes:
+            if self._ggpk:
+                digest = self._ggpk[file_name].record.hash
+            else:
+                with open(os.path.join(self._path, file_name), 'rb') as f:
+                    digest = hashlib.sha256(f.read()).digest()
+            self._source_hashes[file_name] = digest
+
+        return self._source_hashes[file_name]
+
+    def _get_custom_hash(self):
+        """
+        Returns the hash of the custom translation file the files are merged
+        with or None if no custom file is used.
+
+        Returns
+        -------
+        bytes or None
+            hash digest of the custom file
+        """
+        if self._custom_file is None:
+            return None
+
+        if self._custom_hash is None:
+            self._custom_hash = hashlib.sha256(pickle.dumps(
+                self._custom_file, protocol=pickle.HIGHEST_PROTOCOL
+            )).digest()
+
+        return self._custom_hash
+
+    def _get_disk_cache_path(self, file_name):
+        return os.path.join(self._disk_cache_dir, file_name + '.pickle')
+
+    def _read_disk_cache(self, file_name):
+        """
+        Loads the specified file from the disk cache if the cache entry
+        exists and is still valid.
+
+        Parameters
+        ----------
+        file_name :  str
+            file name/path relative to the root path of exile directory
+
+        Returns
+        -------
+        TranslationFile or None
+            the cached TranslationFile or None if it could not be used
+        """
+        try:
+            with open(self._get_disk_cache_path(file_name), 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            warnings.warn(
+                'Failed to load translation cache for "%s": %s' % (
+                    file_name, e),
+                TranslationWarning,
+            )
+            return None
+
+        if entry['version'] != _DISK_CACHE_VERSION:
+            return None
+
+        if entry['custom'] != self._get_custom_hash():
+            return None
+
+        for source_name, digest in entry['sources'].items():
+            try:
+                if self._get_source_hash(source_name) != digest:
+                    return None
+            except (OSError, KeyError):
+                return None
+
+        tf = entry['file']
+        tf._parent = self
+        self._dependencies[file_name] = entry['sources']
+
+        return tf
+
+    def _write_disk_cache(self, file_name, tf):
+        """
+        Writes the specified file to the disk cache.
+
+        Parameters
+        ----------
+        file_name :  str
+            file name/path relative to the root path of exile directory
+        tf : TranslationFile
+            parsed and merged TranslationFile to store
+        """
+        # Don't store a reference to the cache (and thus the ggpk) itself
+        tf = tf.copy()
+        tf._parent = None
+
+        path = self._get_disk_cache_path(file_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({
+                'version': _DISK_CACHE_VERSION,
+                'sources': self._dependencies[file_name],
+                'custom': self._get_custom_hash(),
+                'file': tf,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def _get_file_disk_cached(self, file_name):
+        tf = self._read_disk_cache(file_name)
+        if tf is None:
+            tf = self._create_instance_tracked(file_name)
+
+            if self._custom_file:
+                tf.merge(self._custom_file, summary_warning=True)
+
+            self._write_disk_cache(file_name, tf)
 
-            return tf
+        self.files[file_name] = tf
 
-        return self.files[file_name]
+        return tf
 
 
 # =============================================================================
@@ -0,0 +1,440 @@
+"""
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | PyPoE/poe/sim/crafting.py                                        |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Monte Carlo simulation of sequential mod rolls.
+
+Estimates the outcome of rolling several mods in a row, for example the
+chance of hitting a set of prefixes and suffixes in a number of rolls. The
+rules for rolling a mod are the same as for
+:meth:`PyPoE.poe.sim.mods.SpawnChanceCalculator.spawn_chance`:
+
+* mods of the same CorrectGroup as a rolled mod can not be rolled anymore
+* the tags of a rolled mod are added to the tags used to determine the spawn
+  weights of the remaining mods
+
+The mod list is compiled into numpy arrays once and the roll sequences are
+simulated in batches.
+
+.. warning::
+    This module requires numpy.
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+
+Documentation
+===============================================================================
+
+.. autoclass:: CraftingSimulator
+    :special-members: __init__
+
+.. autoclass:: CraftingResult
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+
+# 3rd-party
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# self
+
+# =============================================================================
+# Globals
+# =============================================================================
+
+__all__ = ['CraftingSimulator', 'CraftingResult']
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class CraftingResult(object):
+    """
+    Result of a :meth:`CraftingSimulator.simulate` run.
+
+    Attributes
+    ----------
+    mod_list : list[DatRecord]
+        The mod list the simulation was based on
+    rolls : numpy.ndarray
+        Array of shape (simulations, rolls) containing the index of the
+        rolled mod in mod_list for every roll. -1 is used when no mod could be
+        rolled anymore.
+    """
+    def __init__(self, mod_list, rolls):
+        """
+        Parameters
+        ----------
+        mod_list : list[DatRecord]
+            The mod list the simulation was based on
+        rolls : numpy.ndarray
+            Array of rolled mod indexes
+        """
+        self.mod_list = mod_list
+        self.rolls = rolls
+        self._mod_index = {mod['Id']: i for i, mod in enumerate(mod_list)}
+
+    def _get_hits(self, mod_ids):
+        hits = []
+        for mod_id in mod_ids:
+            try:
+                index = self._mod_index[mod_id]
+            except KeyError:
+                raise ValueError('Mod "%s" not found in mod list' % mod_id)
+            hits.append((self.rolls == index).any(axis=1))
+
+        if not hits:
+            return np.zeros((0, self.simulations), dtype=bool)
+        return np.array(hits, dtype=bool)
+
+    @property
+    def simulations(self):
+        """
+        Number of simulated roll sequences
+
+        Returns
+        -------
+        int
+        """
+        return self.rolls.shape[0]
+
+    def mod_chances(self):
+        """
+        Calculates how often each mod was rolled.
+
+        Returns
+        -------
+        dict[str, float]
+            Dictionary mapping the mod ids to the fraction of simulations
+            the mod was rolled in.
+        """
+        counts = np.bincount(
+            self.rolls[self.rolls >= 0], minlength=len(self.mod_list)
+        )
+        return {
+            mod['Id']: counts[i]/self.simulations
+            for i, mod in enumerate(self.mod_list)
+        }
+
+    def chance(self, mod_ids, require_all=True):
+        """
+        Calculates the chance that the given mods were rolled.
+
+        Parameters
+        ----------
+        mod_ids : Iterable[str]
+            Ids of the mods to check for
+        require_all : bool
+            If True, all of the mods must have been rolled, otherwise any of
+            the mods is sufficient
+
+        Returns
+        -------
+        float
+            The fraction of simulations matching the condition
+
+        Raises
+        ------
+        ValueError
+            if a mod id is not in the mod list
+        """
+        hits = self._get_hits(mod_ids)
+        if require_all:
+            matched = hits.all(axis=0)
+        else:
+            matched = hits.any(axis=0)
+        return np.count_nonzero(matched)/self.simulations
+
+    def hit_distribution(self, mod_ids):
+        """
+        Calculates the distribution of the number of the given mods rolled.
+
+        Parameters
+        ----------
+        mod_ids : Iterable[str]
+            Ids of the mods to check for
+
+        Returns
+        -------
+        numpy.ndarray
+            Array where the n-th element is the fraction of simulations in
+            which exactly n of the given mods were rolled
+
+        Raises
+        ------
+        ValueError
+            if a mod id is not in the mod list
+        """
+        hits = self._get_hits(mod_ids)
+        counts = np.bincount(hits.sum(axis=0), minlength=hits.shape[0] + 1)
+        return counts/self.simulations
+
+
+class CraftingSimulator(object):
+    """
+    Simulates sequences of mod rolls.
+
+    The spawn weights, groups and tags of the mod list are compiled into numpy
+    arrays when the instance is created, so the same instance can be used
+    for any number of simulations.
+    """
+    def __init__(self, mod_list, tags):
+        """
+        Parameters
+        ----------
+        mod_list : list[DatRecord]
+            The mod list to base the simulation on, usually the result of
+            :func:`PyPoE.poe.sim.mods.generate_spawnable_mod_list`
+        tags : list[str]
+            List of tag identifiers of the object the mods are rolled on
+
+        Raises
+        ------
+        ImportError
+            if numpy is not installed
+        """
+        if np is None:
+            raise ImportError('numpy is required for the crafting simulator')
+
+        self.mod_list = list(mod_list)
+        self.tags = list(tags)
+
+        static_tags = set(self.tags)
+        dynamic_tags = {}
+        groups = {}
+
+        mod_groups = []
+        mod_added_tags = []
+        for mod in self.mod_list:
+            mod_groups.append(groups.setdefault(
+                mod['CorrectGroup'], len(groups)
+            ))
+            added_tags = []
+            for tag in mod['TagsKeys']:
+                if tag['Id'] in static_tags:
+                    continue
+                added_tags.append(dynamic_tags.setdefault(
+                    tag['Id'], len(dynamic_tags)
+                ))
+            mod_added_tags.append(added_tags)
+
+        # Only tags that can be added by rolling a mod can change the spawn
+        # weight during the simulation. The static tags are resolved here,
+        # leaving only the dynamic tags that would take precedence.
+        base_weights = []
+        mod_dynamic_weights = []
+        for mod in self.mod_list:
+            base_weight = 0
+            dynamic_weights = []
+            for i, tag in enumerate(mod['SpawnWeight_TagsKeys']):
+                weight = mod['SpawnWeight_Values'][i]
+                if tag['Id'] in static_tags:
+                    base_weight = weight
+                    break
+                elif tag['Id'] in dynamic_tags:
+                    dynamic_weights.append((dynamic_tags[tag['Id']], weight))
+            base_weights.append(base_weight)
+            mod_dynamic_weights.append(dynamic_weights)
+
+        # Padding uses an extra tag column which is never set
+        self._tag_count = len(dynamic_tags)
+        self._group_count = len(groups)
+        self._mod_groups = np.array(mod_groups, dtype=np.intp)
+        self._base_weights = np.array(base_weights, dtype=np.float64)
+
+        self._added_tags = self._pad(
+            mod_added_tags, self._tag_count, dtype=np.intp,
+        )
+
+        self._dynamic_mods = np.array([
+            i for i, dynamic_weights in enumerate(mod_dynamic_weights)
+            if dynamic_weights
+        ], dtype=np.intp)
+        self._dynamic_index = np.full(len(self.mod_list), -1, dtype=np.intp)
+        self._dynamic_index[self._dynamic_mods] = np.arange(
+            self._dynamic_mods.size
+        )
+        dynamic_weights = [
+            mod_dynamic_weights[i] for i in self._dynamic_mods
+        ]
+        self._dynamic_tags = self._pad(
+            [[tag for tag, weight in row] for row in dynamic_weights],
+            self._tag_count,
+            dtype=np.intp,
+        )
+        self._dynamic_weights = self._pad(
+            [[weight for tag, weight in row] for row in dynamic_weights],
+            0,
+            dtype=np.float64,
+        )
+
+        # Mods are proposed according to the highest weight they can reach
+        # and accepted based on their actual weight (rejection sampling).
+        self._max_weights = self._base_weights.copy()
+        if self._dynamic_mods.size:
+            self._max_weights[self._dynamic_mods] = np.maximum(
+                self._base_weights[self._dynamic_mods],
+                self._dynamic_weights.max(axis=1),
+            )
+        self._max_cumulative = self._max_weights.cumsum()
+
+    def _pad(self, rows, value, dtype):
+        width = max([len(row) for row in rows], default=0)
+        array = np.full((len(rows), width), value, dtype=dtype)
+        for i, row in enumerate(rows):
+            array[i, :len(row)] = row
+        return array
+
+    def _get_weights(self, present):
+        weights = np.broadcast_to(
+            self._base_weights, (present.shape[0], len(self.mod_list))
+        ).copy()
+        if self._dynamic_mods.size:
+            matched = present[:, self._dynamic_tags]
+            has_tag = matched.any(axis=2)
+            first = matched.argmax(axis=2)
+            dynamic = self._dynamic_weights[
+                np.arange(self._dynamic_mods.size), first
+            ]
+            weights[:, self._dynamic_mods] = np.where(
+                has_tag, dynamic, weights[:, self._dynamic_mods]
+            )
+        return weights
+
+    def _get_mod_weights(self, present, taken, rows, mods):
+        weights = self._base_weights[mods]
+        dynamic = self._dynamic_index[mods]
+        is_dynamic = dynamic >= 0
+        if is_dynamic.any():
+            dynamic = dynamic[is_dynamic]
+            matched = present[
+                rows[is_dynamic, None], self._dynamic_tags[dynamic]
+            ]
+            weights[is_dynamic] = np.where(
+                matched.any(axis=1),
+                self._dynamic_weights[dynamic, matched.argmax(axis=1)],
+                weights[is_dynamic],
+            )
+        weights[taken[rows, self._mod_groups[mods]]] = 0
+        return weights
+
+    def _roll_exact(self, rng, present, taken, rows):
+        weights = self._get_weights(present[rows])
+        weights[taken[rows][:, self._mod_groups]] = 0
+        cumulative = weights.cumsum(axis=1)
+        total = cumulative[:, -1]
+
+        rolled = np.full(rows.size, -1, dtype=np.intp)
+        rollable = total > 0
+        target = rng.random(np.count_nonzero(rollable)) * total[rollable]
+        rolled[rollable] = (
+            cumulative[rollable] <= target[:, None]
+        ).sum(axis=1)
+        return rolled
+
+    def _roll(self, rng, present, taken, rows, attempts):
+        rolled = np.full(rows.size, -1, dtype=np.intp)
+        pending = np.arange(rows.size)
+        total = self._max_cumulative[-1]
+
+        for attempt in range(attempts):
+            target = rng.random(pending.size) * total
+            mods = np.searchsorted(self._max_cumulative, target, side='right')
+            weights = self._get_mod_weights(present, taken, rows[pending], mods)
+            accepted = rng.random(pending.size) * self._max_weights[mods] \
+                < weights
+            rolled[pending[accepted]] = mods[accepted]
+            pending = pending[~accepted]
+            if not pending.size:
+                return rolled
+
+        # Fall back to computing all weights for the few remaining rows; this
+        # also catches rows where no mod can be rolled anymore
+        rolled[pending] = self._roll_exact(rng, present, taken, rows[pending])
+        return rolled
+
+    def _simulate_batch(self, rng, rolls, size, attempts):
+        result = np.full((size, rolls), -1, dtype=np.intp)
+        taken = np.zeros((size, self._group_count), dtype=bool)
+        present = np.zeros((size, self._tag_count + 1), dtype=bool)
+        active = np.arange(size)
+
+        for roll in range(rolls):
+            rolled = self._roll(rng, present, taken, active, attempts)
+            rollable = rolled >= 0
+            active = active[rollable]
+            if not active.size:
+                break
+            rolled = rolled[rollable]
+
+            result[active, roll] = rolled
+            taken[active, self._mod_groups[rolled]] = True
+            if self._added_tags.size:
+                present[active[:, None], self._added_tags[rolled]] = True
+                present[:, -1] = False
+
+        return result
+
+    def simulate(self, rolls, simulations=100000, batch_size=100000,
+                 seed=None, attempts=8):
+        """
+        Simulates the given number of roll sequences.
+
+        Parameters
+        ----------
+        rolls : int
+            Number of mods rolled in each sequence
+        simulations : int
+            Number of sequences to simulate
+        batch_size : int
+            Number of sequences simulated at once; larger batches are faster
+            but use more memory
+        seed : int or None
+            Seed for the random number generator to get reproducible results
+        attempts : int
+            Number of rejection sampling attempts for a roll before the
+            weights of all mods are computed for it. The result is exact
+            either way, this only affects speed.
+
+        Returns
+        -------
+        CraftingResult
+            The simulated roll sequences
+        """
+        rng = np.random.default_rng(seed)
+        result = np.full((simulations, rolls), -1, dtype=np.intp)
+        if self._max_cumulative.size and self._max_cumulative[-1] > 0:
+            for start in range(0, simulations, batch_size):
+                size = min(batch_size, simulations - start)
+                result[start:start+size] = self._simulate_batch(
+                    rng, rolls, size, attempts
+                )
+
+        return CraftingResult(self.mod_list, result)
+
+# =============================================================================
+# Functions
+# =============================================================================
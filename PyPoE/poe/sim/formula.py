@@ -38,6 +38,25 @@ Documentation
 .. autofunction:: chance_to_evade
 
 .. autofunction:: gem_stat_requirement
+
+Array functions
+-------------------------------------------------------------------------------
+
+Variants of the above functions that accept numpy arrays (or anything
+convertible to one) and broadcast over them. The results are identical to
+calling the scalar function for each element, except for the chances to hit
+and evade which may differ in the last bits as numpy's power is used.
+
+.. warning::
+    These functions require numpy.
+
+.. autofunction:: armour_damage_reduction_array
+
+.. autofunction:: chance_to_hit_array
+
+.. autofunction:: chance_to_evade_array
+
+.. autofunction:: gem_stat_requirement_array
 """
 # =============================================================================
 # Imports
@@ -46,6 +65,12 @@ Documentation
 # Python
 from enum import Enum
 
+# 3rd-party
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # self
 from PyPoE.shared.mixins import ReprMixin
 
@@ -53,7 +78,17 @@ from PyPoE.shared.mixins import ReprMixin
 # Globals
 # =============================================================================
 
-__all__ = ['GemTypes', 'gem_stat_requirement']
+__all__ = [
+    'GemTypes',
+    'gem_stat_requirement',
+    'armour_damage_reduction',
+    'chance_to_hit',
+    'chance_to_evade',
+    'armour_damage_reduction_array',
+    'chance_to_hit_array',
+    'chance_to_evade_array',
+    'gem_stat_requirement_array',
+]
 
 # =============================================================================
 # Classes
@@ -72,11 +107,41 @@ class GemTypes(Enum):
     support = 1
     active = 2
 
+
+# (a, b) for the linear function used by gem_stat_requirement
+_gem_stat_requirement_coefficients = {
+    GemTypes.active: {
+        # can't find a good a for 8
+        100: (2.1, 7.75),
+        60: (1.325, 8 * 60 / 100),
+        40: (0.924, 8 * 40 / 100),
+    },
+    GemTypes.support: {
+        100: (1.495, 6 * 100 / 100),
+        60: (0.945, 6 * 60 / 100),  # 1.575*0.6
+        40: (0.6575, 6 * 40 / 100),  # 1.64375 * 0.6
+    },
+}
+
 # =============================================================================
 # Functions
 # =============================================================================
 
 
+def _get_gem_stat_requirement_coefficients(gtype):
+    try:
+        return _gem_stat_requirement_coefficients[gtype]
+    except (KeyError, TypeError):
+        raise ValueError(
+            "Invalid gtype '%s'. Valid types are:\n%s" % (gtype, GemTypes)
+        )
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('numpy is required for the array functions')
+
+
 def armour_damage_reduction(armour, damage):
     """
     Calculates the damage reduction from armour.
@@ -187,31 +252,129 @@ def gem_stat_requirement(level, gtype=GemTypes.support, multi=100):
         if multi is unsupported
         if gtype is invalid
     """
-    if gtype == GemTypes.active:
-        b = 8 * multi / 100
-        if multi == 100:
-            a = 2.1
-            # can't find a good a for 8
-            b = 7.75
-        elif multi == 60:
-            a = 1.325
-        elif multi == 40:
-            a = 0.924
-        else:
-            raise ValueError("Unsupported multi '%s'" % multi)
-    elif gtype == GemTypes.support:
-        b = 6 * multi / 100
-        if multi == 100:
-            a = 1.495
-        elif multi == 60:
-            a = 0.945  # 1.575*0.6
-        elif multi == 40:
-            a = 0.6575  # 1.64375 * 0.6
-        else:
-            raise ValueError("Unsupported multi '%s'" % multi)
-    else:
-        raise ValueError("Invalid gtype '%s'. Valid types are:\n%s" % (gtype, GemTypes))
+    coefficients = _get_gem_stat_requirement_coefficients(gtype)
+    try:
+        a, b = coefficients[multi]
+    except KeyError:
+        raise ValueError("Unsupported multi '%s'" % multi)
 
     result = round(level*a+b)
     # Gems seem to have no requirements lower then 14
     return 0 if result < 14 else result
+
+
+def armour_damage_reduction_array(armour, damage):
+    """
+    Array variant of :func:`armour_damage_reduction`.
+
+    Parameters
+    ----------
+    armour : array_like
+        Armour values of the defender
+    damage : array_like
+        Physical damage of the attacker's hit before mitigation
+
+    Returns
+    -------
+    numpy.ndarray
+        damage reduction factors
+    """
+    _require_numpy()
+    armour = np.asarray(armour, dtype=np.float64)
+    damage = np.asarray(damage, dtype=np.float64)
+    return armour / (armour + 10 * damage)
+
+
+def chance_to_hit_array(accuracy, evasion):
+    """
+    Array variant of :func:`chance_to_hit`.
+
+    Parameters
+    ----------
+    accuracy : array_like
+        Accuracy ratings of the attacker
+    evasion : array_like
+        Evasion ratings of the defender
+
+    Returns
+    -------
+    numpy.ndarray
+        chances to hit
+    """
+    _require_numpy()
+    accuracy = np.asarray(accuracy, dtype=np.float64)
+    evasion = np.asarray(evasion, dtype=np.float64)
+    evasion_term = np.power(evasion * 0.25, 0.8)
+    return accuracy / (accuracy + evasion_term)
+
+
+def chance_to_evade_array(accuracy, evasion):
+    """
+    Array variant of :func:`chance_to_evade`.
+
+    Parameters
+    ----------
+    accuracy : array_like
+        Accuracy ratings of the attacker
+    evasion : array_like
+        Evasion ratings of the defender
+
+    Returns
+    -------
+    numpy.ndarray
+        chances to evade
+    """
+    return 1 - chance_to_hit_array(accuracy, evasion)
+
+
+def gem_stat_requirement_array(level, gtype=GemTypes.support, multi=100):
+    """
+    Array variant of :func:`gem_stat_requirement`.
+
+    Level requirements and multipliers are broadcast against each other, so
+    for example the requirements of all levels of a gem for each of its
+    multipliers can be calculated at once.
+
+    Parameters
+    ----------
+    level : array_like
+        Level requirements
+    gtype : GemTypes
+        Type of the gem; i.e. GemTypes.support or GemTypes.active
+    multi : array_like
+        Stat multipliers, i.e. from SkillGems.dat
+
+
+    Returns
+    -------
+    numpy.ndarray
+        calculated stat requirements as integers
+
+
+    Raises
+    ------
+    ValueError
+        if any multi is unsupported
+        if gtype is invalid
+    """
+    _require_numpy()
+    level = np.asarray(level, dtype=np.float64)
+    multi = np.asarray(multi)
+
+    coefficients = _get_gem_stat_requirement_coefficients(gtype)
+    a = np.empty(multi.shape, dtype=np.float64)
+    b = np.empty(multi.shape, dtype=np.float64)
+    for value in np.unique(multi):
+        try:
+            a_value, b_value = coefficients[value.item()]
+        except KeyError:
+            raise ValueError("Unsupported multi '%s'" % value)
+        mask = multi == value
+        a[mask] = a_value
+        b[mask] = b_value
+
+    # np.rint rounds half to even like round
+    result = np.rint(level*a+b).astype(np.int64)
+    # Gems seem to have no requirements lower then 14
+    result[result < 14] = 0
+    return result
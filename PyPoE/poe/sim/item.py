@@ -33,6 +33,10 @@ Documentation
 
 .. autoclass:: ItemParser
 
+.. autoclass:: ItemRecord
+
+.. autofunction:: parse_items
+
 .. autoclass:: ItemSocket
 
 .. autoclass:: ITEM_TYPES
@@ -56,7 +60,7 @@ from PyPoE.poe.file.dat import RelationalReader
 # Globals
 # =============================================================================
 
-__all__ = ['ItemParser']
+__all__ = ['ItemParser', 'ItemRecord', 'parse_items']
 
 # =============================================================================
 # Functions
@@ -82,6 +86,50 @@ def _regex_build_from_handler_dict(handler_dict):
 
     return re.compile('|'.join(conditionals), re.MULTILINE | re.UNICODE)
 
+
+def _iter_item_texts(stream):
+    lines = []
+    for line in stream:
+        line = line.rstrip('\r\n')
+        if line:
+            lines.append(line)
+        elif lines:
+            yield '\n'.join(lines)
+            lines = []
+
+    if lines:
+        yield '\n'.join(lines)
+
+
+def parse_items(items):
+    """
+    Parses many item strings from the CTRL-C command in game.
+
+    Parameters
+    ----------
+    items : Iterable[str] or file-like
+        Item strings to parse. If a file-like object is given, the items are
+        read from it line by line and are expected to be separated by empty
+        lines.
+
+    Yields
+    ------
+    ItemRecord
+        The parsed item for each item string in the given order
+
+    Raises
+    ------
+    ValueError
+        if an item string can not be parsed
+    """
+    if hasattr(items, 'read'):
+        items = _iter_item_texts(items)
+
+    for item_info_string in items:
+        record = ItemRecord()
+        ItemParser._parse(item_info_string, record)
+        yield record
+
 # =============================================================================
 # Classes
 # =============================================================================
@@ -501,6 +549,10 @@ class ItemParser(object):
         re.UNICODE,
     )
 
+    _rarities = {rarity.name_upper: rarity for rarity in RARITY}
+
+    _socket_colours = {colour.char: colour for colour in SOCKET_COLOUR}
+
     def __init__(self, item_info_string):
         """
         Creates a new ItemParser instance and attempts to parse the given
@@ -511,9 +563,13 @@ class ItemParser(object):
         item_info_string : str
             The complete string to parse
         """
-        self._type = None
+        self._parse(item_info_string, self)
 
-        sections = self._re_split.split(item_info_string)
+    @classmethod
+    def _parse(cls, item_info_string, parsed):
+        parsed._type = None
+
+        sections = cls._re_split.split(item_info_string)
         if not sections:
             raise ValueError('No description sections found - malformed input?')
 
@@ -529,132 +585,128 @@ class ItemParser(object):
             return sections[index or (current_sec+offset)].strip('\r\n')
 
         # Header section
-        header = self._split(section())
+        header = cls._split(section())
 
-        self.base_item_name = header[-1]
+        parsed.base_item_name = header[-1]
         if len(header) == 3:
-            self.name = header[1]
+            parsed.name = header[1]
         elif len(header) in (1, 2):
-            self.name = header[-1]
+            parsed.name = header[-1]
         else:
             raise ValueError('Header section is of unsupported length: %s' %
                              len(header))
 
-        self.name = self.name
+        parsed.name = parsed.name
 
         if len(header) != 1:
-            rarity = self._re_rarity.match(header[0])
+            rarity = cls._re_rarity.match(header[0])
             if rarity is None:
                 raise ValueError('No rarity found in the item header')
 
             rarity = rarity.group('rarity')
-            for rarity_const in RARITY:
-                if rarity_const.name_upper == rarity:
-                    self.rarity = rarity_const
-                    self._type = ITEM_TYPES.ITEM
-                    break
+            if rarity in cls._rarities:
+                parsed.rarity = cls._rarities[rarity]
+                parsed._type = ITEM_TYPES.ITEM
 
-            if self._type is None:
+            if parsed._type is None:
                 if rarity == 'Gem':
-                    self._type = ITEM_TYPES.GEM
+                    parsed._type = ITEM_TYPES.GEM
                 elif rarity == 'Currency':
-                    self._type = ITEM_TYPES.CURRENCY
+                    parsed._type = ITEM_TYPES.CURRENCY
                 else:
                     raise ValueError('Unsupported value for "Rarity": %s' % rarity)
-            elif self.rarity == RARITY.MAGIC:
-                self.prefix = None
-                self.suffix = None
+            elif parsed.rarity == RARITY.MAGIC:
+                parsed.prefix = None
+                parsed.suffix = None
 
-                match = self._re_suffix.match(self.base_item_name)
+                match = cls._re_suffix.match(parsed.base_item_name)
                 if match:
-                    self.suffix = match.group('suffix')
-                    self.base_item_name = self.base_item_name.replace(' ' + self.suffix, '')
+                    parsed.suffix = match.group('suffix')
+                    parsed.base_item_name = parsed.base_item_name.replace(' ' + parsed.suffix, '')
 
                 # Can't reliably detect the prefix yet. Will have to do based on
                 # stats
         else:
             # case for MTX items
-            self._type = ITEM_TYPES.CURRENCY
+            parsed._type = ITEM_TYPES.CURRENCY
 
-        is_map = self._re_is_map.search(self.base_item_name)
-        is_jewel = self._re_is_jewel.search(self.base_item_name)
-        is_vaal_fragment = self._re_is_vaal_fragment.search(self.base_item_name)
+        is_map = cls._re_is_map.search(parsed.base_item_name)
+        is_jewel = cls._re_is_jewel.search(parsed.base_item_name)
+        is_vaal_fragment = cls._re_is_vaal_fragment.search(parsed.base_item_name)
 
         increment_sec()
 
         # Base stats sections (not from mods)
         next = section()
-        if self._type == ITEM_TYPES.GEM:
-            next = self._re_split_newline.split(next, 1)
-            self._handle_singular(next[0], 'gem_tags')
+        if parsed._type == ITEM_TYPES.GEM:
+            next = cls._re_split_newline.split(next, 1)
+            cls._handle_singular(parsed, next[0], 'gem_tags')
             next = next[1]
 
-        if self._type in self._stat_handlers:
+        if parsed._type in cls._stat_handlers:
             increment_sec(
-                self._handle_handlers(
+                cls._handle_handlers(
+                    parsed,
                     next,
-                    self._re_stat_handlers[self._type],
-                    self._stat_handlers[self._type]
+                    cls._re_stat_handlers[parsed._type],
+                    cls._stat_handlers[parsed._type]
                 )
             )
 
         # Requirements section
-        if self._re_requirement.match(section()):
+        if cls._re_requirement.match(section()):
             increment_sec(
-                self._handle_handlers(
+                cls._handle_handlers(
+                    parsed,
                     section(),
-                    self._re_requirement_handlers,
-                    self._requirement_handlers,
+                    cls._re_requirement_handlers,
+                    cls._requirement_handlers,
                 )
             )
 
         # Sockets section
-        match = self._re_sockets.match(section())
+        match = cls._re_sockets.match(section())
         if match:
-            self.sockets = []
-            self.links = []
+            parsed.sockets = []
+            parsed.links = []
             last_linked = False
             for i, char in enumerate(
-                    self._re_sockets_split.split(match.group('sockets'))
+                    cls._re_sockets_split.split(match.group('sockets'))
             ):
                 if i % 2 == 0:
-                    found = False
-                    for socket_colour in SOCKET_COLOUR:
-                        if socket_colour.char == char:
-                            found = True
-                            break
-
-                    if not found:
+                    try:
+                        socket_colour = cls._socket_colours[char]
+                    except KeyError:
                         raise ValueError('Unsupported socket colour: %s' % char)
 
-                    self.sockets.append(ItemSocket(i//2, socket_colour))
+                    parsed.sockets.append(ItemSocket(i//2, socket_colour))
 
                     if last_linked:
-                        self.links[-1].append(self.sockets[-1])
+                        parsed.links[-1].append(parsed.sockets[-1])
                 else:
                     if char == ' ':
                         # No links
                         last_linked = False
                     elif char == '-':
                         if not last_linked:
-                            self.links.append([self.sockets[-1], ])
+                            parsed.links.append([parsed.sockets[-1], ])
                         last_linked = True
                     else:
                         raise ValueError('Unsupported link character: %s' % char)
             increment_sec()
         else:
-            self.sockets = None
-            self.links = None
+            parsed.sockets = None
+            parsed.links = None
 
         # Limited to section
-        increment_sec(self._handle_singular(section(), 'limit'))
+        increment_sec(cls._handle_singular(parsed, section(), 'limit'))
 
         # Item level section
-        increment_sec(self._handle_singular(section(), 'item_level'))
+        increment_sec(cls._handle_singular(parsed, section(), 'item_level'))
 
         # Stack size
-        #if self._type == ITEM_TYPES.CURRENCY:
-        #    increment_sec(self._handle_singular(section(), 'stack_size'))
+        #if parsed._type == ITEM_TYPES.CURRENCY:
+        #    increment_sec(cls._handle_singular(parsed, section(), 'stack_size'))
 
         # stats, flavour text and help text would be here.
         # Below this point we're going backwards
@@ -663,89 +715,122 @@ class ItemParser(object):
         last_sec = -1
         if section(index=last_sec) == 'Corrupted':
             last_sec -= 1
-            self.is_corrupted = True
+            parsed.is_corrupted = True
         else:
-            self.is_corrupted = False
+            parsed.is_corrupted = False
 
         # Help text
-        if self._type in (ITEM_TYPES.GEM, ITEM_TYPES.CURRENCY) or is_jewel or is_map or is_vaal_fragment:
-            self.help_text = section(index=last_sec)
+        if parsed._type in (ITEM_TYPES.GEM, ITEM_TYPES.CURRENCY) or is_jewel or is_map or is_vaal_fragment:
+            parsed.help_text = section(index=last_sec)
             last_sec -= 1
 
         # Flavour text
-        if (self._type == ITEM_TYPES.ITEM and self.rarity == RARITY.UNIQUE) or is_vaal_fragment:
-            self.flavour_text = section(index=last_sec)
+        if (parsed._type == ITEM_TYPES.ITEM and parsed.rarity == RARITY.UNIQUE) or is_vaal_fragment:
+            parsed.flavour_text = section(index=last_sec)
             # Unidentified uniques don't have a flavour text, I think setting
             # "Unidentifed" is appropriate, but still have to make sure not to
             # adjust the pointer so stats parsing works.
-            if self.flavour_text != 'Unidentified':
+            if parsed.flavour_text != 'Unidentified':
                 last_sec -= 1
 
         # Implicit section & stats section
         # We should be left at between 0 or 2 sections
         remaining = abs((last_sec + 1) - current_sec)
-        if self._type == ITEM_TYPES.ITEM:
+        if parsed._type == ITEM_TYPES.ITEM:
             if remaining == 0:
-                self.implicit_stats = []
-                self.stats = []
+                parsed.implicit_stats = []
+                parsed.stats = []
             elif remaining == 2:
-                self.implicit_stats = self._re_split_newline.split(section())
-                self.stats = self._re_split_newline.split(section(offset=1))
+                parsed.implicit_stats = cls._re_split_newline.split(section())
+                parsed.stats = cls._re_split_newline.split(section(offset=1))
             elif remaining == 1:
                 # Normal items can't have explicit stats
-                if self.rarity == RARITY.NORMAL:
-                    self.implicit_stats = self._re_split_newline.split(section())
-                    self.stats = []
+                if parsed.rarity == RARITY.NORMAL:
+                    parsed.implicit_stats = cls._re_split_newline.split(section())
+                    parsed.stats = []
                 # And magic/rare/unique items MUST have stats
                 else:
-                    self.implicit_stats = []
-                    self.stats = self._re_split_newline.split(section())
+                    parsed.implicit_stats = []
+                    parsed.stats = cls._re_split_newline.split(section())
             else:
                 raise ValueError('Too many sections (%s) left for item stat parsing.' % remaining)
-        elif self._type == ITEM_TYPES.GEM:
+        elif parsed._type == ITEM_TYPES.GEM:
             if remaining == 0:
-                self.stats = []
+                parsed.stats = []
             elif remaining == 1:
-                self.stats = self._re_split_newline.split(section())
+                parsed.stats = cls._re_split_newline.split(section())
             else:
                 raise ValueError('Too many sections (%s) left for gem stat parsing.' % remaining)
-        elif self._type == ITEM_TYPES.CURRENCY and remaining:
+        elif parsed._type == ITEM_TYPES.CURRENCY and remaining:
             if remaining == 1:
-                self.description = section()
+                parsed.description = section()
             else:
                 raise ValueError('All sections (%s) should be parsed now.' % remaining)
 
         # Do a final pass on the prefix for magic items
-        if self._type == ITEM_TYPES.ITEM and self.rarity == RARITY.MAGIC and ((self.suffix is None and len(self.stats) >= 1) or (self.suffix is not None and len(self.stats) >= 2)):
-            match = self._re_prefix.match(self.base_item_name)
-            self.prefix = match.group('prefix')
-            self.base_item_name = self.base_item_name.replace(self.prefix + ' ', '')
-
-    def _split(self, section):
-        return self._re_split_newline.split(section)
-
-    def _handle_singular(self, string, key):
-        match = self._re_singular[key]['re_compiled'].match(string)
+        if parsed._type == ITEM_TYPES.ITEM and parsed.rarity == RARITY.MAGIC and ((parsed.suffix is None and len(parsed.stats) >= 1) or (parsed.suffix is not None and len(parsed.stats) >= 2)):
+            match = cls._re_prefix.match(parsed.base_item_name)
+            parsed.prefix = match.group('prefix')
+            parsed.base_item_name = parsed.base_item_name.replace(parsed.prefix + ' ', '')
+
+    @classmethod
+    def _split(cls, section):
+        return cls._re_split_newline.split(section)
+
+    @classmethod
+    def _handle_singular(cls, parsed, string, key):
+        match = cls._re_singular[key]['re_compiled'].match(string)
         if match:
-            setattr(self, key, self._re_singular[key]['func'](match.group(key)))
+            setattr(parsed, key, cls._re_singular[key]['func'](match.group(key)))
             return True
 
-        setattr(self, key, None)
+        setattr(parsed, key, None)
         return False
 
-    def _handle_handlers(self, string, regex, handlers):
+    @classmethod
+    def _handle_handlers(cls, parsed, string, regex, handlers):
         for k in handlers:
-            setattr(self, k, None)
+            setattr(parsed, k, None)
+
+        # The replaced strings contain no characters the handlers match on,
+        # so the whole section can be replaced at once
+        if '(' in string:
+            string = cls._re_replace.sub('', string)
 
         found = False
         for match in regex.finditer(string):
             found = True
             setattr(
-                self,
+                parsed,
                 match.lastgroup,
-                handlers[match.lastgroup]['func'](
-                    self._re_replace.sub('', match.group(match.lastgroup))
-                )
+                handlers[match.lastgroup]['func'](match.group(match.lastgroup))
             )
 
-        return found
\ No newline at end of file
+        return found
+
+
+class ItemRecord(object):
+    """
+    Compact result of :func:`parse_items`.
+
+    Holds the same attributes as :class:`ItemParser`, but uses slots rather
+    than an instance dictionary. As with :class:`ItemParser`, attributes that
+    are not applicable to the item are not set.
+    """
+    __slots__ = tuple(sorted(
+        {
+            '_type', 'base_item_name', 'name', 'description', 'flavour_text',
+            'help_text', 'implicit_stats', 'stats', 'prefix', 'suffix',
+            'rarity', 'sockets', 'links', 'is_corrupted',
+        }.union(
+            ItemParser._requirement_handlers,
+            ItemParser._re_singular,
+            *ItemParser._stat_handlers.values()
+        )
+    ))
+
+    def __repr__(self):
+        return 'ItemRecord(%s)' % ', '.join([
+            '%s=%r' % (k, getattr(self, k)) for k in self.__slots__
+            if not k.startswith('_') and hasattr(self, k)
+        ])
@@ -35,6 +35,9 @@ Documentation
 .. autoclass:: SpawnChanceCalculator
     :special-members: __init__
 
+.. autoclass:: SpawnableModTable
+    :special-members: __init__
+
 .. autofunction:: get_translation
 .. autofunction:: get_translation_file_from_domain
 .. autofunction:: get_mod_from_id
@@ -48,11 +51,12 @@ Documentation
 # =============================================================================
 
 # Python
+from bisect import bisect_right
 
 # 3rd-party
 
 # self
-from PyPoE.poe.file.dat import DatRecord
+from PyPoE.poe.file.dat import DatReader, DatRecord
 from PyPoE.poe.file.translations import TranslationFileCache
 from PyPoE.poe.constants import MOD_DOMAIN, MOD_GENERATION_TYPE, MOD_STATS_RANGE
 
@@ -62,6 +66,7 @@ from PyPoE.poe.constants import MOD_DOMAIN, MOD_GENERATION_TYPE, MOD_STATS_RANGE
 
 __all__ = [
     'SpawnChanceCalculator',
+    'SpawnableModTable',
     'generate_spawnable_mod_list',
     'get_mod_from_id',
     'get_spawn_weight',
@@ -85,6 +90,18 @@ _translation_map = {
 class SpawnChanceCalculator(object):
     """
     Class to calculate spawn chances.
+
+    The spawn weights of the mods are computed once and kept per
+    CorrectGroup, so rolling a mod or adding a tag only updates the mods
+    that are affected by it.
+
+    Attributes
+    ----------
+    tags : list[str]
+        List of tag identifiers. Use :meth:`add_tag` to add tags, otherwise
+        the stored spawn weights will not be updated.
+    total_spawn_weight : int
+        Sum of the spawn weights of the mods in the mod list
     """
     def __init__(self, mod_list, tags):
         """
@@ -95,9 +112,90 @@ class SpawnChanceCalculator(object):
         tags : list[str]
             List of tag identifiers
         """
-        self.mod_list = mod_list
         self.tags = tags
-        self.total_spawn_weight = self.get_total_spawn_weight()
+        self.mod_list = mod_list
+
+    def _get_mod_list(self):
+        return [
+            mod for i, mod in enumerate(self._mods)
+            if self._mod_groups[i] in self._group_mods
+        ]
+
+    def _set_mod_list(self, mod_list):
+        self._mods = list(mod_list)
+        self._mod_index = {}
+        self._mod_ids = {}
+        self._mod_groups = []
+        self._mod_spawn_weights = []
+        self._mod_weights = []
+        self._group_mods = {}
+        self._group_weights = {}
+        self._tag_mods = {}
+        self._tag_set = set(self.tags)
+        self.total_spawn_weight = 0
+
+        for i, mod in enumerate(self._mods):
+            spawn_weights = tuple(zip(
+                [tag['Id'] for tag in mod['SpawnWeight_TagsKeys']],
+                mod['SpawnWeight_Values'],
+            ))
+            for tag_id, weight in spawn_weights:
+                self._tag_mods.setdefault(tag_id, []).append(i)
+            weight = self._get_weight(spawn_weights)
+            group = mod['CorrectGroup']
+
+            self._mod_index[id(mod)] = i
+            self._mod_ids.setdefault(mod['Id'], []).append(i)
+            self._mod_groups.append(group)
+            self._mod_spawn_weights.append(spawn_weights)
+            self._mod_weights.append(weight)
+            self._group_mods.setdefault(group, []).append(i)
+            self._group_weights[group] = \
+                self._group_weights.get(group, 0) + weight
+            self.total_spawn_weight += weight
+
+    mod_list = property(
+        fget=_get_mod_list,
+        fset=_set_mod_list,
+        doc="""
+        List of mods that can still be rolled.
+
+        Setting the list will recompute the stored spawn weights.
+        """
+    )
+
+    def _get_weight(self, spawn_weights):
+        for tag_id, weight in spawn_weights:
+            if tag_id in self._tag_set:
+                return weight
+        return 0
+
+    def add_tag(self, tag_id):
+        """
+        Adds the given tag and updates the spawn weights of the mods that
+        have a spawn weight for it.
+
+        Parameters
+        ----------
+        tag_id : str
+            The tag identifier to add
+        """
+        self.tags.append(tag_id)
+        if tag_id in self._tag_set:
+            return
+        self._tag_set.add(tag_id)
+
+        for i in self._tag_mods.get(tag_id, ()):
+            group = self._mod_groups[i]
+            if group not in self._group_mods:
+                continue
+
+            weight = self._get_weight(self._mod_spawn_weights[i])
+            difference = weight - self._mod_weights[i]
+            if difference:
+                self._mod_weights[i] = weight
+                self._group_weights[group] += difference
+                self.total_spawn_weight += difference
 
     def get_total_spawn_weight(self):
         """
@@ -109,8 +207,11 @@ class SpawnChanceCalculator(object):
             Sum of spawn weights
         """
         total_spawn_weight = 0
-        for mod in self.mod_list:
-            total_spawn_weight += self.get_spawn_weight(mod)
+        for indexes in self._group_mods.values():
+            for i in indexes:
+                total_spawn_weight += self._get_weight(
+                    self._mod_spawn_weights[i]
+                )
 
         return total_spawn_weight
 
@@ -133,7 +234,10 @@ class SpawnChanceCalculator(object):
         --------
         :func:`get_mod_from_id`
         """
-        return get_mod_from_id(mod_id, self.mod_list)
+        for i in self._mod_ids.get(mod_id, ()):
+            if self._mod_groups[i] in self._group_mods:
+                return self._mods[i]
+        return None
 
     def get_spawn_weight(self, mod):
         """
@@ -158,7 +262,10 @@ class SpawnChanceCalculator(object):
         :func:`get_spawn_weight`
 
         """
-        return get_spawn_weight(mod, self.tags)
+        i = self._mod_index.get(id(mod))
+        if i is not None and self._mod_groups[i] in self._group_mods:
+            return self._mod_weights[i]
+        return get_spawn_weight(mod, self._tag_set)
 
     def spawn_chance(self, mod_or_id, remove=True):
         """
@@ -206,21 +313,127 @@ class SpawnChanceCalculator(object):
         chance = weight/self.total_spawn_weight
 
         if remove:
-            mods = []
+            group = mod['CorrectGroup']
+            if self._group_mods.pop(group, None) is not None:
+                self.total_spawn_weight -= self._group_weights.pop(group)
 
-            for m in self.mod_list:
-                if m['CorrectGroup'] == mod['CorrectGroup']:
-                    continue
+            for tag in mod['TagsKeys']:
+                self.add_tag(tag['Id'])
 
-                mods.append(m)
+        return chance
 
-            self.mod_list = mods
 
-            for tag in mod['TagsKeys']:
-                self.tags.append(tag['Id'])
+class SpawnableModTable(object):
+    """
+    Precomputed table for looking up the spawnable mods of many objects.
 
-            self.total_spawn_weight = self.get_total_spawn_weight()
-        return chance
+    The mods are bucketed by domain and generation type once. The spawnable
+    mods of a bucket are computed once per set of tags and sorted by level,
+    so a lookup only has to bisect for the level.
+
+    This yields the same mods as :func:`generate_spawnable_mod_list`, but
+    ordered by level (and by their order in the mod file for the same
+    level).
+    """
+    def __init__(self, mod_dat_file):
+        """
+        Parameters
+        ----------
+        mod_dat_file : `DatFile`
+            The mods to build the table from, i.e. the Mods.dat reader or
+            any list of mods
+        """
+        self._buckets = {}
+        for mod in mod_dat_file:
+            spawn_weights = tuple(zip(
+                [tag['Id'] for tag in mod['SpawnWeight_TagsKeys']],
+                mod['SpawnWeight_Values'],
+            ))
+            self._buckets.setdefault(
+                (mod['Domain'], mod['GenerationType']), []
+            ).append((mod['Level'], mod, spawn_weights))
+
+        for bucket in self._buckets.values():
+            # sort is stable, so the file order is kept for the same level
+            bucket.sort(key=lambda row: row[0])
+
+        self._cache = {}
+
+    def clear_cache(self):
+        """
+        Clears the cached spawnable mods of all tag sets.
+        """
+        self._cache.clear()
+
+    def _get_spawnable(self, domain, generation_type, tags):
+        key = (domain, generation_type, tags)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        levels = []
+        mods = []
+        for level, mod, spawn_weights in self._buckets.get(
+                (domain, generation_type), ()):
+            for tag_id, weight in spawn_weights:
+                if tag_id in tags:
+                    # Same condition as generate_spawnable_mod_list
+                    if weight != 0:
+                        levels.append(level)
+                        mods.append(mod)
+                    break
+
+        self._cache[key] = levels, mods
+        return levels, mods
+
+    def get_spawnable_mod_list(self, domain, generation_type, level=1,
+                               tags=('default', )):
+        """
+        Returns the modifiers that can be spawned for the specified
+        parameters.
+
+        Parameters
+        ----------
+        domain : MOD_DOMAIN
+            The mod domain
+        generation_type : MOD_GENERATION_TYPE
+            The mod generation type
+        level : int
+            The level of object to the mod would be spawned on
+        tags : Iterable[str]
+            Tags for this object
+
+
+        Returns
+        -------
+        list[DatRecord]
+            Returns a list of applicable mod rows that have a spawn weighting
+            above 0, sorted by level.
+
+
+        Raises
+        ------
+        TypeError
+            if domain is not a valid MOD_DOMAIN constant
+            if generation_type is not a valid MOD_GENERATION_TYPE constant
+
+        See Also
+        --------
+        :func:`generate_spawnable_mod_list`
+        """
+        if not isinstance(domain, MOD_DOMAIN):
+            raise TypeError('domain must be a MOD_DOMAIN instance.')
+
+        if not isinstance(generation_type, MOD_GENERATION_TYPE):
+            raise TypeError(
+                'generation_type must be a MOD_GENERATION_TYPE instance.'
+            )
+
+        levels, mods = self._get_spawnable(
+            domain, generation_type, frozenset(tags)
+        )
+        return mods[:bisect_right(levels, level)]
 
 
 # =============================================================================
@@ -300,8 +513,10 @@ def get_mod_from_id(mod_id, mod_list):
     ----------
     mod_id : str
         The mod identifier to look for
-    mod_list : list[DatRecord]
-        List of mods to search in (or dat file)
+    mod_list : list[DatRecord] or DatReader
+        List of mods to search in (or dat file). The index of the Id column
+        of a :class:`PyPoE.poe.file.dat.DatReader` is used and built if
+        necessary.
 
 
     Returns
@@ -309,6 +524,11 @@ def get_mod_from_id(mod_id, mod_list):
     DatRecord or None
         Returns the mod if found, None otherwise
     """
+    if isinstance(mod_list, DatReader) and 'Id' in mod_list.columns_unique:
+        if 'Id' not in mod_list.index:
+            mod_list.build_index('Id')
+        return mod_list.index['Id'].get(mod_id)
+
     for mod in mod_list:
         if mod['Id'] == mod_id:
             return mod
@@ -381,6 +601,10 @@ def generate_spawnable_mod_list(
     TypeError
         if domain is not a valid MOD_DOMAIN constant
         if generation_type is not a valid MOD_GENERATION_TYPE constant
+
+    See Also
+    --------
+    :class:`SpawnableModTable` for repeated lookups on the same mod file
     """
     if not isinstance(domain, MOD_DOMAIN):
         raise TypeError('domain must be a MOD_DOMAIN instance.')
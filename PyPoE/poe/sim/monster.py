@@ -39,13 +39,14 @@ Interal API
 # =============================================================================
 
 # Python
-from collections import Iterable
+from collections.abc import Iterable
 
 # 3rd-party
 
 # self
 from PyPoE.poe.constants import RARITY
-from PyPoE.poe.file import RelationalReader, OTFileCache
+from PyPoE.poe.file.dat import RelationalReader
+from PyPoE.poe.file.ot import OTFileCache
 
 # =============================================================================
 # Globals
@@ -62,12 +63,14 @@ class Monster():
     def __init__(self, parent, mv):
         self.parent = parent
         self._mv = mv
-        self._mt = self.mv['MonsterTypesKey']
-        self._res = self.mt['MonsterResistancesKey']
-        self._ge = self.mv['GrantedEffectsKeys']
-        self._gepl = [gepl for gepl in parent.rr['GrantedEffectsPerLevel.dat']
-                     if gepl['GrantedEffectsKey'] == self._ge]
-        self._mods = self.mv['ModsKeys']
+        self._mt = self._mv['MonsterTypesKey']
+        self._res = self._mt['MonsterResistancesKey']
+        self._ge = self._mv['GrantedEffectsKeys']
+        self._gepl = [
+            gepl for ge in self._ge
+            for gepl in parent.get_granted_effect_levels(ge).values()
+        ]
+        self._mods = self._mv['ModsKeys']
 
         self._level = None
 
@@ -118,7 +121,7 @@ class MonsterFactory():
             raise ValueError('relational_reader must be a RelationalReader '
                              'instance')
         if isinstance(otfile_cache, OTFileCache):
-            self.ot = otcache
+            self.ot = otfile_cache
         else:
             raise ValueError('otfile_cache must be a OTFileCache instance.')
 
@@ -137,6 +140,82 @@ class MonsterFactory():
             elif mod['Id'].startswith('MonsterUnique'):
                 self.rarity_mods[RARITY.UNIQUE] = mod
 
+        self._gepl_index = {}
+        for gepl in self.rr['GrantedEffectsPerLevel.dat']:
+            ge = gepl['GrantedEffectsKey']
+            if ge is None:
+                continue
+            self._gepl_index.setdefault(ge.rowid, {})[gepl['Level']] = gepl
+
+    def get_granted_effect_levels(self, granted_effect):
+        """
+        Returns the GrantedEffectsPerLevel.dat rows of the given granted
+        effect.
+
+        Parameters
+        ----------
+        granted_effect : DatRecord
+            GrantedEffects.dat row
+
+        Returns
+        -------
+        dict[int, DatRecord]
+            Dictionary mapping the level to the GrantedEffectsPerLevel.dat row
+        """
+        return self._gepl_index.get(granted_effect.rowid, {})
+
+    def get_granted_effect_per_level(self, granted_effect, level):
+        """
+        Returns the GrantedEffectsPerLevel.dat row of the given granted effect
+        at the given level.
+
+        Parameters
+        ----------
+        granted_effect : DatRecord
+            GrantedEffects.dat row
+        level : int
+            Level of the granted effect
+
+        Returns
+        -------
+        DatRecord or None
+            GrantedEffectsPerLevel.dat row if found, None otherwise
+        """
+        return self.get_granted_effect_levels(granted_effect).get(level)
+
+    def monsters(self, varieties=None, *args, **kwargs):
+        """
+        Creates Monster instances for the given MonsterVarieties.dat rows.
+
+        The GrantedEffectsPerLevel.dat rows are shared through the index of
+        this instance, so this is suitable for creating monsters for every
+        monster variety.
+
+        Parameters
+        ----------
+        varieties : Iterable[DatRecord] or None
+            MonsterVarieties.dat rows to create monsters for. If None, all
+            rows will be used.
+        args : Iterable
+            Extra positional arguments to pass to the Monster instance
+        kwargs : dict
+            Extra keyword arguments to pass to the Monster instance
+
+        Returns
+        -------
+        list[Monster]
+            List of Monster instances.
+        """
+        if varieties is None:
+            varieties = self.rr['MonsterVarieties.dat']
+
+        return [Monster(
+            *args,
+            parent=self,
+            mv=m,
+            **kwargs
+        ) for m in varieties]
+
     def monster(self, rowid=None, metaid=None, name=None, *args, **kwargs):
         """
         Creates a list of Monster instances and returns them based on the
@@ -179,12 +258,7 @@ class MonsterFactory():
             raise ValueError('One of rowid, metaid or name must be specified '
                              'and be of the correct type')
 
-        return [Monster(
-            *args,
-            parent=self,
-            mv=m,
-            **kwargs
-        ) for m in mv]
+        return self.monsters(mv, *args, **kwargs)
 
 # =============================================================================
 # Functions
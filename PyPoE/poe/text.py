@@ -28,6 +28,8 @@ Documentation
 .. autoclass:: Tag
 
 .. autofunction:: parse_description_tags
+
+.. autofunction:: parse_description_tags_batch
 """
 
 # =============================================================================
@@ -36,7 +38,6 @@ Documentation
 
 # Python
 import re
-from functools import partial
 
 # 3rd-party
 
@@ -47,7 +48,17 @@ from PyPoE.shared.mixins import ReprMixin
 # Globals
 # =============================================================================
 
-__all__ = ['Tag', 'parse_description_tags']
+__all__ = ['Tag', 'parse_description_tags', 'parse_description_tags_batch']
+
+_re_description_tokens = re.compile(
+    r'(?P<lt><)'
+    r'|(?P<gt>>)'
+    r'|(?P<lbrace>\{)'
+    r'|(?P<rbrace>\})'
+    r'|(?P<colon>:)'
+    r'|(?P<text>[^<>\{\}:]+)',
+    re.UNICODE | re.MULTILINE
+)
 
 # =============================================================================
 # Classes
@@ -169,19 +180,6 @@ def parse_description_tags(text):
     Tag
         the parsed text as Tag class (with no id)
     """
-    def f(scanner, result, tid):
-        return tid, scanner.match, result
-
-    scanner = re.Scanner([
-        (r'<', partial(f, tid='lt')),
-        (r'>', partial(f, tid='gt')),
-        (r'\{', partial(f, tid='lbrace')),
-        (r'\}', partial(f, tid='rbrace')),
-        (r':', partial(f, tid='colon')),
-        (r'[^<>\{\}:]+', partial(f, tid='text')),
-
-    ], re.UNICODE | re.MULTILINE)
-
     in_tag = [False]
     in_text = [True]
     parameter = [False]
@@ -189,7 +187,9 @@ def parse_description_tags(text):
     out = Tag(id=None)
     last = out
 
-    for tid, match, text in scanner.scan(text)[0]:
+    for match in _re_description_tokens.finditer(text):
+        tid = match.lastgroup
+        text = match.group()
         if tid == 'lt':
             depth += 1
             in_tag.append(True)
@@ -227,4 +227,24 @@ def parse_description_tags(text):
                 else:
                     last.children.append(text)
 
-    return out
\ No newline at end of file
+    return out
+
+
+def parse_description_tags_batch(texts):
+    """
+    Parses multiple texts containing description tags.
+
+    Equivalent to calling :func:`parse_description_tags` for each text.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        The texts to parse
+
+    Returns
+    -------
+    list[Tag]
+        the parsed texts as Tag classes (with no id) in the order of the
+        given texts
+    """
+    return [parse_description_tags(text) for text in texts]
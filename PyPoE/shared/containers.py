@@ -36,7 +36,8 @@ from collections.abc import Iterable
 # Globals
 # =============================================================================
 
-__all__ = ['Record', 'TypedContainerMeta', 'TypedContainerMixin', 'TypedList']
+__all__ = ['LazyTreeIndex', 'Record', 'TypedContainerMeta',
+           'TypedContainerMixin', 'TypedList']
 
 # =============================================================================
 # Classes
@@ -139,4 +140,115 @@ class TypedList(list, TypedContainerMixin):
 
     def insert(self, index, p_object):
         self._is_acceptable(p_object)
-        list.insert(self, p_object)
\ No newline at end of file
+        list.insert(self, p_object)
+
+
+class LazyTreeIndex(object):
+    """
+    Row bookkeeping for tree models that expose the children of a node
+    lazily.
+
+    The children of a node are sorted once when they are first accessed and
+    the row of every child below its parent is cached. Only the first
+    fetch_size children are exposed initially; more are exposed in chunks of
+    fetch_size by :meth:`fetch_more`.
+
+    Parameters
+    ----------
+    get_children : callable
+        Returns the unsorted children of a node
+    key : callable or None
+        Sort key for the children; if None the order is kept
+    fetch_size : int
+        Number of children to expose at once
+    """
+
+    def __init__(self, get_children, key=None, fetch_size=1000):
+        self.get_children = get_children
+        self.key = key
+        self.fetch_size = fetch_size
+        # id(node) -> sorted children of the node
+        self._children = {}
+        # id(node) -> number of exposed children
+        self._fetched = {}
+        # id(node) -> row of the node below its parent
+        self._rows = {}
+
+    def children(self, node):
+        """
+        Returns
+        -------
+        list
+            The sorted children of the node
+        """
+        try:
+            return self._children[id(node)]
+        except KeyError:
+            pass
+
+        children = list(self.get_children(node))
+        if self.key is not None:
+            children.sort(key=self.key)
+        for row, child in enumerate(children):
+            self._rows[id(child)] = row
+        self._children[id(node)] = children
+        self._fetched[id(node)] = min(len(children), self.fetch_size)
+        return children
+
+    def row(self, node):
+        """
+        Returns
+        -------
+        int
+            The row of the node below its parent; 0 for nodes whose parent's
+            children have not been accessed, i.e. the root
+        """
+        return self._rows.get(id(node), 0)
+
+    def fetched(self, node):
+        """
+        Returns
+        -------
+        int
+            The number of exposed children of the node
+        """
+        self.children(node)
+        return self._fetched[id(node)]
+
+    def can_fetch_more(self, node):
+        """
+        Returns
+        -------
+        bool
+            Whether the node has children that are not exposed yet
+        """
+        return self.fetched(node) < len(self.children(node))
+
+    def next_fetch(self, node):
+        """
+        Returns
+        -------
+        tuple[int, int] or None
+            The first and last row :meth:`fetch_more` will expose, or None if
+            all children are exposed
+        """
+        fetched = self.fetched(node)
+        count = min(len(self.children(node)) - fetched, self.fetch_size)
+        if count <= 0:
+            return None
+        return fetched, fetched + count - 1
+
+    def fetch_more(self, node):
+        """
+        Exposes the next chunk of children.
+
+        Returns
+        -------
+        tuple[int, int] or None
+            The first and last row exposed, or None if all children were
+            already exposed
+        """
+        rows = self.next_fetch(node)
+        if rows is not None:
+            self._fetched[id(node)] = rows[1] + 1
+        return rows
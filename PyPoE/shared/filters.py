@@ -0,0 +1,175 @@
+"""
+Table filters
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | PyPoE/shared/filters.py                                          |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Filters for the values of table columns and the evaluation of these filters
+over the rows of a table.
+
+The UI counterparts in :mod:`PyPoE.ui.shared.proxy_filter_model` extend these
+with their settings widgets.
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import re
+
+# =============================================================================
+# Globals
+# =============================================================================
+
+__all__ = ['AbstractFilter', 'RegexFilter', 'TypedFilter', 'filter_rows']
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+
+class AbstractFilter(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def apply(self, value):
+        return True
+
+    def apply_many(self, values):
+        """
+        Applies the filter to each of the values.
+
+        Parameters
+        ----------
+        values : list
+            values to filter
+
+        Returns
+        -------
+        list[bool]
+            whether the value at the same position was accepted
+        """
+        apply = self.apply
+        return [apply(value) for value in values]
+
+
+class RegexFilter(AbstractFilter):
+    def __init__(self, value, flags=0):
+        self.value = value
+        self.flags = flags
+        self.regex = re.compile(value, flags)
+
+    def __repr__(self):
+        return '%s(value=%s, flags=%s)' % (
+            self.__class__.__name__, self.value, self.flags
+        )
+
+    def apply(self, value):
+        return self.regex.match(str(value)) is not None
+
+    def apply_many(self, values):
+        match = self.regex.match
+        return [match(str(value)) is not None for value in values]
+
+
+class TypedFilter(AbstractFilter):
+    operations = ('lt', 'le', 'eq', 'ne', 'ge', 'gt')
+    types = (int, float, str)
+
+    def __init__(self, value, operation, type):
+        if type not in self.types:
+            raise TypeError('"%s" is not a valid type.' % type)
+        self.type = type
+
+        self.value = self.type(value)
+
+        if operation not in self.operations:
+            raise ValueError('"%s" is not a valid operation.' % operation)
+
+        self.operation = operation
+        # will raise an exception accordingly
+        self._operation_func = getattr(self.type, '__' + operation + '__')
+
+    def __repr__(self):
+        return '%s(value=%s, operation=%s, type=%s)' % (
+            self.__class__.__name__, self.value, self.operation, self.type
+        )
+
+    def apply(self, value):
+        try:
+            return self._operation_func(self.type(value), self.value)
+        except (ValueError, TypeError):
+            return False
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def filter_rows(filters, row_count, get_values, chunk_size=4096,
+                cancelled=None):
+    """
+    Evaluates the filters over the rows of a table.
+
+    The rows are processed in chunks; for each chunk the values of a column
+    are retrieved at once and each filter of the column is applied to the
+    values of the rows that are still accepted.
+
+    Parameters
+    ----------
+    filters : list[tuple[int, list[AbstractFilter]]]
+        pairs of a column and the filters for that column; a row is accepted
+        if all filters accept its value
+    row_count : int
+        number of rows of the table
+    get_values : callable
+        called with a column and a sequence of rows, must return the values
+        of the column for those rows
+    chunk_size : int
+        number of rows to process at once
+    cancelled : callable or None
+        called before each chunk, if it returns True the evaluation is
+        stopped
+
+    Returns
+    -------
+    frozenset[int] or None
+        the accepted rows, or None if cancelled
+    """
+    accepted = []
+    for start in range(0, row_count, chunk_size):
+        if cancelled is not None and cancelled():
+            return None
+
+        rows = range(start, min(start + chunk_size, row_count))
+        for column, column_filters in filters:
+            values = get_values(column, rows)
+            for filter in column_filters:
+                mask = filter.apply_many(values)
+                rows = [row for row, ok in zip(rows, mask) if ok]
+                values = [value for value, ok in zip(values, mask) if ok]
+            if not rows:
+                break
+        accepted.extend(rows)
+
+    return frozenset(accepted)
@@ -20,6 +20,10 @@ Description
 A pure python implementation of the MurmurHash2 algorithm by Austin Appleby.
 See also: https://code.google.com/p/smhasher/wiki/MurmurHash
 
+:func:`murmur2_32_batch` hashes many byte strings at once. If numpy is
+installed the hashes are computed vectorized, otherwise it falls back to
+:func:`murmur2_32`.
+
 Agreement
 ===============================================================================
 
@@ -32,6 +36,11 @@ See PyPoE/LICENSE
 
 import struct
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # =============================================================================
 #  Globals & Constants
 # =============================================================================
@@ -44,6 +53,10 @@ R = 24
 
 int32 = 0xFFFFFFFF
 
+# Number of byte strings hashed at once by the vectorized batch function to
+# limit the size of the padded block array
+BATCH_CHUNK_SIZE = 2**16
+
 # =============================================================================
 # Functions
 # =============================================================================
@@ -63,22 +76,17 @@ def murmur2_32(byte_data, seed=DEFAULT_SEED):
     h = (seed ^ length) & int32
 
     # Mix 4 bytes at a time into the hash
-    index = 0
-
-    while length >= 4:
-        k = struct.unpack('<i', byte_data[index:index+4])[0]
-
+    index = length & ~3
+    for k, in struct.iter_unpack('<I', byte_data[:index]):
         k = k * M & int32
-        k = k ^ (k >> R & int32)
+        k = k ^ (k >> R)
         k = k * M & int32
 
         h = h * M & int32
-        h = (h ^ k) & int32
-
-        index += 4
-        length -= 4
+        h = h ^ k
 
     # Handle the last few bytes of the input array
+    length &= 3
     if length >= 3:
         h = (h ^ byte_data[index+2] << 16) & int32
     if length >= 2:
@@ -93,4 +101,66 @@ def murmur2_32(byte_data, seed=DEFAULT_SEED):
     h = h * M & int32
     h = h ^ (h >> 15 & int32)
 
-    return h
\ No newline at end of file
+    return h
+
+
+def _murmur2_32_vectorized(byte_datas, seed):
+    lengths = np.array([len(byte_data) for byte_data in byte_datas])
+    blocks = lengths >> 2
+    # Sort by number of blocks (descending), so the rows that still have
+    # blocks to mix are always at the start
+    order = np.argsort(-blocks, kind='stable')
+    lengths = lengths[order]
+    blocks = blocks[order]
+
+    width = (int(blocks[0]) + 1) * 4
+    data = np.frombuffer(b''.join([
+        byte_datas[i].ljust(width, b'\0') for i in order.tolist()
+    ]), dtype='<u4').reshape(len(byte_datas), width // 4).astype(np.uint32)
+
+    m = np.uint32(M)
+    h = (np.uint32(seed & int32) ^ lengths.astype(np.uint32))
+
+    # Number of rows having at least j+1 blocks
+    counts = np.searchsorted(-blocks, -np.arange(int(blocks[0])), side='left')
+    for j, count in enumerate(counts.tolist()):
+        k = data[:count, j] * m
+        k ^= k >> np.uint32(R)
+        k *= m
+        h[:count] = (h[:count] * m) ^ k
+
+    # The last block is zero padded, so it can be mixed in as a whole
+    tail = (lengths & 3) != 0
+    h[tail] ^= data[tail, blocks[tail]]
+    h[tail] *= m
+
+    h ^= h >> np.uint32(13)
+    h *= m
+    h ^= h >> np.uint32(15)
+
+    result = np.empty_like(h)
+    result[order] = h
+    return result.tolist()
+
+
+def murmur2_32_batch(byte_datas, seed=DEFAULT_SEED):
+    """
+    Creates murmur2 32 bit integer hashes for each of the given byte strings.
+
+    The results are identical to calling :func:`murmur2_32` for each of the
+    byte strings.
+
+    :param Iterable[bytes] byte_datas: the byte strings to hash
+    :param int seed: seed to initialize this with
+    :return list[int]: 32 bit hashes in the order of the byte strings
+    """
+    byte_datas = [bytes(byte_data) for byte_data in byte_datas]
+    if np is None or len(byte_datas) < 2:
+        return [murmur2_32(byte_data, seed) for byte_data in byte_datas]
+
+    result = []
+    for i in range(0, len(byte_datas), BATCH_CHUNK_SIZE):
+        result.extend(_murmur2_32_vectorized(
+            byte_datas[i:i+BATCH_CHUNK_SIZE], seed
+        ))
+    return result
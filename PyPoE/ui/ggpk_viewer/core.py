@@ -43,6 +43,7 @@ from PyPoE.poe.file import ggpk, dat
 from PyPoE.ui.shared import SharedMainWindow
 from PyPoE.ui.shared.settings import SettingFrame, BoolSetting, ComboBoxSetting
 from PyPoE.ui.shared.file.manager import FileDataManager
+from PyPoE.ui.shared.file.handler import DDSDataHandler
 from PyPoE.ui.shared.file.model import GGPKModel
 from PyPoE.ui.ggpk_viewer.toolbar import *
 from PyPoE.ui.ggpk_viewer.menu import *
@@ -210,11 +211,22 @@ class GGPKViewerMainWindow(SharedMainWindow):
             self._reset_file_view(reset_hash=False)
             return
 
+        ggpk_file = self.ggpk_view.model().ggpk
+        kwargs = {}
+        if isinstance(obj, DDSDataHandler) and ggpk_file is not None:
+            # Resolves references and caches the decompressed textures
+            kwargs['ggpk'] = ggpk_file
+            kwargs['path'] = node.get_path()
+            file_data = None
+        else:
+            file_data = node.record.extract()
+
         try:
             qwidget = obj.get_widget(
-                node.record.extract(),
+                file_data,
                 file_name=node.record.name,
-                parent=self
+                parent=self,
+                **kwargs
             )
         except Exception as e:
             msg = self.tr("%(error)s occurred when trying to open %(file)s" % {
@@ -92,7 +92,8 @@ class CustomOpenAction(GGPKOpenAction):
 
         p._write_log(self.tr('Viewing GGPK contents...'))
 
-        p.ggpk_view.setModel(GGPKModel(self._thread.ggpk_file.directory))
+        ggpk_file = self._thread.ggpk_file
+        p.ggpk_view.setModel(GGPKModel(ggpk_file.directory, ggpk=ggpk_file))
         p.ggpk_view.show()
 
         p._write_log(self.tr('Done.'))
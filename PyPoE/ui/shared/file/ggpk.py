@@ -40,7 +40,6 @@ Interal API
 
 # Python
 import os
-from functools import wraps
 
 # 3rd-party
 from PySide.QtCore import *
@@ -111,37 +110,24 @@ class GGPKOpenAction(QAction):
 class GGPKThread(QThread):
     sig_update_progress = Signal(str, int)
 
+    # Seconds between updates of the progress bar
+    PROGRESS_INTERVAL = 0.1
+
     def __init__(self, file_path, *args, **kwargs):
         QThread.__init__(self, *args, **kwargs)
         self._file_path = file_path
         self.ggpk_file = None
-        self._size = 0
 
         self.sig_update_progress.connect(self._progress_updater)
 
         self.progress_bar = GGPKProgressDialog('')
 
-    def _progress_ggpk(self, func):
+    def _progress(self, done, total):
         """
-        Hook for GGPKFile._read_record
+        Progress callback for GGPKFile.read and GGPKFile.directory_build
         """
-        fm = self.parent()
-
-        @wraps(func)
-        def temp(*args, **kwargs):
-            if not self._size:
-                self._size = kwargs['ggpkfile'].seek(0, os.SEEK_END)
-                kwargs['ggpkfile'].seek(0, os.SEEK_SET)
-            else:
-                #kwargs['offset'])
-
-                self.progress_bar.sig_progress.emit(
-                    int(kwargs['offset'] / self._size * 100)
-                )
-
-            return func(*args, **kwargs)
-
-        return temp
+        if total:
+            self.progress_bar.sig_progress.emit(int(done / total * 100))
 
     def _progress_updater(self, title, max, *args, **kwargs):
         p = self.parent().parent()
@@ -161,14 +147,19 @@ class GGPKThread(QThread):
 
         self.sig_update_progress.emit(self.tr('Reading GGPK records...'), 100)
         ggpk_file = GGPKFile()
-        # Hook the function for progress bar
-        ggpk_file._read_record = self._progress_ggpk(ggpk_file._read_record)
-        ggpk_file.read(self._file_path)
-        # Finished
-        self.progress_bar.sig_progress.emit(100)
-
-        p.sig_log_message.emit(self.tr('Building GGPK directory...'))
-        ggpk_file.directory_build()
+        ggpk_file.read(
+            self._file_path,
+            progress=self._progress,
+            progress_interval=self.PROGRESS_INTERVAL,
+        )
+
+        self.sig_update_progress.emit(
+            self.tr('Building GGPK directory...'), 100
+        )
+        ggpk_file.directory_build(
+            progress=self._progress,
+            progress_interval=self.PROGRESS_INTERVAL,
+        )
 
         self.ggpk_file = ggpk_file
 
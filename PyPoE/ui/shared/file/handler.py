@@ -50,7 +50,7 @@ from PyPoE.poe.file.ggpk import extract_dds
 from PyPoE.ui.shared.proxy_filter_model import FilterMenu
 from PyPoE.ui.shared.table_context_menus import TableContextReadOnlyMenu
 from PyPoE.ui.shared.file.model import (
-    DatTableModel, DatDataModel, DatValueProxyModel
+    DatTableModel, DatDataModel, DatDataLoader, DatValueProxyModel
 )
 
 # =============================================================================
@@ -302,8 +302,27 @@ class DatFrame(QFrame):
             proxy_model=self.table_data_proxy_model,
         )
 
+        self.data_loader = None
+        if dat_file.reader.lazy:
+            self.data_loader = DatDataLoader(
+                self.table_data_model, parent=self
+            )
+            self.data_loader.sig_done.connect(self._on_data_loaded)
+            # The loader is a child of this frame and would be destroyed with
+            # it (e.g. when the main window is closed) while still running.
+            # destroyed is emitted before the children are deleted.
+            self.destroyed.connect(self.data_loader.stop)
+            QCoreApplication.instance().aboutToQuit.connect(
+                self.data_loader.stop
+            )
+            self.data_loader.start()
+
         self._refresh()
 
+    def _on_data_loaded(self, data):
+        self.table_data_model.set_data(data)
+        self.table_data.resizeColumnsToContents()
+
     def _on_option_deref_change(self, state):
         # State = 2 if checked, State = 0 if unchecked
         self.option_show_pointer.setEnabled(bool(state))
@@ -319,8 +338,8 @@ class DatFrame(QFrame):
 class DatDataHandler(FileDataHandler):
     def get_widget(self, file_data, file_name='', parent=None, *args, **kwargs):
         dat_file = DatFile(file_name)
-        # We want dat values here
-        dat_file.read(file_data, use_dat_value=True)
+        # We want dat values here, but only for the rows that are shown
+        dat_file.read(file_data, use_dat_value=True, lazy=True)
 
         frame = DatFrame(dat_file=dat_file, parent=parent)
 
@@ -365,20 +384,31 @@ class DDSDataHandler(FileDataHandler):
         return pbuffer.toImage()
 
     @staticmethod
-    def get_image(file_data):
+    def get_image(file_data, ggpk=None, path=None):
         """
         based on http://www.qtcentre.org/threads/29933-How-to-display-DDS-images
 
         TODO Fix warnings
 
-        :param file_data:
+        :param file_data: raw file data, ignored if ggpk and path are given
+        :param ggpk: GGPKFile to resolve references and cache textures with
+        :param path: path of the file in the ggpk
         :return:
         """
-        file_bytes = file_data.read()
         try:
-            file_data = io.BytesIO(extract_dds(file_bytes))
+            if ggpk is not None and path is not None:
+                file_data = io.BytesIO(ggpk.get_dds(path))
+            else:
+                file_bytes = file_data.read()
+                file_data = io.BytesIO(
+                    extract_dds(file_bytes, path_or_ggpk=ggpk)
+                )
         except NotImplementedError as e:
             raise DDSDataHandler.DDSException(*e.args)
+        except FileNotFoundError as e:
+            raise DDSDataHandler.DDSException(
+                'Referenced file not found: %s' % e.args[0]
+            )
         except ValueError as e:
             raise DDSDataHandler.DDSException(
                 'This file is a reference to "%s"' %
@@ -406,14 +436,15 @@ class DDSDataHandler(FileDataHandler):
                 tmp_file.write(file_data.read())
             return DDSDataHandler.dds_file_to_qimage(tmp_file_path)
 
-    def get_widget(self, file_data, file_name, *args, **kwargs):
+    def get_widget(self, file_data, file_name, *args, ggpk=None, path=None,
+                   **kwargs):
         label = QLabel(*args, **kwargs)
         # PyOpenGL not installed
         if GL is None:
             label.setText(label.tr('Install PyOpenGL to view DDS files.'))
 
         try:
-            img = DDSDataHandler.get_image(file_data)
+            img = DDSDataHandler.get_image(file_data, ggpk=ggpk, path=path)
         except DDSDataHandler.DDSException as e:
             label.setText(label.tr(e.args[0]))
         else:
@@ -34,6 +34,8 @@ from PySide.QtCore import *
 
 # self
 from PyPoE.poe.file.dat import DatFile, DatValue
+from PyPoE.poe.file.ggpk import DirectoryRecord
+from PyPoE.shared.containers import LazyTreeIndex
 from PyPoE.ui.shared.proxy_filter_model import FilterProxyModel
 
 # =============================================================================
@@ -41,6 +43,7 @@ from PyPoE.ui.shared.proxy_filter_model import FilterProxyModel
 # =============================================================================
 
 __all__ = [
+    'DatDataLoader',
     'DatDataModel',
     'DatTableModel',
     'DatValueProxyModel',
@@ -72,6 +75,17 @@ class DatTableModel(DatModelShared):
     def rowCount(self, parent=QModelIndex()):
         return len(self._dat_file.reader.table_data)
 
+    def get_values(self, column, rows):
+        """
+        Returns the values of the column for the given rows directly from
+        the reader, without going through Qt.
+        """
+        table_data = self._dat_file.reader.table_data
+        if column == 0:
+            return list(rows)
+        column -= 1
+        return [table_data[row][column] for row in rows]
+
     def columnCount(self, parent=QModelIndex()):
         return len(self._dat_file.reader.table_columns) + 1
 
@@ -83,7 +97,8 @@ class DatTableModel(DatModelShared):
 
         c = index.column()
         if c == 0:
-            return self._dat_file.reader.table_data[index.row()].rowid
+            # The rowid is the row, no need to parse lazily read rows
+            return index.row()
         else:
             return self._dat_file.reader.table_data[index.row()][c-1]
 
@@ -120,20 +135,46 @@ class DatDataModel(DatModelShared):
             (self.tr('Data'), self._show_data),
         ]
 
-        self._data = []
-        if len(self._dat_file.reader.data_parsed) > 1:
-            last = self._dat_file.reader.data_parsed[0]
-            self._data.append(last)
+        reader = self._dat_file.reader
+        if reader.lazy and not reader.table_data.is_loaded:
+            # Filled by a DatDataLoader once all rows have been parsed
+            self._data = []
+        else:
+            self._data = self._build_data()
+
+    def _build_data(self):
+        data = []
+        data_parsed = self._dat_file.reader.data_parsed
+        if len(data_parsed) > 1:
+            last = data_parsed[0]
+            data.append(last)
             # Remove duplicates for easier reading
             # TODO add option this?
-            for item in self._dat_file.reader.data_parsed[1:]:
+            for item in data_parsed[1:]:
                 #if (last.data_start_offset == item.data_start_offset and
                 #    last.data_end_offset == item.data_end_offset and
                 #    last.data_start_offset == last.data_end_offset):
                 #    continue
 
-                self._data.append(item)
+                data.append(item)
                 last = item
+        return data
+
+    def load(self, cancelled=None):
+        """
+        Parses all rows of a lazily read dat file and returns the data values
+        to pass to :meth:`set_data`, or None if cancelled. Safe to call
+        outside of the GUI thread.
+        """
+        reader = self._dat_file.reader
+        if reader.lazy and not reader.table_data.load_all(cancelled):
+            return None
+        return self._build_data()
+
+    def set_data(self, data):
+        self.beginResetModel()
+        self._data = data
+        self.endResetModel()
 
     def _show_start_offset(self, dat_value):
         return dat_value.data_start_offset
@@ -150,6 +191,14 @@ class DatDataModel(DatModelShared):
     def rowCount(self, parent=QModelIndex()):
         return len(self._data)
 
+    def get_values(self, column, rows):
+        """
+        Returns the values of the column for the given rows without going
+        through Qt.
+        """
+        func = self._sections[column][1]
+        return [func(self._data[row]) for row in rows]
+
     def columnCount(self, parent=QModelIndex()):
         return len(self._sections)
 
@@ -172,17 +221,72 @@ class DatDataModel(DatModelShared):
         return None
 
 
+class DatDataLoader(QThread):
+    """
+    Loads the data section view of a lazily read dat file in the background
+    and emits :attr:`sig_done` with the data for :meth:`DatDataModel.set_data`.
+    """
+    sig_done = Signal(object)
+
+    def __init__(self, model, *args, **kwargs):
+        QThread.__init__(self, *args, **kwargs)
+        self.model = model
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def stop(self, *args):
+        """
+        Cancels loading and blocks until the thread has finished; loading
+        stops after the current window of rows.
+        """
+        self.cancel()
+        self.wait()
+
+    def run(self):
+        data = self.model.load(lambda: self.cancelled)
+        if data is not None:
+            self.sig_done.emit(data)
+
+
 class GGPKModel(QAbstractItemModel):
-    def __init__(self, data=None):
+    """
+    Tree model over the :class:`PyPoE.poe.file.ggpk.DirectoryNode` hierarchy.
+
+    The children of a node are sorted (directories first, then by name) the
+    first time the node is accessed and the row of every child is cached, so
+    looking up the parent of an index doesn't need to search the siblings.
+    Large directories are handed to the view in chunks of :attr:`FETCH_SIZE`
+    rows through :meth:`canFetchMore` and :meth:`fetchMore`. The bookkeeping
+    is done by a :class:`LazyTreeIndex`.
+
+    The :class:`PyPoE.poe.file.ggpk.GGPKFile` the nodes belong to, if given,
+    is available as :attr:`ggpk`.
+    """
+
+    FETCH_SIZE = 1000
+
+    def __init__(self, data=None, ggpk=None):
         QAbstractItemModel.__init__(self)
         self.headers = (self.tr('Name'), self.tr('Size'), self.tr('Offset'))
+        self.ggpk = ggpk
         self._data = data
+        self._index = LazyTreeIndex(
+            get_children=lambda node: node.children,
+            key=self._sort_key,
+            fetch_size=self.FETCH_SIZE,
+        )
+
+    @staticmethod
+    def _sort_key(node):
+        return not isinstance(node.record, DirectoryRecord), node.name.lower()
 
     def index(self, row, column, parent=QModelIndex()):
         if not parent.isValid():
             return self.createIndex(row, column, self._data)
         node = parent.internalPointer()
-        return self.createIndex(row, column, node.children[row])
+        return self.createIndex(row, column, self._index.children(node)[row])
 
     def parent(self, index):
         if not index.isValid():
@@ -191,14 +295,40 @@ class GGPKModel(QAbstractItemModel):
         if node.parent is None:
             return QModelIndex()
         else:
-            return self.createIndex(node.parent.children.index(node), 0, node.parent)
+            return self.createIndex(
+                self._index.row(node.parent), 0, node.parent
+            )
 
     def rowCount(self, parent=QModelIndex()):
         if not parent.isValid():
             # Root node is always row 1.
             return 0 if self._data is None else 1
         node = parent.internalPointer()
-        return len(node.children)
+        if not node.children:
+            return 0
+        return self._index.fetched(node)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return self._data is not None
+        return bool(parent.internalPointer().children)
+
+    def canFetchMore(self, parent):
+        if not parent.isValid():
+            return False
+        return self._index.can_fetch_more(parent.internalPointer())
+
+    def fetchMore(self, parent):
+        if not parent.isValid():
+            return
+        node = parent.internalPointer()
+        rows = self._index.next_fetch(node)
+        if rows is None:
+            return
+
+        self.beginInsertRows(parent, *rows)
+        self._index.fetch_more(node)
+        self.endInsertRows()
 
     def columnCount(self, parent=QModelIndex()):
         return len(self.headers)
@@ -234,12 +364,21 @@ class GGPKModel(QAbstractItemModel):
 
 
 class DatValueProxyModel(FilterProxyModel):
+    # The values are read from the DatReader, which is safe outside of Qt
+    THREADED = True
+
     def _get_data(self, row, column, parent):
         data = FilterProxyModel._get_data(self, row, column, parent)
         if isinstance(data, DatValue):
             return data.get_value()
         return data
 
+    def _get_values(self, column, rows):
+        return [
+            value.get_value() if isinstance(value, DatValue) else value
+            for value in self.sourceModel().get_values(column, rows)
+        ]
+
     def _sort_value(self, dat_value):
         v = dat_value
         if QObject.parent(self).option_dereference_pointer.isChecked():
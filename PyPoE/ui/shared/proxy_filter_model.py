@@ -48,6 +48,7 @@ from PySide.QtCore import *
 from PySide.QtGui import *
 
 # self
+from PyPoE.shared import filters as shared_filters
 from PyPoE.ui.shared.regex_widgets import RegexFlagsBox
 
 # =============================================================================
@@ -64,19 +65,13 @@ __all__ = []
 # Filters
 #
 
-class AbstractFilter(object):
+class AbstractFilter(shared_filters.AbstractFilter):
 
     NAME = ''
 
-    def __init__(self, value):
-        self.value = value
-
     def get_name(self):
         return self.NAME
 
-    def apply(self, value):
-        return True
-
     def set_defaults(self, qwizardpage):
         pass
 
@@ -89,23 +84,10 @@ class AbstractFilter(object):
         pass
 
 
-class RegexFilter(AbstractFilter):
+class RegexFilter(shared_filters.RegexFilter, AbstractFilter):
 
     NAME = QT_TR_NOOP('Regular Expression Filter')
 
-    def __init__(self, value, flags=0):
-        self.value = value
-        self.flags = flags
-        self.regex = re.compile(value, flags)
-
-    def __repr__(self):
-        return '%s(value=%s, flags=%s)' % (
-            self.__class__.__name__, self.value, self.flags
-        )
-
-    def apply(self, value):
-        return self.regex.match(str(value)) is not None
-
     def set_defaults(self, qwizardpage):
         qwizardpage.regex_edit.setText(self.value)
         for flag_info in qwizardpage.regex_flags._regex_flags:
@@ -145,7 +127,7 @@ class RegexFilter(AbstractFilter):
         return obj
 
 
-class TypedFilter(AbstractFilter):
+class TypedFilter(shared_filters.TypedFilter, AbstractFilter):
     operations = OrderedDict((
         ('lt', {
             'name': '<',
@@ -189,31 +171,6 @@ class TypedFilter(AbstractFilter):
 
     NAME = QT_TR_NOOP('Simple Operation Filter')
 
-    def __init__(self, value, operation, type):
-        if type not in self.types:
-            raise TypeError('"%s" is not a valid type.')
-        self.type = type
-
-        self.value = self.type(value)
-
-        if operation not in self.operations:
-            raise ValueError('"%s" is not a valid operation.' % operation)
-
-        self.operation = operation
-        # will raise an exception accordingly
-        self._operation_func = getattr(self.type, '__' + operation + '__')
-
-    def __repr__(self):
-        return '%s(value=%s, operation=%s, type=%s)' % (
-            self.__class__.__name__, self.value, self.operation, self.type
-        )
-
-    def apply(self, value):
-        try:
-            return self._operation_func(self.type(value), self.value)
-        except (ValueError, TypeError):
-            return False
-
     def set_defaults(self, qwizardpage):
         qwizardpage.type_box.setCurrentIndex(
             list(self.types.keys()).index(self.type)
@@ -492,10 +449,64 @@ class FilterMenu(QMenu):
         QMenu.popup(self, self.parent().mapToGlobal(point))
 
 
+class FilterThread(QThread):
+    """
+    Evaluates the filters of a :class:`FilterProxyModel` in the background.
+
+    The result is stored in :attr:`accepted` and :attr:`sig_done` is emitted
+    with the thread itself unless it was cancelled.
+    """
+    sig_done = Signal(object)
+
+    def __init__(self, proxy_model, filters, row_count, *args, **kwargs):
+        QThread.__init__(self, *args, **kwargs)
+        self.proxy_model = proxy_model
+        self.filters = filters
+        self.row_count = row_count
+        self.accepted = None
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def stop(self, *args):
+        """
+        Cancels the evaluation and blocks until the thread has finished; the
+        evaluation stops after the current chunk of rows.
+        """
+        self.cancel()
+        self.wait()
+
+    def run(self):
+        self.accepted = self.proxy_model._filter_rows(
+            self.filters, self.row_count, lambda: self.cancelled,
+        )
+        if not self.cancelled:
+            self.sig_done.emit(self)
+
+
 class FilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy model that filters the rows of a table by per column filters.
+
+    The filters are evaluated column by column for chunks of
+    :attr:`CHUNK_SIZE` rows at once and the set of accepted rows is cached
+    until :meth:`invalidateFilter` is called. If :attr:`THREADED` is set and
+    the source has at least :attr:`THREAD_ROW_COUNT` rows, the filters are
+    evaluated in a :class:`FilterThread`; a running thread is stopped when
+    the filter is invalidated again or the source model is replaced.
+    :meth:`_get_values` must not use Qt in that case.
+    """
+
+    CHUNK_SIZE = 4096
+    THREADED = False
+    THREAD_ROW_COUNT = 10000
+
     def __init__(self, parent, *args, **kwargs):
         QSortFilterProxyModel.__init__(self, *args, parent=parent, **kwargs)
 
+        self._accepted = None
+        self._thread = None
         self.reset_all_filters()
 
     def reset_all_filters(self):
@@ -515,16 +526,110 @@ class FilterProxyModel(QSortFilterProxyModel):
         # Should probably not use data()
         return self.sourceModel().index(row, column, parent).data()
 
+    def _get_values(self, column, rows):
+        """
+        Returns the values of the column for the given source rows.
+        """
+        get_data = self._get_data
+        parent = QModelIndex()
+        return [get_data(row, column, parent) for row in rows]
+
+    def _get_filters(self):
+        """
+        Returns a list of (column, filters) pairs of the configured filters.
+        """
+        filters = []
+        for column, column_filters in self.filters.items():
+            # Filter classes are placeholders while the wizard is open
+            column_filters = [
+                f for f in column_filters if not isinstance(f, type)
+            ]
+            if column_filters:
+                filters.append((column, column_filters))
+        return filters
+
+    def _filter_rows(self, filters, row_count, cancelled=None):
+        """
+        Evaluates the filters and returns the set of accepted source rows, or
+        None if cancelled.
+        """
+        return shared_filters.filter_rows(
+            filters, row_count, self._get_values, self.CHUNK_SIZE, cancelled,
+        )
+
+    def _cancel_thread(self):
+        if self._thread is not None:
+            # Wait as well, the thread still reads from the source model
+            self._thread.stop()
+            self._thread = None
+
+    def _thread_done(self, thread):
+        if thread is not self._thread:
+            return
+        self._thread = None
+        self._accepted = thread.accepted
+        QSortFilterProxyModel.invalidateFilter(self)
+
+    def _source_reset(self):
+        if self._get_filters():
+            self.invalidateFilter()
+        else:
+            self._accepted = None
+
+    def setSourceModel(self, model):
+        self._cancel_thread()
+        self._accepted = None
+        old_model = self.sourceModel()
+        if old_model is not None:
+            old_model.modelReset.disconnect(self._source_reset)
+        QSortFilterProxyModel.setSourceModel(self, model)
+        if model is not None:
+            model.modelReset.connect(self._source_reset)
+        self._source_reset()
+
+    def invalidateFilter(self):
+        """
+        Re-evaluates the filters and updates the view once done.
+        """
+        self._cancel_thread()
+
+        filters = self._get_filters()
+        source = self.sourceModel()
+        if not filters or source is None:
+            self._accepted = None
+            QSortFilterProxyModel.invalidateFilter(self)
+            return
+
+        row_count = source.rowCount()
+        if self.THREADED and row_count >= self.THREAD_ROW_COUNT:
+            # The current rows stay visible until the thread is done
+            thread = FilterThread(self, filters, row_count, parent=self)
+            thread.sig_done.connect(self._thread_done)
+            thread.finished.connect(thread.deleteLater)
+            # The thread is a child of this model and would be destroyed with
+            # it (e.g. when the main window is closed) while still running.
+            # destroyed is emitted before the children are deleted.
+            self.destroyed.connect(thread.stop)
+            QCoreApplication.instance().aboutToQuit.connect(thread.stop)
+            self._thread = thread
+            thread.start()
+        else:
+            self._accepted = self._filter_rows(filters, row_count)
+            QSortFilterProxyModel.invalidateFilter(self)
+
     def filterAcceptsRow(self, source_row, source_parent):
-        accepted = True
-        for column, filters in self.filters.items():
-            data = self._get_data(source_row, column, source_parent)
-            for filter in filters:
-                accepted = accepted and filter.apply(data)
-                if not accepted:
-                    return False
-
-        return accepted
+        if source_parent.isValid():
+            # Nested rows are not cached, check them directly
+            for column, filters in self._get_filters():
+                data = self._get_data(source_row, column, source_parent)
+                for filter in filters:
+                    if not filter.apply(data):
+                        return False
+            return True
+
+        if self._accepted is None:
+            return True
+        return source_row in self._accepted
 
 # =============================================================================
 # Functions
@@ -0,0 +1,136 @@
+"""
+
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | scripts/profile/PyPoE/cli/exporter/wiki/parser.py                |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Benchmarks make_inter_wiki_links against the previous implementation that
+applied one large alternation regex per chunk of the inter wiki map.
+
+Usage:
+
+    parser.py [corpus file]
+
+The corpus file should contain one mod or description line per line. If no
+file is given, a corpus is generated from the inter wiki map.
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import re
+import sys
+import random
+import timeit
+
+# 3rd-party
+
+# self
+from PyPoE.cli.exporter.wiki import parser
+
+# =============================================================================
+# Globals
+# =============================================================================
+
+__all__ = []
+
+_legacy_re = []
+for i in range(0, (len(parser._inter_wiki_map)//parser._MAX_RE)+1):
+    id = i*parser._MAX_RE
+    _legacy_re.append(re.compile(
+        r'(?![^\[]*\]\])'
+        r'(?: |^)'
+        r'(?P<text>%s)'
+        r'(?= |$)' %
+        '|'.join(['(%s)' % item[0] for item in
+                  parser._inter_wiki_map[id:id+parser._MAX_RE]]),
+        re.UNICODE | re.IGNORECASE,
+    ))
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def legacy_make_inter_wiki_links(string):
+    for i, regex in enumerate(_legacy_re):
+        out = []
+        last_index = 0
+        for match in regex.finditer(string):
+            text = match.group('text')
+            index = match.groups().index(text, 1)-1
+            data = parser._inter_wiki_map[i*parser._MAX_RE+index][1]
+
+            out.append(string[last_index:match.start('text')])
+            if text == data['link']:
+                out.append('[[%s]]' % data['link'])
+            else:
+                out.append('[[%s|%s]]' % (data['link'], text))
+
+            last_index = match.end('text')
+
+        out.append(string[last_index:])
+        string = ''.join(out)
+
+    return string
+
+
+def generate_corpus(size=10000, seed=0):
+    rng = random.Random(seed)
+    words = ['increased', 'reduced', 'to', 'of', 'with', 'level', '20',
+             '(10-20)%', '+1', 'Socketed', 'Gems', 'are', 'Supported', 'by']
+    words += [item[0] for item in parser._inter_wiki_map
+              if '(' not in item[0] and '|' not in item[0]]
+    return [
+        ' '.join(rng.choice(words) for _ in range(rng.randint(3, 12)))
+        for _ in range(size)
+    ]
+
+# =============================================================================
+# Init
+# =============================================================================
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as f:
+            corpus = [line.rstrip('\n') for line in f]
+    else:
+        corpus = generate_corpus()
+
+    func = parser.make_inter_wiki_links.__wrapped__
+    mismatches = [
+        line for line in corpus
+        if legacy_make_inter_wiki_links(line) != func(line)
+    ]
+    print('Lines: %s, mismatches: %s' % (len(corpus), len(mismatches)))
+    for line in mismatches[:10]:
+        print(line)
+
+    for name, f in (
+            ('legacy', legacy_make_inter_wiki_links),
+            ('current (uncached)', func),
+            ('current (cached)', parser.make_inter_wiki_links)):
+        t = min(timeit.repeat(
+            lambda: [f(line) for line in corpus], number=1, repeat=3,
+        ))
+        print('%s: %.3fs, %.1f lines/s' % (name, t, len(corpus)/t))
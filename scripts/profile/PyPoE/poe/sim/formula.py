@@ -0,0 +1,98 @@
+"""
+
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | scripts/profile/PyPoE/poe/sim/formula.py                         |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Benchmarks the array variants of the formulas against calling the scalar
+functions for every element of a million element grid.
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import timeit
+
+# 3rd-party
+import numpy as np
+
+# self
+from PyPoE.poe.sim import formula
+
+# =============================================================================
+# Globals
+# =============================================================================
+
+__all__ = []
+
+SIZE = 1000
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def bench(name, scalar, array):
+    scalar_time = min(timeit.repeat(scalar, number=1, repeat=3))
+    array_time = min(timeit.repeat(array, number=1, repeat=3))
+    print('%-25s scalar: %8.3fs array: %8.3fs speedup: %6.1fx' % (
+        name, scalar_time, array_time, scalar_time/array_time,
+    ))
+
+# =============================================================================
+# Init
+# =============================================================================
+
+if __name__ == '__main__':
+    # SIZE x SIZE grids
+    x = list(range(0, SIZE*20, 20))
+    y = list(range(1, SIZE*5, 5))
+    x_array = np.array(x)[:, None]
+    y_array = np.array(y)[None, :]
+
+    bench(
+        'armour_damage_reduction',
+        lambda: [formula.armour_damage_reduction(a, d) for a in x for d in y],
+        lambda: formula.armour_damage_reduction_array(x_array, y_array),
+    )
+    bench(
+        'chance_to_hit',
+        lambda: [formula.chance_to_hit(a, e) for e in x for a in y],
+        lambda: formula.chance_to_hit_array(y_array, x_array),
+    )
+    bench(
+        'chance_to_evade',
+        lambda: [formula.chance_to_evade(a, e) for e in x for a in y],
+        lambda: formula.chance_to_evade_array(y_array, x_array),
+    )
+
+    levels = list(range(1, 101)) * (SIZE*SIZE // 300)
+    levels_array = np.array(levels)
+    for multi in (40, 60, 100):
+        bench(
+            'gem_stat_requirement %s' % multi,
+            lambda: [formula.gem_stat_requirement(
+                level, formula.GemTypes.active, multi) for level in levels],
+            lambda: formula.gem_stat_requirement_array(
+                levels_array, formula.GemTypes.active, multi),
+        )
@@ -0,0 +1,114 @@
+"""
+
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | scripts/profile/PyPoE/poe/sim/item.py                            |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Measures the item parsing throughput in items per second.
+
+Usage:
+
+    item.py [dump file]
+
+The dump file should contain item strings separated by empty lines. If no
+file is given, a few sample items are repeated.
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import sys
+import time
+
+# 3rd-party
+
+# self
+from PyPoE.poe.sim.item import ItemParser, parse_items, _iter_item_texts
+
+# =============================================================================
+# Globals
+# =============================================================================
+
+__all__ = []
+
+SAMPLES = [
+    '''Rarity: Rare
+Ghoul Cry
+Abyssal Sceptre
+--------
+One Handed Mace
+Physical Damage: 38-57
+Elemental Damage: 24-43 (augmented), 24-44 (augmented), 6-65 (augmented)
+Critical Strike Chance: 6.50%
+Attacks per Second: 1.25
+--------
+Requirements:
+Level: 53
+Str: 83 (unmet)
+Int: 99 (unmet)
+--------
+Sockets: R-G-B
+--------
+Item Level: 56
+--------
+15% increased Elemental Damage
+--------
+Adds 24-43 Fire Damage
+Adds 24-44 Cold Damage
+Adds 6-65 Lightning Damage
+28% increased Global Critical Strike Multiplier''',
+    '''Rarity: Normal
+Ruby Ring
+--------
+Requirements:
+Level: 11
+--------
+Item Level: 18
+--------
++25% to Fire Resistance''',
+]
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def measure(name, func, texts):
+    start = time.perf_counter()
+    func(texts)
+    duration = time.perf_counter() - start
+    print('%-12s %10.0f items/s' % (name, len(texts)/duration))
+
+# =============================================================================
+# Init
+# =============================================================================
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as f:
+            texts = list(_iter_item_texts(f))
+    else:
+        texts = SAMPLES * 50000
+
+    measure('ItemParser', lambda t: [ItemParser(s) for s in t], texts)
+    measure('parse_items', lambda t: list(parse_items(t)), texts)
@@ -0,0 +1,76 @@
+"""
+
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | scripts/profile/PyPoE/shared/murmur2.py                          |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Benchmarks hashing GGPK-like file names with murmur2_32 and
+murmur2_32_batch.
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import random
+import string
+import timeit
+
+# 3rd-party
+
+# self
+from PyPoE.shared.murmur2 import murmur2_32, murmur2_32_batch
+
+# =============================================================================
+# Globals
+# =============================================================================
+
+__all__ = []
+
+COUNT = 300000
+
+# =============================================================================
+# Init
+# =============================================================================
+
+if __name__ == '__main__':
+    random.seed(0)
+    # File names are hashed in their lower case UTF-16 form
+    names = [
+        ''.join(random.choice(string.ascii_lowercase + '_.')
+                for i in range(random.randint(3, 40))).encode('UTF-16_LE')
+        for j in range(COUNT)
+    ]
+
+    assert [murmur2_32(n) for n in names[:1000]] == \
+        murmur2_32_batch(names[:1000])
+
+    single = min(timeit.repeat(
+        lambda: [murmur2_32(n) for n in names], number=1, repeat=3
+    ))
+    batch = min(timeit.repeat(
+        lambda: murmur2_32_batch(names), number=1, repeat=3
+    ))
+    print('%s names' % COUNT)
+    print('murmur2_32:       %.3fs (%.0f names/s)' % (single, COUNT/single))
+    print('murmur2_32_batch: %.3fs (%.0f names/s)' % (batch, COUNT/batch))
+    print('speedup: %.1fx' % (single/batch))
@@ -17,6 +17,7 @@ extras_require = {
     'dev': ['sphinx', 'pytest'],
     'cli': ['colorama', 'graphviz', 'tqdm', 'mwclient'],
     'cli-sql': ['sqlalchemy', 'pymysql'],
+    'sim': ['numpy'],
     'ui': ['PySide'],
     'ui-extra': ['PyOpenGL'],
 }
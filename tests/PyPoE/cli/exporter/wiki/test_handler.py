@@ -0,0 +1,392 @@
+"""
+Tests for handler.py
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/cli/exporter/wiki/test_handler.py                    |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Tests for PyPoE.cli.exporter.wiki.handler
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import time
+from argparse import ArgumentParser
+from types import SimpleNamespace
+
+# 3rd-party
+import pytest
+
+# self
+from PyPoE.cli.exporter.wiki import handler
+from PyPoE.poe.file.dat import DatRecord, RelationalReader
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+
+class FakeSite(object):
+    """
+    Minimal stand-in for the MediaWiki API as used through mwclient.Site.api
+    """
+    def __init__(self, pages, continue_after=None, edit_delay=0):
+        self.pages = dict(pages)
+        self.continue_after = continue_after
+        self.edit_delay = edit_delay
+        self.timestamps = {}
+        self.editing = set()
+        self.queries = []
+        self.edits = []
+
+    def get_token(self, type):
+        return 'token'
+
+    def _normalize(self, title):
+        return title[0].upper() + title[1:].replace('_', ' ')
+
+    def api(self, action, http_method='POST', **kwargs):
+        if action == 'query':
+            return self._query(**kwargs)
+        elif action == 'edit':
+            return self._edit(**kwargs)
+        raise ValueError(action)
+
+    def _query(self, titles, rvcontinue=None, **kwargs):
+        self.queries.append(titles)
+        titles = titles.split('|')
+        query = {'pages': {}, 'normalized': []}
+        missing = -1
+        for i, title in enumerate(titles):
+            name = self._normalize(title)
+            if name != title:
+                query['normalized'].append({'from': title, 'to': name})
+            if name not in self.pages:
+                query['pages'][str(missing)] = {'title': name, 'missing': ''}
+                missing -= 1
+                continue
+            data = {'title': name}
+            skip = self.continue_after is not None and \
+                rvcontinue is None and i >= self.continue_after
+            if not skip and (rvcontinue is None or
+                             i >= self.continue_after):
+                data['revisions'] = [{
+                    'timestamp': self.timestamps.get(
+                        name, '2016-01-01T00:00:00Z'
+                    ),
+                    'slots': {'main': {'*': self.pages[name]}},
+                }]
+            query['pages'][str(i)] = data
+        response = {'query': query}
+        if self.continue_after is not None and rvcontinue is None and \
+                len(titles) > self.continue_after:
+            response['continue'] = {'rvcontinue': '1', 'continue': '||'}
+        return response
+
+    def _edit(self, title, text, summary, token, **kwargs):
+        assert token == 'token'
+        if 'createonly' in kwargs:
+            assert title not in self.pages
+        if 'nocreate' in kwargs:
+            assert title in self.pages
+        if 'basetimestamp' in kwargs and kwargs['basetimestamp'] != \
+                self.timestamps.get(title, '2016-01-01T00:00:00Z'):
+            raise handler.mwclient.APIError('editconflict', 'Conflict', {})
+        assert title not in self.editing
+        self.editing.add(title)
+        time.sleep(self.edit_delay)
+        self.editing.remove(title)
+        self.edits.append(title)
+        self.pages[title] = text
+        self.timestamps[title] = 'now %s' % len(self.edits)
+        return {'edit': {
+            'result': 'Success',
+            'newtimestamp': self.timestamps[title],
+        }}
+
+
+def make_handler(site, *args):
+    parser = ArgumentParser()
+    wiki_handler = handler.WikiHandler()
+    wiki_handler.add_arguments(parser)
+    wiki_handler.cmdargs = parser.parse_args(
+        ['--wiki-save-delay', '0'] + list(args)
+    )
+    wiki_handler.site = site
+    return wiki_handler
+
+
+def make_result(*rows):
+    result = handler.ExporterResult()
+    for wiki_page, text in rows:
+        result.add_result(text=text, wiki_page=wiki_page, wiki_message='Test')
+    return result
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestWikiHandler(object):
+    def test_fetch_pages(self):
+        site = FakeSite({'Page A': 'a', 'Page B': 'b'})
+        wiki_handler = make_handler(site, '--wiki-batch-size', '2')
+        pages = wiki_handler.fetch_pages(['Page A', 'page_B', 'Page C'])
+
+        assert len(site.queries) == 2
+        assert pages['Page A'].text() == 'a'
+        assert pages['page_B'].name == 'Page B'
+        assert pages['page_B'].text() == 'b'
+        assert not pages['Page C'].exists
+
+    def test_fetch_pages_continue(self):
+        site = FakeSite({'A': 'a', 'B': 'b', 'C': 'c'}, continue_after=1)
+        pages = make_handler(site).fetch_pages(['A', 'B', 'C'])
+
+        assert len(site.queries) == 2
+        assert [pages[t].text() for t in 'ABC'] == ['a', 'b', 'c']
+
+    def test_process(self):
+        site = FakeSite({'Same': 'same', 'Changed': 'old'})
+        result = make_result(
+            ('Same', 'same'),
+            ('Changed', 'new'),
+            ('New', 'created'),
+            ('Changed', lambda page: page.text() + '!'),
+        )
+        saved = make_handler(site).process(result)
+
+        assert saved == ['Changed', 'New', 'Changed']
+        assert site.pages['Changed'] == 'new!'
+        assert site.pages['New'] == 'created'
+        assert len(site.queries) == 1
+
+    def test_conditions(self):
+        site = FakeSite({'A': 'skip', 'B': 'edit'})
+        condition = lambda page: page.text() == 'edit'
+        result = make_result(
+            ([
+                {'page': 'A', 'condition': condition},
+                {'page': 'B', 'condition': [condition]},
+            ], 'done'),
+        )
+        assert make_handler(site).process(result) == ['B']
+        assert site.pages == {'A': 'skip', 'B': 'done'}
+
+    def test_only_existing(self):
+        site = FakeSite({})
+        result = make_result(('New', 'text'))
+        assert make_handler(site, '--wiki-only-existing').process(result) == []
+        assert site.edits == []
+
+    def test_dry_run(self):
+        site = FakeSite({'A': 'old'})
+        result = make_result(('A', 'new'))
+        assert make_handler(site, '--wiki-dry-run').process(result) == ['A']
+        assert site.edits == []
+
+    def test_process_stream(self):
+        site = FakeSite({'A': 'old'})
+        produced = []
+
+        def rows():
+            for i, (page, text) in enumerate((
+                    ('A', 'a1'), ('B', 'b'), ('C', 'c'), ('A', 'a2'))):
+                # Rows of the first batch are saved before the next batch is
+                # produced
+                if i == 2:
+                    assert site.edits == ['A', 'B']
+                produced.append(page)
+                yield {'text': text, 'wiki_page': page, 'wiki_message': ''}
+
+        saved = make_handler(site, '--wiki-batch-size', '2').process(rows())
+        assert saved == ['A', 'B', 'C', 'A']
+        assert site.pages['A'] == 'a2'
+        assert len(site.queries) == 2
+
+    def test_threads(self):
+        site = FakeSite({})
+        result = make_result(*[('Page %s' % i, str(i)) for i in range(20)])
+        saved = make_handler(site, '--wiki-max-threads', '4').process(result)
+        assert sorted(saved) == sorted('Page %s' % i for i in range(20))
+        assert len(site.edits) == 20
+
+    def test_threads_same_page(self):
+        site = FakeSite({'A': 'old', 'B': 'old'}, edit_delay=0.01)
+        result = make_result(
+            ('A', 'a1'),
+            ('New', 'n1'),
+            ('A', 'a2'),
+            ('B', 'b'),
+            ('New', lambda page: page.text() + 'n2'),
+            ('A', lambda page: page.text() + 'a3'),
+        )
+        wiki_handler = make_handler(site, '--wiki-max-threads', '4')
+        saved = wiki_handler.process(result)
+
+        assert wiki_handler.failed == []
+        assert sorted(saved) == ['A', 'A', 'A', 'B', 'New', 'New']
+        assert [t for t in site.edits if t == 'A'] == ['A', 'A', 'A']
+        assert site.pages == {'A': 'a2a3', 'B': 'b', 'New': 'n1n2'}
+
+
+class TestFingerprintStore(object):
+    def _rows(self, value=1, name='b'):
+        items = SimpleNamespace(file_name='Items.dat')
+        classes = SimpleNamespace(file_name='ItemClasses.dat')
+        item_class = DatRecord(classes, 0)
+        item_class.extend([name, None])
+        rows = []
+        for rowid in range(3):
+            row = DatRecord(items, rowid)
+            row.extend([rowid, value if rowid == 1 else 0, item_class])
+            rows.append(row)
+        # Cyclic relation
+        item_class[1] = rows[0]
+        return rows
+
+    def _render(self, store, rows, func=None, parser=None):
+        rendered = []
+
+        def render(row, result):
+            rendered.append(row.rowid)
+            result.add_result(text=str(row[0]), out_file='%s.txt' % row[0])
+            result.add_result(text=str(row[0]), wiki_page=str(row[0]))
+            if func is not None:
+                func(row)
+
+        rows, render = store.filter_rows(rows, render, parser)
+        result = handler.ExporterResult()
+        for row in rows:
+            render(row, result)
+        return rendered, result
+
+    def _changed(self, store, result, target):
+        return [item for item in result if store.is_changed(item, target)]
+
+    def test_fingerprint_row(self):
+        store = handler.FingerprintStore('', salt='template')
+        fingerprint = store.fingerprint_row(self._rows()[0])
+        assert fingerprint == handler.FingerprintStore(
+            '', salt='template').fingerprint_row(self._rows()[0])
+        # Changes of the referenced rows change the fingerprint
+        assert fingerprint != handler.FingerprintStore(
+            '', salt='template').fingerprint_row(self._rows(name='c')[0])
+        assert fingerprint != handler.FingerprintStore(
+            '', salt='module').fingerprint_row(self._rows()[0])
+        assert store.fingerprint_row({'not': 'a row'}) is None
+
+    def test_filter_rows(self, tmpdir):
+        path = str(tmpdir.join('fingerprints', 'test.json'))
+        store = handler.FingerprintStore(path, targets=['write', 'wiki'])
+        rendered, result = self._render(store, self._rows())
+        assert rendered == [0, 1, 2]
+        assert result[0]['fingerprint_key'] == 'Items.dat:0'
+        assert result[0]['fingerprint'] == result[1]['fingerprint']
+        assert self._changed(store, result, 'write') == result
+        store.update(result, 'write')
+        store.update(result[:2], 'wiki')
+        # Comparisons are made against the last run
+        assert self._changed(store, result, 'write') == result
+        store.save()
+
+        store = handler.FingerprintStore(path, targets=['write'])
+        rendered, result = self._render(store, self._rows(value=2))
+        # Unchanged rows are not rendered
+        assert rendered == [1]
+
+        store = handler.FingerprintStore(path, targets=['write', 'wiki'])
+        rendered, result = self._render(store, self._rows())
+        assert rendered == [1, 2]
+        assert self._changed(store, result, 'write') == []
+        assert len(self._changed(store, result, 'wiki')) == 4
+
+        # Everything is rendered without targets, i.e. for printing only
+        store = handler.FingerprintStore(path)
+        assert self._render(store, self._rows())[0] == [0, 1, 2]
+
+    def test_filter_rows_reads(self, tmpdir):
+        tmpdir.mkdir('Data').join('Other.dat').write_binary(b'other')
+        names = SimpleNamespace(file_name='Names.dat')
+        name_rows = []
+        for rowid in range(3):
+            row = DatRecord(names, rowid)
+            row.append('name%s' % rowid)
+            name_rows.append(row)
+
+        rr = RelationalReader(path_or_ggpk=str(tmpdir))
+        rr.files['Data/Names.dat'] = SimpleNamespace(reader=SimpleNamespace(
+            index={'Id': {'row%s' % row.rowid: row for row in name_rows}},
+        ))
+        rr.files['Data/Other.dat'] = SimpleNamespace(reader=[None])
+        parser = SimpleNamespace(rr=rr)
+
+        def render(row):
+            assert parser.rr['Names.dat'].index['Id'].get(
+                'row%s' % row.rowid) is name_rows[row.rowid]
+            if row.rowid == 2:
+                parser.rr['Other.dat'][0]
+
+        path = str(tmpdir.join('test.json'))
+        store = handler.FingerprintStore(path, targets=['write'])
+        rendered, result = self._render(store, self._rows(), render, parser)
+        assert rendered == [0, 1, 2]
+        # The caches of the parser are only replaced while rendering
+        assert parser.rr is rr
+        assert result[0]['fingerprint_reads'] == [
+            ('index', 'Data/Names.dat', 'Id', '"row0"'),
+        ]
+        assert result[4]['fingerprint_reads'] == [
+            ('dat', 'Data/Other.dat'),
+            ('index', 'Data/Names.dat', 'Id', '"row2"'),
+        ]
+        store.update(result, 'write')
+        store.save()
+
+        store = handler.FingerprintStore(path, targets=['write'])
+        assert self._render(store, self._rows(), render, parser)[0] == []
+
+        # Changes of the data read while rendering are picked up
+        name_rows[1][0] = 'changed'
+        store = handler.FingerprintStore(path, targets=['write'])
+        assert self._render(store, self._rows(), render, parser)[0] == [1]
+
+        tmpdir.join('Data', 'Other.dat').write_binary(b'changed')
+        store = handler.FingerprintStore(path, targets=['write'])
+        assert self._render(store, self._rows(), render, parser)[0] == [1, 2]
+
+    def test_completed(self):
+        site = FakeSite({'Same': 'same', 'Changed': 'old', 'Skip': 'skip'})
+        result = make_result(
+            ('Same', 'same'),
+            ('Changed', 'new'),
+            ([{'page': 'Skip', 'condition': lambda page: False}], 'text'),
+        )
+        wiki_handler = make_handler(site)
+        wiki_handler.process(result)
+        assert wiki_handler.completed == result[:2]
+
+        result = make_result(('New', 'text'))
+        wiki_handler = make_handler(site, '--wiki-only-existing')
+        wiki_handler.process(result)
+        assert wiki_handler.completed == []
@@ -0,0 +1,156 @@
+"""
+Tests for images.py
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/cli/exporter/wiki/test_images.py                     |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Tests for PyPoE.cli.exporter.wiki.images
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import io
+import os
+import hashlib
+
+# 3rd-party
+import pytest
+
+# self
+from PyPoE.cli.exporter.wiki import images
+
+# extract_dds requires brotli even for uncompressed files
+pytest.importorskip('brotli')
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+
+class FakeRecord(object):
+    def __init__(self, data, data_start):
+        self.data = data
+        self.data_start = data_start
+        self.data_length = len(data)
+        self.hash = int.from_bytes(hashlib.sha256(data).digest(), 'big')
+
+    def extract(self):
+        return io.BytesIO(self.data)
+
+
+class FakeNode(object):
+    def __init__(self, record):
+        self.record = record
+
+
+class FakeGGPK(object):
+    """
+    Stands in for a GGPKFile with the directory build.
+    """
+    def __init__(self, path, files):
+        self._file_path_or_raw = path
+        self.nodes = {}
+        with open(path, 'wb') as f:
+            for file_path, data in files.items():
+                self.nodes[file_path] = FakeNode(FakeRecord(data, f.tell()))
+                f.write(data)
+
+    def __getitem__(self, item):
+        return self.nodes[item]
+
+
+def dds(content):
+    return b'DDS ' + content * 400
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestImageExporter(object):
+    def test_export(self, tmpdir):
+        files = {
+            'Art/a.dds': dds(b'a'),
+            'Art/b.dds': dds(b'b'),
+            'Art/ref.dds': b'*Art/a.dds',
+        }
+        ggpk = FakeGGPK(str(tmpdir.join('Content.ggpk')), files)
+        out_dir = tmpdir.mkdir('img')
+
+        exporter = images.ImageExporter(ggpk, str(out_dir), jobs=2)
+        exporter.add('Art/a.dds', 'A')
+        exporter.add('Art/a.dds', 'A copy')
+        exporter.add('Art/b.dds', 'B')
+        exporter.add('Art/ref.dds', 'Ref')
+        exporter.close()
+        assert exporter.extracted == 2
+        assert exporter.failed == 0
+
+        for name, data in (('A', files['Art/a.dds']),
+                           ('A copy', files['Art/a.dds']),
+                           ('B', files['Art/b.dds']),
+                           ('Ref', files['Art/a.dds'])):
+            assert out_dir.join(name + '.dds').read_binary() == data
+        assert exporter.skipped == 0
+
+        # Unchanged images are skipped on the next run
+        exporter = images.ImageExporter(ggpk, str(out_dir), jobs=2)
+        for dds_path, name in (('Art/a.dds', 'A'), ('Art/a.dds', 'A copy'),
+                               ('Art/b.dds', 'B'), ('Art/ref.dds', 'Ref')):
+            exporter.add(dds_path, name)
+        exporter.close()
+        assert exporter.skipped == 2
+
+        # Changed or missing images are extracted again
+        files['Art/b.dds'] = dds(b'c')
+        ggpk = FakeGGPK(str(tmpdir.join('Content.ggpk')), files)
+        os.remove(str(out_dir.join('A.dds')))
+        exporter = images.ImageExporter(ggpk, str(out_dir), jobs=2)
+        exporter.add('Art/a.dds', 'A')
+        exporter.add('Art/b.dds', 'B')
+        exporter.close()
+        assert exporter.skipped == 0
+        assert out_dir.join('A.dds').read_binary() == files['Art/a.dds']
+        assert out_dir.join('B.dds').read_binary() == files['Art/b.dds']
+
+    def test_failed(self, tmpdir):
+        files = {
+            'Art/a.dds': dds(b'a'),
+            # Neither a dds file nor brotli compressed
+            'Art/bad.dds': b'x' * 2000,
+        }
+        ggpk = FakeGGPK(str(tmpdir.join('Content.ggpk')), files)
+        exporter = images.ImageExporter(ggpk, str(tmpdir.mkdir('img')))
+        exporter.add('Art/a.dds', 'A')
+        exporter.add('Art/bad.dds', 'Bad')
+        exporter.close()
+
+        assert exporter.extracted == 1
+        assert exporter.failed == 1
+
+    def test_raw_ggpk(self, tmpdir):
+        ggpk = FakeGGPK(str(tmpdir.join('Content.ggpk')), {})
+        ggpk._file_path_or_raw = io.BytesIO()
+        with pytest.raises(ValueError):
+            images.ImageExporter(ggpk, str(tmpdir))
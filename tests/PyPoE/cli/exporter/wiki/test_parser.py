@@ -31,6 +31,8 @@ See PyPoE/LICENSE
 
 # Python
 import os
+from argparse import Namespace
+from types import SimpleNamespace
 from collections import OrderedDict
 
 # 3rd-party
@@ -39,7 +41,9 @@ import pytest
 # self
 from PyPoE.poe.constants import MOD_STATS_RANGE
 from PyPoE.poe.text import parse_description_tags
+from PyPoE.poe.file.dat import DatRecord
 from PyPoE.cli.exporter.wiki import parser
+from PyPoE.cli.exporter.wiki.handler import FingerprintStore
 from PyPoE.cli.exporter import config
 
 # =============================================================================
@@ -111,6 +115,26 @@ iwdata = (
         '[[Item socket|Socketed]] Gems are Supported by '
         '[[Faster Casting Support|level 10 Faster Casting]]',
     ),
+    # Existing links
+    (
+        '[[Fire Damage]] and Fire Damage',
+        '[[Fire Damage]] and [[Fire Damage]]',
+    ),
+    # Trailing new line
+    (
+        'Hit Recently\n',
+        '[[Hit]] [[Recently]]\n',
+    ),
+    # Only a new line at the end delimits a phrase
+    (
+        'Recently\nHit\n',
+        'Recently\nHit\n',
+    ),
+    # Alternations
+    (
+        'Staves and Frozen Enemies',
+        '[[Staff|Staves]] and [[Freeze|Frozen]] Enemies',
+    ),
 )
 
 # Input string, template name, other text, template args, template kwargs
@@ -232,6 +256,67 @@ class TestBaseParser():
 
         assert parserobj._get_stats(stats, values, mod) == result
 
+    @pytest.mark.parametrize('jobs', [1, 3])
+    def test_iter_rows(self, jobs):
+        # Avoid loading the files; rendering only needs the instance
+        base_parser = parser.BaseParser.__new__(parser.BaseParser)
+        # The command function can't be pickled
+        parsed_args = Namespace(jobs=jobs, func=lambda: None)
+
+        def render(row, result):
+            if row % 4 == 0:
+                return
+            cond = parser.WikiCondition(
+                data=OrderedDict((('id', row), )),
+                cmdargs=parsed_args,
+            )
+            result.add_result(
+                text=cond,
+                out_file='%s.txt' % row,
+                wiki_page=[{'page': str(row), 'condition': cond}],
+            )
+
+        result = list(
+            base_parser._iter_rows(list(range(50)), render, parsed_args)
+        )
+        assert [item['out_file'] for item in result] == [
+            '%s.txt' % i for i in range(50) if i % 4
+        ]
+        for item in result:
+            assert item['text'].cmdargs is parsed_args
+            assert item['wiki_page'][0]['condition'] is item['text']
+
+    @pytest.mark.parametrize('jobs', [1, 3])
+    def test_iter_rows_incremental(self, tmpdir, jobs):
+        base_parser = parser.BaseParser.__new__(parser.BaseParser)
+        reader = SimpleNamespace(file_name='Test.dat')
+        rows = []
+        for rowid in range(10):
+            row = DatRecord(reader, rowid)
+            row.append(rowid)
+            rows.append(row)
+
+        def render(row, result):
+            result.add_result(text=str(row[0]), out_file='%s.txt' % row[0])
+
+        path = str(tmpdir.join('test.json'))
+        store = FingerprintStore(path, targets=['write'])
+        parsed_args = Namespace(
+            jobs=jobs, func=lambda: None, fingerprint_store=store,
+        )
+        result = list(base_parser._iter_rows(rows, render, parsed_args))
+        assert len(result) == 10
+        assert result[3]['fingerprint_key'] == 'Test.dat:3'
+        store.update(result, 'write')
+        store.save()
+
+        rows[3][0] = 'changed'
+        parsed_args.fingerprint_store = FingerprintStore(
+            path, targets=['write']
+        )
+        result = list(base_parser._iter_rows(rows, render, parsed_args))
+        assert [item['text'] for item in result] == ['changed']
+
 
 class TestTagHandler:
     def test_handlers(self, tag_handler_obj, divination_card_texts):
@@ -250,6 +335,18 @@ def test_interwiki_linker(string, result):
     assert parser.make_inter_wiki_links(string) == result
 
 
+@pytest.mark.parametrize('pattern,result', (
+    ('Accuracy Rating', {'Accuracy Rating'}),
+    ('Shock(?:|s|ed)', {'Shock', 'Shocks', 'Shocked'}),
+    ('Staff|Staves', {'Staff', 'Staves'}),
+    ('(?:level [0-9]+) Stun', {'level \0 Stun'}),
+    ("Assassin\\'s Mark", {"Assassin's Mark"}),
+    ('Stun?', None),
+))
+def test_expand_pattern(pattern, result):
+    assert parser._expand_pattern(pattern) == result
+
+
 @pytest.mark.parametrize('string,template,texts,args,kwargs', ftdata)
 def test_find_template(string, template, texts, args, kwargs):
     result = parser.find_template(string, template)
@@ -174,4 +174,22 @@ class TestKeyValuesFileCache(object):
         kf = kf_cache.get_file(_read_file_name)
         assert kf is kf_cache.get_file(_read_file_name)
 
+    @pytest.mark.parametrize('section,key,value', TestKeyValuesFile.data)
+    def test_cache_read_keyvalues(self, kf_cache, section, key, value):
+        assert kf_cache.get_file(_read_file_name)[section][key] == value
 
+    def test_cache_extends(self, kf_cache):
+        kf_cache.get_file(_read_file_name)
+        base = kf_cache.files['keyvalues_base.kv']
+        assert base['Append']['key'] == [1, ], \
+            'Merging should not modify the cached parent file'
+
+    def test_copy(self, kf_cache):
+        kf = kf_cache.get_file(_read_file_name)
+        kf_copy = kf.copy()
+        assert kf_copy == kf
+
+        kf_copy['Append']['key'] = 4
+        kf_copy['Hash']['key'] = 4
+        assert kf['Append']['key'] == [1, 2, 3]
+        assert list(kf['Hash']['key']) == [1, 2, 3]
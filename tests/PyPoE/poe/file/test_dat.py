@@ -363,6 +363,59 @@ def test_dat_file(testspec_dat_file):
         assert row['ref|ref|ref|int'] == 0x1337, 'Value mismatch - nested pointers'
 
 
+class TestLazyRead:
+    ROWS = 600
+
+    @pytest.fixture(scope='class')
+    def raw(self, testspec_dat_file):
+        # Repeat the single row, the pointers into the data section stay valid
+        data_offset = testspec_dat_file.find(dat.DAT_FILE_MAGIC_NUMBER)
+        return b''.join((
+            struct.pack('<I', self.ROWS),
+            testspec_dat_file[4:data_offset] * self.ROWS,
+            testspec_dat_file[data_offset:],
+        ))
+
+    def _read(self, raw, lazy):
+        df = dat.DatFile('TestSpec.dat')
+        return df.read(raw, specification=test_load(), lazy=lazy)
+
+    def test_window(self, raw):
+        reader = self._read(raw, lazy=True)
+        table_data = reader.table_data
+
+        assert isinstance(table_data, dat.LazyTableData)
+        assert len(table_data) == self.ROWS
+        assert table_data.loaded == 0
+
+        row = table_data[300]
+        assert row.rowid == 300
+        assert row['ref|ref|ref|int'] == 0x1337
+        assert table_data.loaded == table_data.WINDOW_SIZE
+        assert table_data[-1].rowid == self.ROWS - 1
+        assert not table_data.is_loaded
+        assert reader.data_parsed == []
+
+    def test_load_all(self, raw):
+        eager = self._read(raw, lazy=False)
+        reader = self._read(raw, lazy=True)
+        reader.table_data[-1]
+        reader.table_data.load_all()
+
+        assert reader.table_data.is_loaded
+        assert [row['ref|string'] for row in reader] == \
+            [row['ref|string'] for row in eager]
+        assert [v.data_start_offset for v in reader.data_parsed] == \
+            [v.data_start_offset for v in eager.data_parsed]
+
+    def test_load_all_cancelled(self, raw):
+        reader = self._read(raw, lazy=True)
+
+        assert not reader.table_data.load_all(cancelled=lambda: True)
+        assert reader.table_data.loaded == 0
+        assert reader.data_parsed == []
+
+
 class TestSpecificationErrors:
     errors = (
         (
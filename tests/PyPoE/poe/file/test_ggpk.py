@@ -35,6 +35,8 @@ See PyPoE/LICENSE
 
 # Python
 import os
+import struct
+import hashlib
 from tempfile import TemporaryDirectory
 
 # 3rd Party
@@ -51,6 +53,79 @@ DDS_UNCOMPRESSED = 'Art/Textures/Characters/Adventurer/' \
                    'adventurerPalid_colour.dds'
 DDS_COMPRESSED = 'Art/2DArt/BuffIcons/AssassinsMark.dds'
 
+
+def build_ggpk(tree):
+    """
+    Builds a minimal GGPK file from a dict of names to either file contents or
+    sub-directory dicts.
+
+    Returns the raw bytes and a dict of paths to the offsets of the FILE
+    records' data.
+    """
+    data = bytearray(struct.pack('<i4si', 28, b'GGPK', 2) + b'\x00' * 16)
+    data_offsets = {}
+
+    def encode_name(name):
+        return (name + '\x00').encode('UTF-16_LE'), len(name) + 1
+
+    def add(name, value, path):
+        offset = len(data)
+        raw_name, name_length = encode_name(name)
+        if isinstance(value, dict):
+            entries = []
+            for child_name, child_value in value.items():
+                entries.append(add(
+                    child_name, child_value, path + child_name + '/'
+                ))
+            digest = hashlib.sha256(b''.join(
+                h for _, h in entries
+            )).digest()
+            offset = len(data)
+            data.extend(struct.pack(
+                '<i4sii',
+                48 + name_length * 2 + 12 * len(entries),
+                b'PDIR',
+                name_length,
+                len(entries),
+            ))
+            data.extend(digest)
+            data.extend(raw_name)
+            for entry_offset, _ in entries:
+                data.extend(struct.pack('<Iq', 0, entry_offset))
+        else:
+            digest = hashlib.sha256(value).digest()
+            data.extend(struct.pack(
+                '<i4si', 44 + name_length * 2 + len(value), b'FILE',
+                name_length,
+            ))
+            data.extend(digest)
+            data.extend(raw_name)
+            data_offsets[path.rstrip('/')] = len(data)
+            data.extend(value)
+        return offset, digest
+
+    root_offset, _ = add('', tree, '')
+    free_offset = len(data)
+    data.extend(struct.pack('<i4sq', 16, b'FREE', 0))
+    data[12:28] = struct.pack('<qq', root_offset, free_offset)
+
+    return bytes(data), data_offsets
+
+
+GGPK_TREE = {
+    'Data': {
+        'Mods.dat': b'mods' * 100,
+        'Stats.dat': b'stats',
+        'Empty.dat': b'',
+    },
+    'Metadata': {
+        'Items': {
+            'Item.ot': b'version 2',
+        },
+    },
+    'README.txt': b'readme',
+}
+
 # =============================================================================
 # Tests
 # =============================================================================
@@ -62,6 +137,200 @@ class TestGGPKFile():
         assert ggpkfile.is_parsed == True
 
 
+class TestGGPKVerify():
+    def _read(self, raw):
+        ggpk_file = ggpk.GGPKFile()
+        ggpk_file.read(raw)
+        ggpk_file.directory_build()
+        return ggpk_file
+
+    def test_valid(self):
+        raw, _ = build_ggpk(GGPK_TREE)
+        result = self._read(raw).verify()
+        assert result.is_valid
+        assert result.files == 5
+        assert result.directories == 4
+        assert result.size == 400 + 5 + 9 + 6
+
+    def test_corrupted(self):
+        raw, offsets = build_ggpk(GGPK_TREE)
+        raw = bytearray(raw)
+        raw[offsets['Data/Stats.dat']] ^= 0xFF
+        ggpk_file = self._read(bytes(raw))
+
+        result = ggpk_file.verify()
+        assert not result.is_valid
+        assert result.corrupted_files == ['Data/Stats.dat']
+        assert result.corrupted_directories == []
+
+        assert ggpk_file.verify('Metadata').is_valid
+
+    def test_corrupted_directory(self):
+        raw, _ = build_ggpk(GGPK_TREE)
+        ggpk_file = self._read(raw)
+        ggpk_file['Data/Mods.dat'].record.hash ^= 1
+
+        result = ggpk_file.verify()
+        assert result.corrupted_files == ['Data/Mods.dat']
+        assert result.corrupted_directories == ['Data']
+
+        result = ggpk_file.verify(verify_directories=False)
+        assert result.corrupted_directories == []
+        assert result.directories == 0
+
+    @pytest.mark.parametrize('processes', [1, 2])
+    def test_file_path(self, processes):
+        raw, offsets = build_ggpk(GGPK_TREE)
+        raw = bytearray(raw)
+        raw[offsets['Data/Mods.dat'] + 10] ^= 0xFF
+        with TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'Content.ggpk')
+            with open(path, 'wb') as f:
+                f.write(raw)
+            result = self._read(path).verify(
+                processes=processes, chunk_size=16,
+            )
+        assert result.corrupted_files == ['Data/Mods.dat']
+
+    def test_not_build(self):
+        ggpk_file = ggpk.GGPKFile()
+        ggpk_file.read(build_ggpk(GGPK_TREE)[0])
+        with pytest.raises(ValueError):
+            ggpk_file.verify()
+
+
+class TestGGPKProgress():
+    def test_read(self):
+        raw = build_ggpk(GGPK_TREE)[0]
+        calls = []
+        ggpk_file = ggpk.GGPKFile()
+        ggpk_file.read(
+            raw, progress=lambda *args: calls.append(args), progress_step=64
+        )
+
+        assert len(calls) > 2
+        assert calls[-1] == (len(raw), len(raw))
+        done = [c[0] for c in calls]
+        assert done == sorted(done)
+        assert all(b - a >= 64 for a, b in zip(done, done[1:-1]))
+
+    def test_read_interval(self):
+        raw = build_ggpk(GGPK_TREE)[0]
+        calls = []
+        ggpk_file = ggpk.GGPKFile()
+        ggpk_file.read(
+            raw,
+            progress=lambda *args: calls.append(args),
+            progress_step=1,
+            progress_interval=3600,
+        )
+
+        # Only the final call is made
+        assert calls == [(len(raw), len(raw))]
+
+    def test_directory_build(self):
+        calls = []
+        ggpk_file = ggpk.GGPKFile()
+        ggpk_file.read(build_ggpk(GGPK_TREE)[0])
+        ggpk_file.directory_build(
+            progress=lambda *args: calls.append(args), progress_step=3
+        )
+
+        assert calls == [(3, 8), (6, 8), (8, 8)]
+
+    def test_directory_build_orphans(self):
+        calls = []
+        ggpk_file = ggpk.GGPKFile()
+        ggpk_file.read(build_ggpk(GGPK_TREE)[0])
+        ggpk_file.directory_build()
+        # Make one of the file records unreachable
+        ggpk_file['Data'].record.entries.pop()
+
+        ggpk_file.directory_build(
+            progress=lambda *args: calls.append(args), progress_step=3
+        )
+
+        assert calls == [(3, 8), (6, 8), (7, 7)]
+
+    def test_directory_build_subtree(self):
+        calls = []
+        ggpk_file = ggpk.GGPKFile()
+        ggpk_file.read(build_ggpk(GGPK_TREE)[0])
+        ggpk_file.directory_build()
+        node = ggpk_file['Metadata']
+        node.children = []
+        ggpk_file.directory_build(
+            parent=node, progress=lambda *args: calls.append(args)
+        )
+
+        assert calls == [(2, None)]
+        assert ggpk_file['Metadata/Items/Item.ot'].record.name == 'Item.ot'
+
+
+class TestDDSResolver():
+    tree = {
+        'Art': {
+            'a.dds': b'DDS ' + b'a' * 100,
+            'b.dds': b'DDS ' + b'b' * 200,
+            'ref.dds': b'*Art/a.dds',
+            'ref2.dds': b'*Art/ref.dds',
+            'loop.dds': b'*Art/loop.dds',
+            'missing.dds': b'*Art/does_not_exist.dds',
+        },
+    }
+
+    @pytest.fixture
+    def ggpk_file(self):
+        ggpk_file = ggpk.GGPKFile()
+        ggpk_file.read(build_ggpk(self.tree)[0])
+        ggpk_file.directory_build()
+        return ggpk_file
+
+    def test_resolve(self, ggpk_file):
+        resolver = ggpk_file.dds_resolver
+        record = ggpk_file['Art/a.dds'].record
+        assert resolver.resolve('Art/ref2.dds') is record
+        # The whole chain is memoized
+        assert resolver._records['Art/ref.dds'] is record
+
+        with pytest.raises(ggpk.ParserError):
+            resolver.resolve('Art/loop.dds')
+        with pytest.raises(FileNotFoundError):
+            resolver.resolve('Art/missing.dds')
+
+    def test_get(self, ggpk_file):
+        assert ggpk_file.get_dds('Art/ref2.dds') == self.tree['Art']['a.dds']
+        assert ggpk_file.get_dds('Art/a.dds') == self.tree['Art']['a.dds']
+        assert len(ggpk_file.dds_resolver._cache) == 1
+
+    def test_extract_dds(self, ggpk_file):
+        pytest.importorskip('brotli')
+        assert ggpk.extract_dds(b'*Art/ref.dds', path_or_ggpk=ggpk_file) == \
+            self.tree['Art']['a.dds']
+        assert len(ggpk_file.dds_resolver._cache) == 1
+
+    def test_cache_size(self, ggpk_file):
+        resolver = ggpk.DDSResolver(ggpk_file, max_size=250)
+        resolver.get('Art/a.dds')
+        resolver.get('Art/b.dds')
+        # a is evicted to stay within the size limit
+        assert list(resolver._cache) == [
+            ggpk_file['Art/b.dds'].record.offset
+        ]
+        assert resolver._size == 204
+
+    def test_get_many(self, ggpk_file):
+        result = ggpk_file.get_dds_many([
+            'Art/a.dds', 'Art/ref.dds', 'Art/b.dds', 'Art/missing.dds',
+        ], workers=2)
+        assert list(result) == [
+            'Art/a.dds', 'Art/ref.dds', 'Art/b.dds', 'Art/missing.dds',
+        ]
+        assert result['Art/ref.dds'] is result['Art/a.dds']
+        assert result['Art/b.dds'] == self.tree['Art']['b.dds']
+        assert isinstance(result['Art/missing.dds'], FileNotFoundError)
+
+
 # These tests will raise errors if something is wrong, like decompression
 # errors
 class TestDDSExtract():
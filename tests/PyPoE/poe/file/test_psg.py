@@ -30,6 +30,8 @@ See PyPoE/LICENSE
 # =============================================================================
 
 # Python
+import struct
+
 from PyPoE.poe.file import psg
 from PyPoE.poe.file.dat import DatFile
 
@@ -42,10 +44,37 @@ import pytest
 # Setup
 # =============================================================================
 
+
+def build_psg(root_passives, groups):
+    data = struct.pack('<BB', 0, 0)
+    data += struct.pack('<I', len(root_passives))
+    data += struct.pack('<' + 'I'*len(root_passives), *root_passives)
+    data += struct.pack('<I', len(groups))
+    for nodes in groups:
+        data += struct.pack('<ffI', 0, 0, len(nodes))
+        for rowid, connections in nodes:
+            data += struct.pack('<IIII', rowid, 0, 0, len(connections))
+            data += struct.pack('<' + 'I'*len(connections), *connections)
+    return data
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
+
+@pytest.fixture
+def graph():
+    f = psg.PSGFile()
+    # 1 - 2 - 3 - 4
+    #         |
+    #   5 -  10
+    f.read(build_psg([1, 10], [
+        [(1, [2]), (2, [3])],
+        [(3, [4]), (4, []), (10, [3])],
+        [(5, [10]), (6, [99])],
+    ]))
+    return f.get_graph()
+
 # =============================================================================
 # Tests
 # =============================================================================
@@ -53,4 +82,41 @@ import pytest
 
 def test_psg(ggpkfile, rr):
     f = psg.PSGFile(passive_skills_dat_file=rr)
-    f.read(ggpkfile['Metadata/PassiveSkillGraph.psg'].record.extract())
\ No newline at end of file
+    f.read(ggpkfile['Metadata/PassiveSkillGraph.psg'].record.extract())
+
+
+class TestPassiveSkillGraph(object):
+    def test_structure(self, graph):
+        assert len(graph) == 7
+        assert 99 not in graph
+        assert graph.neighbours(3) == [2, 4, 10]
+        assert graph.neighbours(6) == []
+        with pytest.raises(KeyError):
+            graph.neighbours(99)
+
+    def test_distances(self, graph):
+        assert graph.distances(1, [1, 2, 3, 4, 10, 5, 6]) == [
+            0, 1, 2, 3, 3, None, None
+        ]
+        assert graph.distance(10, 5) == 1
+        assert graph.distance(10, 1) == 3
+        assert graph.distance(2, 10) == 2
+
+    def test_shortest_path(self, graph):
+        assert graph.shortest_path(1, 4) == [1, 2, 3, 4]
+        assert graph.shortest_paths(10, [4, 5, 6]) == [
+            [10, 3, 4], [10, 5], None
+        ]
+        # can't pass through the other root
+        assert graph.shortest_path(1, 5) is None
+
+    def test_reachable(self, graph):
+        assert graph.reachable([1]) == {1, 2, 3, 4, 10}
+        assert graph.reachable([1], max_distance=2) == {1, 2, 3}
+        assert graph.reachable([1, 10]) == {1, 2, 3, 4, 5, 10}
+
+    def test_points_to_allocate(self, graph):
+        assert graph.points_to_allocate([1], [4, 2]) == [2, 3, 4]
+        assert graph.points_to_allocate([1, 2], [4]) == [3, 4]
+        assert graph.points_to_allocate([1], [1]) == []
+        assert graph.points_to_allocate([1], [5]) is None
@@ -143,6 +143,56 @@ class TestTranslationFileCache:
         assert tcache['descriptions_extended.txt'] is a, \
             'Cache should return identical object'
 
+    def test_disk_cache(self, tmpdir, dextended):
+        cache_dir = str(tmpdir)
+        tc = translations.TranslationFileCache(
+            path_or_ggpk=data_dir, disk_cache_dir=cache_dir)
+        assert tc['descriptions_extended.txt'] == dextended, \
+            'Files should be identical'
+
+        tc = translations.TranslationFileCache(
+            path_or_ggpk=data_dir, disk_cache_dir=cache_dir)
+        tf = tc['descriptions_extended.txt']
+        assert tf == dextended, 'Cached file should be identical'
+        assert 'Metadata/StatDescriptions/descriptions_base.txt' not in \
+            tc.files, 'Included file should not have been parsed again'
+        assert list(tc._dependencies[
+            'Metadata/StatDescriptions/descriptions_extended.txt'
+        ]) == [
+            'Metadata/StatDescriptions/descriptions_extended.txt',
+            'Metadata/StatDescriptions/descriptions_base.txt',
+        ], 'Included files should be tracked as dependencies'
+
+    def test_disk_cache_custom_file(self, tmpdir):
+        cache_dir = str(tmpdir)
+        tc = translations.TranslationFileCache(
+            path_or_ggpk=data_dir, disk_cache_dir=cache_dir)
+        tf = tc['descriptions_base.txt']
+
+        tc = translations.TranslationFileCache(
+            path_or_ggpk=data_dir, disk_cache_dir=cache_dir,
+            merge_with_custom_file=True)
+        assert tc['descriptions_base.txt'] != tf, \
+            'Changed custom file should invalidate the cache'
+
+    @pytest.mark.parametrize('disk_cache', (False, True))
+    def test_get_source_hashes(self, tmpdir, disk_cache):
+        tc = translations.TranslationFileCache(
+            path_or_ggpk=data_dir,
+            disk_cache_dir=str(tmpdir) if disk_cache else None,
+        )
+        hashes = tc.get_source_hashes(
+            'Metadata/StatDescriptions/descriptions_extended.txt'
+        )
+        assert list(hashes) == [
+            'Metadata/StatDescriptions/descriptions_extended.txt',
+            'Metadata/StatDescriptions/descriptions_base.txt',
+        ], 'Included files should be part of the sources'
+        assert hashes['Metadata/StatDescriptions/descriptions_base.txt'] == \
+            tc.get_source_hashes(
+                'Metadata/StatDescriptions/descriptions_base.txt'
+            )['Metadata/StatDescriptions/descriptions_base.txt']
+
 
 class TestTranslationResults:
     #
@@ -354,6 +404,45 @@ class TestTranslationResults:
     def test_read_with_include(self, dextended):
         pass
 
+    def test_merge_replaces_identical_ids(self, dbase):
+        tf = translations.TranslationFile()
+        tf.merge(dbase)
+        old = dbase.translations_hash['test_multiple_values'][0]
+        other = translations.TranslationFile()
+        new = translations.Translation()
+        new.ids = list(old.ids)
+        other.translations.append(new)
+        for translation_id in new.ids:
+            other.translations_hash[translation_id] = [new, ]
+
+        tf.merge(other)
+
+        assert len(tf.translations) == len(dbase.translations), \
+            'Translations with identical ids should be replaced'
+        assert old not in tf.translations, 'Old translation should be removed'
+        assert tf.translations[-1] is new
+        for translation_id in new.ids:
+            assert tf.translations_hash[translation_id] == [new, ]
+
+    def test_merge_summary_warning(self, dbase):
+        tf = translations.TranslationFile()
+        tf.merge(dbase)
+        other = translations.TranslationFile()
+        tr = dbase.translations_hash['test_multiple_values'][0]
+        dupe = translations.Translation()
+        dupe.ids = ['test_multiple_values', 'test_merge_unique_id']
+        dupe.languages = tr.languages
+        other.translations.append(dupe)
+        for translation_id in dupe.ids:
+            other.translations_hash[translation_id] = [dupe, ]
+
+        with pytest.warns(translations.DuplicateIdentifierWarning) as record:
+            tf.merge(other, summary_warning=True)
+
+        assert len(record) == 1, 'Only a single warning should be emitted'
+        assert 'test_multiple_values' in str(record[0].message)
+        assert tf.translations_hash['test_multiple_values'][-1] is dupe
+
     @pytest.mark.parametrize('tags,values,result', test_data)
     def test_get_translation_simple(self, dbase, tags, values, result):
         assert dbase.get_translation(tags, values)[0] == result
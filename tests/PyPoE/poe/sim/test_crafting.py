@@ -0,0 +1,144 @@
+"""
+Tests for PyPoE.poe.sim.crafting
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/poe/sim/test_crafting.py                             |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+
+# 3rd-party
+import pytest
+
+# self
+from PyPoE.poe.file.dat import DatRecord
+from PyPoE.poe.sim import mods
+
+np = pytest.importorskip('numpy')
+crafting = pytest.importorskip('PyPoE.poe.sim.crafting')
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+
+class DatRecordOverride(DatRecord):
+    keys = {
+        'Id': '',
+        'CorrectGroup': '',
+        'TagsKeys': [],
+        'SpawnWeight_TagsKeys': [{'Id': 'default'}],
+        'SpawnWeight_Values': [1000],
+    }
+
+    def __init__(self, **kwargs):
+
+        self.data = {}
+
+        self.data.update(self.keys)
+        self.data.update(kwargs)
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+
+mod_list = [
+    DatRecordOverride(Id='0', CorrectGroup='A'),
+    DatRecordOverride(Id='1', CorrectGroup='A'),
+    DatRecordOverride(Id='2', CorrectGroup='B', TagsKeys=[{'Id': 'half'}]),
+    DatRecordOverride(
+        Id='3',
+        CorrectGroup='C',
+        SpawnWeight_TagsKeys=[
+            {'Id': 'half'},
+            {'Id': 'default'},
+        ],
+        SpawnWeight_Values=[
+            500,
+            3000,
+        ]
+    ),
+]
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def simulator():
+    return crafting.CraftingSimulator(mod_list, ['default'])
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestCraftingSimulator(object):
+    def test_first_roll(self, simulator):
+        result = simulator.simulate(1, simulations=20000, seed=1)
+        scc = mods.SpawnChanceCalculator(mod_list, ['default'])
+        for mod_id, chance in result.mod_chances().items():
+            assert chance == pytest.approx(
+                scc.spawn_chance(mod_id, remove=False), abs=0.02
+            )
+
+    def test_group_exclusion(self, simulator):
+        result = simulator.simulate(3, simulations=5000, seed=1)
+        assert result.chance(['0', '1']) == 0
+        assert result.hit_distribution(['0', '1'])[1] == 1
+        assert (result.rolls >= 0).all()
+
+    def test_tag_addition(self, simulator):
+        # Rolling mod 2 first lowers the weight of mod 3 from 3000 to 500
+        result = simulator.simulate(2, simulations=20000, seed=1)
+        rolled_2 = result.rolls[:, 0] == 2
+        second = result.rolls[rolled_2, 1]
+        assert np.count_nonzero(second == 3)/second.size == pytest.approx(
+            500/2500, abs=0.03
+        )
+
+    def test_exhausted(self, simulator):
+        result = simulator.simulate(4, simulations=100, seed=1)
+        assert (result.rolls[:, 3] == -1).all()
+        assert result.chance(['0', '1'], require_all=False) == 1
+
+    def test_seed(self, simulator):
+        a = simulator.simulate(2, simulations=1000, batch_size=300, seed=5)
+        b = simulator.simulate(2, simulations=1000, batch_size=300, seed=5)
+        assert (a.rolls == b.rolls).all()
+
+    def test_invalid_mod(self, simulator):
+        result = simulator.simulate(1, simulations=10, seed=1)
+        with pytest.raises(ValueError):
+            result.chance(['does_not_exist'])
+
+    def test_no_mods(self, simulator):
+        result = simulator.simulate(1, simulations=10, seed=1)
+        assert result.chance([]) == 1
+        assert result.chance([], require_all=False) == 0
+        assert result.hit_distribution([]).tolist() == [1]
@@ -203,4 +203,65 @@ for gem in gems:
 
     A = numpy.vstack([x, numpy.ones(len(x))]).T
     for y0 in y:
-        print(gem, numpy.linalg.lstsq(A, y0)[0])'''
\ No newline at end of file
+        print(gem, numpy.linalg.lstsq(A, y0)[0])'''
+
+
+@pytest.fixture
+def numpy_module():
+    return pytest.importorskip('numpy')
+
+
+def test_stat_requirement_array(numpy_module):
+    for gtype in formula.GemTypes:
+        for multi in (40, 60, 100):
+            levels = numpy_module.arange(1, 101)
+            result = formula.gem_stat_requirement_array(levels, gtype, multi)
+            assert result.tolist() == [
+                formula.gem_stat_requirement(level, gtype, multi)
+                for level in range(1, 101)
+            ]
+
+
+def test_stat_requirement_array_broadcast(numpy_module):
+    levels = [row[0] for row in cmp_tests]
+    multis = [row[2] for row in cmp_tests]
+    for gtype in formula.GemTypes:
+        result = formula.gem_stat_requirement_array(
+            numpy_module.array(levels)[:, None],
+            gtype,
+            numpy_module.array(multis)[None, :],
+        )
+        assert result.shape == (len(levels), len(multis))
+        for i, level in enumerate(levels):
+            for j, multi in enumerate(multis):
+                assert result[i, j] == formula.gem_stat_requirement(
+                    level, gtype, multi
+                )
+
+
+def test_stat_requirement_array_invalid(numpy_module):
+    with pytest.raises(ValueError):
+        formula.gem_stat_requirement_array([1, 2], 5, 100)
+    with pytest.raises(ValueError):
+        formula.gem_stat_requirement_array(
+            [1, 2], formula.GemTypes.active, [100, -1]
+        )
+
+
+def test_armour_and_evasion_array(numpy_module):
+    a = numpy_module.arange(0, 2000, 7)[:, None]
+    b = numpy_module.arange(1, 500, 3)[None, :]
+    reduction = formula.armour_damage_reduction_array(a, b)
+    hit = formula.chance_to_hit_array(b, a)
+    evade = formula.chance_to_evade_array(b, a)
+    for i in range(0, a.shape[0], 13):
+        for j in range(0, b.shape[1], 11):
+            x = int(a[i, 0])
+            y = int(b[0, j])
+            assert reduction[i, j] == formula.armour_damage_reduction(x, y)
+            assert hit[i, j] == pytest.approx(
+                formula.chance_to_hit(y, x), rel=1e-12
+            )
+            assert evade[i, j] == pytest.approx(
+                formula.chance_to_evade(y, x), rel=1e-12
+            )
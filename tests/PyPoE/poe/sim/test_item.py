@@ -42,6 +42,7 @@ ItemParser
 # =============================================================================
 
 # Python
+import io
 
 # 3rd-party
 import pytest
@@ -619,4 +620,22 @@ Right click this item then left click a head slot item to apply it.''',
         i = item.ItemParser(string)
         for k, v in tests.items():
             val = getattr(i, k)
-            assert val == v, '%s: %s vs %s' % (k, val, v)
\ No newline at end of file
+            assert val == v, '%s: %s vs %s' % (k, val, v)
+
+    def test_parse_items(self):
+        records = list(item.parse_items([string for string, _ in self.data]))
+        assert len(records) == len(self.data)
+        for record, (string, tests) in zip(records, self.data):
+            assert not hasattr(record, '__dict__')
+            for k, v in tests.items():
+                val = getattr(record, k)
+                assert val == v, '%s: %s vs %s' % (k, val, v)
+
+    def test_parse_items_stream(self):
+        stream = io.StringIO('\n\n'.join([string for string, _ in self.data]))
+        records = list(item.parse_items(stream))
+        assert len(records) == len(self.data)
+        for record, (string, tests) in zip(records, self.data):
+            parser = item.ItemParser(string)
+            for k in tests:
+                assert getattr(record, k) == getattr(parser, k)
@@ -41,7 +41,7 @@ import pytest
 
 # self
 from PyPoE.poe.constants import MOD_DOMAIN, MOD_GENERATION_TYPE
-from PyPoE.poe.file.dat import DatRecord
+from PyPoE.poe.file.dat import DatReader, DatRecord
 from PyPoE.poe.sim import mods
 
 # =============================================================================
@@ -90,6 +90,13 @@ class TestGetModFromId:
         assert self.mod_list[0] == mods.get_mod_from_id('0', self.mod_list)
         assert None == mods.get_mod_from_id('does_not_exist', self.mod_list)
 
+    def test_dat_reader(self):
+        reader = DatReader('Mods.dat')
+        reader.table_data = self.mod_list
+        assert self.mod_list[0] is mods.get_mod_from_id('0', reader)
+        assert 'Id' in reader.index
+        assert None == mods.get_mod_from_id('does_not_exist', reader)
+
 
 class TestGetSpawnChanceCalculator(object):
     mod_list = [
@@ -157,6 +164,35 @@ class TestGetSpawnChanceCalculator(object):
         assert 1000/5000 == scc['default'].spawn_chance('0', remove=True)
         assert 1000/2000 == scc['default'].spawn_chance('3', remove=True)
         assert 0 == scc['default'].spawn_chance('0', remove=False)
+        assert [] == scc['default'].mod_list
+
+    def test_get_mod(self, scc):
+        assert self.mod_list[4] is scc['default'].get_mod('4')
+        scc['default'].spawn_chance('3')
+        assert None is scc['default'].get_mod('4')
+        assert None is scc['default'].get_mod('does_not_exist')
+
+    def test_spawn_chance_remove_tags(self):
+        mod_list = self.mod_list + [
+            DatRecordOverride(
+                Id='5',
+                CorrectGroup='C',
+                TagsKeys=[{'Id': 'half'}],
+            ),
+        ]
+        scc = mods.SpawnChanceCalculator(mod_list, tags=['default'])
+        assert 1000/6000 == scc.spawn_chance('5', remove=True)
+        assert ['default', 'half'] == scc.tags
+        assert 4500 == scc.total_spawn_weight
+        assert 4500 == scc.get_total_spawn_weight()
+        assert 500/4500 == scc.spawn_chance('4', remove=False)
+
+    def test_add_tag(self, scc):
+        scc['default'].add_tag('half')
+        assert 4500 == scc['default'].total_spawn_weight
+        scc['default'].add_tag('nope')
+        assert 4000 == scc['default'].total_spawn_weight
+        assert 4000 == scc['default'].get_total_spawn_weight()
 
 
 class TestGetSpawnWeight(object):
@@ -250,4 +286,102 @@ class TestGenerateSpawnableModList(object):
             domain=MOD_DOMAIN.AREA,
             generation_type=MOD_GENERATION_TYPE.PREFIX,
             tags=['different'],
-        ), 'Should have found only one match'
\ No newline at end of file
+        ), 'Should have found only one match'
+
+
+class TestSpawnableModTable(object):
+    mod_list = [
+        DatRecordOverride(
+            Id='0',
+            Level=20,
+            Domain=MOD_DOMAIN.ITEM.value,
+            GenerationType=MOD_GENERATION_TYPE.PREFIX.value,
+        ),
+        DatRecordOverride(
+            Id='1',
+            Level=1,
+            Domain=MOD_DOMAIN.ITEM.value,
+            GenerationType=MOD_GENERATION_TYPE.PREFIX.value,
+        ),
+        DatRecordOverride(
+            Id='2',
+            Level=1,
+            Domain=MOD_DOMAIN.ITEM.value,
+            GenerationType=MOD_GENERATION_TYPE.SUFFIX.value,
+        ),
+        DatRecordOverride(
+            Id='3',
+            Level=1,
+            Domain=MOD_DOMAIN.ITEM.value,
+            GenerationType=MOD_GENERATION_TYPE.PREFIX.value,
+            SpawnWeight_TagsKeys=[{'Id': 'nope'}, {'Id': 'default'}],
+            SpawnWeight_Values=[0, 1000],
+        ),
+        DatRecordOverride(
+            Id='4',
+            Level=10,
+            Domain=MOD_DOMAIN.ITEM.value,
+            GenerationType=MOD_GENERATION_TYPE.PREFIX.value,
+            SpawnWeight_TagsKeys=[{'Id': 'different'}],
+        ),
+    ]
+
+    @pytest.fixture
+    def table(self):
+        return mods.SpawnableModTable(self.mod_list)
+
+    @pytest.mark.parametrize('level', [1, 10, 20, 100])
+    @pytest.mark.parametrize('tags', [
+        ['default'],
+        ['nope', 'default'],
+        ['different'],
+        ['different', 'default'],
+    ])
+    @pytest.mark.parametrize('generation_type', [
+        MOD_GENERATION_TYPE.PREFIX,
+        MOD_GENERATION_TYPE.SUFFIX,
+    ])
+    def test_generate_equivalence(self, table, level, tags, generation_type):
+        kwargs = {
+            'domain': MOD_DOMAIN.ITEM,
+            'generation_type': generation_type,
+            'level': level,
+            'tags': tags,
+        }
+        expected = sorted(
+            mods.generate_spawnable_mod_list(self.mod_list, **kwargs),
+            key=lambda mod: (mod['Level'], int(mod['Id'])),
+        )
+        assert [mod['Id'] for mod in expected] == [
+            mod['Id'] for mod in table.get_spawnable_mod_list(**kwargs)
+        ]
+
+    def test_level_order(self, table):
+        assert ['1', '3', '0'] == [
+            mod['Id'] for mod in table.get_spawnable_mod_list(
+                MOD_DOMAIN.ITEM, MOD_GENERATION_TYPE.PREFIX, level=50,
+            )
+        ]
+
+    def test_negative_weight(self):
+        mod_list = [
+            DatRecordOverride(
+                Id='0',
+                Domain=MOD_DOMAIN.ITEM.value,
+                GenerationType=MOD_GENERATION_TYPE.PREFIX.value,
+                SpawnWeight_Values=[-1],
+            ),
+        ]
+        kwargs = {
+            'domain': MOD_DOMAIN.ITEM,
+            'generation_type': MOD_GENERATION_TYPE.PREFIX,
+        }
+        assert mods.SpawnableModTable(mod_list).get_spawnable_mod_list(
+            **kwargs
+        ) == mods.generate_spawnable_mod_list(mod_list, **kwargs)
+
+    def test_invalid_arguments(self, table):
+        with pytest.raises(TypeError):
+            table.get_spawnable_mod_list(0, MOD_GENERATION_TYPE.PREFIX)
+        with pytest.raises(TypeError):
+            table.get_spawnable_mod_list(MOD_DOMAIN.ITEM, 0)
@@ -0,0 +1,160 @@
+"""
+Tests for PyPoE.poe.sim.monster
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/poe/sim/test_monster.py                              |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+from types import SimpleNamespace
+
+# 3rd-party
+import pytest
+
+# self
+from PyPoE.poe.file.dat import DatRecord, RelationalReader
+from PyPoE.poe.file.ot import OTFileCache
+from PyPoE.poe.sim import monster
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+
+class DatRecordOverride(DatRecord):
+    def __init__(self, rowid, **kwargs):
+        self.rowid = rowid
+        self.data = kwargs
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+
+granted_effects = [
+    DatRecordOverride(0, Id='Melee'),
+    DatRecordOverride(1, Id='Fireball'),
+    DatRecordOverride(2, Id='Unused'),
+]
+
+granted_effects_per_level = [
+    DatRecordOverride(
+        rowid, GrantedEffectsKey=granted_effects[ge], Level=level
+    ) for rowid, (ge, level) in enumerate([
+        (0, 1), (0, 2), (1, 1), (1, 5), (1, 20),
+    ])
+] + [
+    DatRecordOverride(5, GrantedEffectsKey=None, Level=1),
+]
+
+monster_varieties = [
+    DatRecordOverride(
+        rowid,
+        Id=metaid,
+        Name=name,
+        MonsterTypesKey={'MonsterResistancesKey': None},
+        GrantedEffectsKeys=ge,
+        ModsKeys=[],
+    ) for rowid, (metaid, name, ge) in enumerate([
+        ('Metadata/Monsters/Zombie', 'Zombie', [granted_effects[0]]),
+        ('Metadata/Monsters/Skeleton', 'Skeleton', [
+            granted_effects[0], granted_effects[1],
+        ]),
+        ('Metadata/Monsters/Totem', 'Totem', []),
+    ])
+]
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def factory():
+    rr = RelationalReader(path_or_ggpk='.')
+    for file_name, rows in (
+        ('DefaultMonsterStats.dat', []),
+        ('MonsterVarieties.dat', monster_varieties),
+        ('GrantedEffectsPerLevel.dat', granted_effects_per_level),
+        ('Mods.dat', []),
+    ):
+        rr.files['Data/' + file_name] = SimpleNamespace(reader=rows)
+
+    return monster.MonsterFactory(
+        relational_reader=rr,
+        otfile_cache=OTFileCache(path_or_ggpk='.'),
+    )
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestMonsterFactory(object):
+    def test_get_granted_effect_levels(self, factory):
+        levels = factory.get_granted_effect_levels(granted_effects[1])
+        assert sorted(levels) == [1, 5, 20]
+        assert levels[5] is granted_effects_per_level[3]
+
+        assert factory.get_granted_effect_levels(granted_effects[2]) == {}
+
+    @pytest.mark.parametrize('ge,level,rowid', (
+        (0, 1, 0),
+        (0, 2, 1),
+        (1, 20, 4),
+        (0, 3, None),
+        (1, 2, None),
+        (2, 1, None),
+    ))
+    def test_get_granted_effect_per_level(self, factory, ge, level, rowid):
+        gepl = factory.get_granted_effect_per_level(granted_effects[ge], level)
+        if rowid is None:
+            assert gepl is None
+        else:
+            assert gepl is granted_effects_per_level[rowid]
+
+    def test_monsters(self, factory):
+        monsters = factory.monsters()
+        assert [m._mv for m in monsters] == monster_varieties
+        assert [len(m._gepl) for m in monsters] == [2, 5, 0]
+
+        monsters = factory.monsters(monster_varieties[1:2])
+        assert len(monsters) == 1
+        assert monsters[0]._mv is monster_varieties[1]
+
+        assert factory.monsters([]) == []
+
+    def test_monster(self, factory):
+        monsters = factory.monster(name=['Zombie', 'Totem'])
+        assert [m._mv for m in monsters] == [
+            monster_varieties[0], monster_varieties[2],
+        ]
+
+        monsters = factory.monster(name='Skeleton')
+        assert [m._mv for m in monsters] == [monster_varieties[1]]
+
+        with pytest.raises(ValueError):
+            factory.monster()
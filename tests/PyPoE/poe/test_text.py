@@ -85,4 +85,16 @@ class TestTags():
         }
 
         tag = text.parse_description_tags(input)
-        assert tag.handle_tags(handlers=handlers) == output
\ No newline at end of file
+        assert tag.handle_tags(handlers=handlers) == output
+
+    def test_parsing_batch(self):
+        handlers = {
+            hid: partial(sample_parser, id=hid)
+            for row in self.sample_strings for hid in row[2]
+        }
+
+        tags = text.parse_description_tags_batch(
+            [row[0] for row in self.sample_strings]
+        )
+        assert [tag.handle_tags(handlers=handlers) for tag in tags] == \
+            [row[1] for row in self.sample_strings]
@@ -0,0 +1,112 @@
+"""
+Tests for PyPoE.shared.containers
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/shared/test_containers.py                            |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Tests for the special containers
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+
+# 3rd-party
+import pytest
+
+# self
+from PyPoE.shared import containers
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+
+class Node(object):
+    def __init__(self, name, parent=None, directory=False):
+        self.name = name
+        self.parent = parent
+        self.directory = directory
+        self.children = []
+        if parent is not None:
+            parent.children.append(self)
+
+
+def sort_key(node):
+    return not node.directory, node.name
+
+
+@pytest.fixture
+def tree():
+    root = Node('', directory=True)
+    art = Node('Art', root, directory=True)
+    for i in range(2500):
+        Node('f%04d' % (2499 - i), art)
+    Node('zdir', art, directory=True)
+    Node('Data', root, directory=True)
+    return root
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestLazyTreeIndex:
+    def test_fetch(self, tree):
+        index = containers.LazyTreeIndex(
+            lambda node: node.children, key=sort_key, fetch_size=1000,
+        )
+        art = tree.children[0]
+
+        # Views ask whether more rows can be fetched before the row count
+        assert index.can_fetch_more(art)
+        assert index.fetched(art) == 1000
+        assert index.children(art)[0].name == 'zdir'
+        assert index.children(art)[1].name == 'f0000'
+
+        assert index.next_fetch(art) == (1000, 1999)
+        assert index.fetch_more(art) == (1000, 1999)
+        assert index.fetch_more(art) == (2000, 2500)
+        assert index.fetch_more(art) is None
+        assert not index.can_fetch_more(art)
+        assert index.fetched(art) == 2501
+
+    def test_rows(self, tree):
+        index = containers.LazyTreeIndex(
+            lambda node: node.children, key=sort_key, fetch_size=10,
+        )
+        assert index.row(tree) == 0
+        children = index.children(tree)
+        assert [node.name for node in children] == ['Art', 'Data']
+        assert index.row(children[1]) == 1
+
+        art = children[0]
+        for row, node in enumerate(index.children(art)):
+            assert index.row(node) == row
+        assert index.row(index.children(art)[2000].parent) == 0
+
+    def test_unsorted(self, tree):
+        index = containers.LazyTreeIndex(lambda node: node.children)
+        assert index.children(tree) == tree.children
+        assert not index.can_fetch_more(tree.children[1])
+        assert index.next_fetch(tree.children[1]) is None
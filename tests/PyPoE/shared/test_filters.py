@@ -0,0 +1,132 @@
+"""
+Tests for PyPoE.shared.filters
+
+Overview
+===============================================================================
+
++----------+------------------------------------------------------------------+
+| Path     | tests/PyPoE/shared/test_filters.py                               |
++----------+------------------------------------------------------------------+
+| Version  | 1.0.0a0                                                          |
++----------+------------------------------------------------------------------+
+| Revision | $Id$                  |
++----------+------------------------------------------------------------------+
+| Author   | Omega_K2                                                         |
++----------+------------------------------------------------------------------+
+
+Description
+===============================================================================
+
+Tests for the table filters
+
+Agreement
+===============================================================================
+
+See PyPoE/LICENSE
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# Python
+import re
+
+# 3rd-party
+import pytest
+
+# self
+from PyPoE.shared import filters
+
+# =============================================================================
+# Setup
+# =============================================================================
+
+table = [
+    (i, 'Item%s' % i, i * 0.5, None if i % 7 == 0 else 'x' * (i % 5))
+    for i in range(1000)
+]
+
+
+def get_values(column, rows):
+    return [table[row][column] for row in rows]
+
+
+def accepts_row(row, filter_list):
+    # Per row evaluation as done by FilterProxyModel.filterAcceptsRow
+    for column, column_filters in filter_list:
+        for filter in column_filters:
+            if not filter.apply(table[row][column]):
+                return False
+    return True
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestFilters(object):
+    def test_regex(self):
+        f = filters.RegexFilter('item1', re.IGNORECASE)
+        assert f.apply_many(['Item1', 'Item10', 'Item2', 1, None]) == [
+            True, True, False, False, False,
+        ]
+
+    @pytest.mark.parametrize('operation,type,value,expected', (
+        ('lt', int, '3', [True, False, False, False]),
+        ('ge', float, '2.5', [False, True, True, False]),
+        ('eq', str, '4', [False, False, True, False]),
+    ))
+    def test_typed(self, operation, type, value, expected):
+        f = filters.TypedFilter(value, operation, type)
+        assert f.apply_many([1, 3, '4', 'x']) == expected
+
+    def test_typed_invalid(self):
+        with pytest.raises(TypeError):
+            filters.TypedFilter('1', 'eq', list)
+        with pytest.raises(ValueError):
+            filters.TypedFilter('1', 'is', int)
+
+
+class TestFilterRows(object):
+    @pytest.mark.parametrize('column_filters', (
+        [],
+        [(1, [filters.RegexFilter(r'Item[1-3]')])],
+        [(0, [filters.TypedFilter('100', 'ge', int)]),
+         (2, [filters.TypedFilter('400', 'lt', float)])],
+        [(1, [filters.RegexFilter(r'.*[34]$'),
+              filters.RegexFilter(r'Item\d\d\d')]),
+         (2, [filters.TypedFilter('10', 'gt', float)]),
+         (3, [filters.TypedFilter('xx', 'ge', str)])],
+        [(3, [filters.RegexFilter(r'None')])],
+        [(0, [filters.TypedFilter('-1', 'lt', int)])],
+    ))
+    @pytest.mark.parametrize('chunk_size', (1, 7, 4096))
+    def test_per_row(self, column_filters, chunk_size):
+        accepted = filters.filter_rows(
+            column_filters, len(table), get_values, chunk_size,
+        )
+        assert accepted == frozenset(
+            row for row in range(len(table))
+            if accepts_row(row, column_filters)
+        )
+
+    def test_cancelled(self):
+        calls = []
+
+        def cancelled():
+            calls.append(None)
+            return len(calls) > 2
+
+        accepted = filters.filter_rows(
+            [(1, [filters.RegexFilter('Item')])], len(table), get_values, 100,
+            cancelled,
+        )
+        assert accepted is None
+        assert len(calls) == 3
+
+    def test_not_cancelled(self):
+        accepted = filters.filter_rows(
+            [], len(table), get_values, 100, lambda: False,
+        )
+        assert accepted == frozenset(range(len(table)))
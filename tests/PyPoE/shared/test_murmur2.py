@@ -56,4 +56,26 @@ data = [
 
 @pytest.mark.parametrize('data,result,seed', data)
 def test_murmur2_32(data, result, seed):
-    assert murmur2.murmur2_32(data, seed) == result
\ No newline at end of file
+    assert murmur2.murmur2_32(data, seed) == result
+
+
+@pytest.mark.parametrize('seed', [0, 42, 0xFFFFFFFF])
+def test_murmur2_32_batch(seed):
+    byte_datas = [bytes(range(i % 256)) * (i // 256 + 1) for i in range(600)]
+    expected = [murmur2.murmur2_32(d, seed) for d in byte_datas]
+    assert murmur2.murmur2_32_batch(byte_datas, seed) == expected
+
+
+def test_murmur2_32_batch_data():
+    assert murmur2.murmur2_32_batch(
+        [d[0] for d in data[:1]] * 3, data[0][2]
+    ) == [data[0][1]] * 3
+    assert murmur2.murmur2_32_batch([]) == []
+
+
+def test_murmur2_32_batch_fallback(monkeypatch):
+    monkeypatch.setattr(murmur2, 'np', None)
+    byte_datas = [d for d, result, seed in data if seed == 0] + [b'', b'a']
+    assert murmur2.murmur2_32_batch(byte_datas) == [
+        murmur2.murmur2_32(d) for d in byte_datas
+    ]